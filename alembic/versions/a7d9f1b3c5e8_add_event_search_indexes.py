@@ -0,0 +1,48 @@
+"""Add trigram and full-text search indexes to events
+
+Revision ID: a7d9f1b3c5e8
+Revises: f1a3c5e7b9d0
+Create Date: 2025-09-06 16:05:42.871320
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7d9f1b3c5e8"
+down_revision = "f1a3c5e7b9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Trigram indexes make ILIKE '%term%' on title/location index scans
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_events_title_trgm ON events USING gin (title gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX ix_events_location_trgm ON events "
+        "USING gin (location gin_trgm_ops)"
+    )
+
+    # Full-text vector for the free-text search, title weighted over location
+    op.execute(
+        """
+        ALTER TABLE events ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', coalesce(location, '')), 'B')
+        ) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX ix_events_search_vector ON events USING gin (search_vector)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_events_search_vector")
+    op.execute("ALTER TABLE events DROP COLUMN IF EXISTS search_vector")
+    op.execute("DROP INDEX IF EXISTS ix_events_location_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_events_title_trgm")
@@ -0,0 +1,42 @@
+"""Reject overlapping sessions of an event with an exclusion constraint
+
+Revision ID: b2d4f6a8c0e1
+Revises: c4e6a8b0d2f3
+Create Date: 2025-09-08 10:14:27.503118
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b2d4f6a8c0e1"
+down_revision = "c4e6a8b0d2f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # btree_gist provides the GiST "=" operator class for event_id
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # Each active session is widened by half of the 15-minute buffer on both
+    # sides, so two slots overlap exactly when the sessions are closer than
+    # the buffer. The range expression must stay identical to SESSION_SLOT in
+    # session_repository.py so conflict lookups can use the GiST index.
+    # Existing overlapping sessions have to be fixed before upgrading.
+    op.execute(
+        """
+        ALTER TABLE sessions ADD CONSTRAINT ex_sessions_event_slot
+        EXCLUDE USING gist (
+            event_id WITH =,
+            tsrange(
+                start_time - interval '450 seconds',
+                end_time + interval '450 seconds'
+            ) WITH &&
+        ) WHERE (is_active)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE sessions DROP CONSTRAINT IF EXISTS ex_sessions_event_slot")
@@ -0,0 +1,50 @@
+"""Add registered_participants counter to events table
+
+Revision ID: b3f1c9d2e4a7
+Revises: 121d5edfdf4e
+Create Date: 2025-09-02 10:14:37.512904
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b3f1c9d2e4a7"
+down_revision = "121d5edfdf4e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Add denormalized counter of registered participants
+    op.add_column(
+        "events",
+        sa.Column(
+            "registered_participants",
+            sa.Integer(),
+            nullable=False,
+            server_default="0",
+        ),
+    )
+
+    # Backfill the counter from existing registrations
+    op.execute(
+        """
+        UPDATE events
+        SET registered_participants = COALESCE(
+            (
+                SELECT SUM(er.number_of_participants)
+                FROM event_registrations er
+                WHERE er.event_id = events.id
+            ),
+            0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    # Remove registered_participants column from events table
+    op.drop_column("events", "registered_participants")
@@ -0,0 +1,40 @@
+"""Add foreign key, composite and partial indexes
+
+Revision ID: c4e6a8b0d2f3
+Revises: a7d9f1b3c5e8
+Create Date: 2025-09-07 11:48:03.615927
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4e6a8b0d2f3"
+down_revision = "a7d9f1b3c5e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # event_registrations.event_id and .user_id are already the leading columns
+    # of uq_event_registrations_event_user and ix_event_registrations_user_id_id
+    op.create_index(
+        "ix_sessions_event_id_start_time", "sessions", ["event_id", "start_time"]
+    )
+    op.create_index("ix_sessions_speaker_id", "sessions", ["speaker_id"])
+    op.create_index("ix_users_role_id", "users", ["role_id"])
+    op.create_index(
+        "ix_events_active_start_date",
+        "events",
+        ["start_date"],
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_active_start_date", table_name="events")
+    op.drop_index("ix_users_role_id", table_name="users")
+    op.drop_index("ix_sessions_speaker_id", table_name="sessions")
+    op.drop_index("ix_sessions_event_id_start_time", table_name="sessions")
@@ -0,0 +1,56 @@
+"""Add unique (event_id, user_id) constraint to event_registrations
+
+Revision ID: d8a4e6f0b2c1
+Revises: b3f1c9d2e4a7
+Create Date: 2025-09-04 18:42:05.117362
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d8a4e6f0b2c1"
+down_revision = "b3f1c9d2e4a7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Remove duplicated registrations left by past races (keep the oldest)
+    op.execute(
+        """
+        DELETE FROM event_registrations
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM event_registrations GROUP BY event_id, user_id
+        )
+        """
+    )
+
+    # Recompute counters after removing duplicates
+    op.execute(
+        """
+        UPDATE events
+        SET registered_participants = COALESCE(
+            (
+                SELECT SUM(er.number_of_participants)
+                FROM event_registrations er
+                WHERE er.event_id = events.id
+            ),
+            0
+        )
+        """
+    )
+
+    op.create_unique_constraint(
+        "uq_event_registrations_event_user",
+        "event_registrations",
+        ["event_id", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_event_registrations_event_user", "event_registrations", type_="unique"
+    )
@@ -0,0 +1,28 @@
+"""Add token_version to users
+
+Revision ID: e5c7a9b1d3f2
+Revises: d8a4e6f0b2c1
+Create Date: 2025-09-05 10:12:44.508213
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e5c7a9b1d3f2"
+down_revision = "d8a4e6f0b2c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column("token_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "token_version")
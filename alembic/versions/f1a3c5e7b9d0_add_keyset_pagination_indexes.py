@@ -0,0 +1,29 @@
+"""Add indexes for keyset pagination
+
+Revision ID: f1a3c5e7b9d0
+Revises: e5c7a9b1d3f2
+Create Date: 2025-09-06 09:31:17.224806
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f1a3c5e7b9d0"
+down_revision = "e5c7a9b1d3f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_start_date_id", "events", ["start_date", "id"])
+    op.create_index("ix_sessions_start_time_id", "sessions", ["start_time", "id"])
+    op.create_index(
+        "ix_event_registrations_user_id_id", "event_registrations", ["user_id", "id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_event_registrations_user_id_id", table_name="event_registrations")
+    op.drop_index("ix_sessions_start_time_id", table_name="sessions")
+    op.drop_index("ix_events_start_date_id", table_name="events")
@@ -2,13 +2,13 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.auth_schemas import LoginRequest
 from app.api.schemas.token_schema import TokenResponse
 from app.api.schemas.user_schemas import UserCreate
 from app.core.dependencies import get_current_user
-from app.db.base import get_db
+from app.db.base import get_async_db
 from app.db.models import User
 from app.services.auth_service import AuthService
 
@@ -16,11 +16,11 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=TokenResponse, summary="Login a user")
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     """Login a user."""
     try:
         auth_service = AuthService(db)
-        return auth_service.login(login_data)
+        return await auth_service.login(login_data)
     except HTTPException:
         raise
     except ValueError as e:
@@ -32,17 +32,31 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/register", response_model=TokenResponse, summary="Register a user")
-async def register(register_data: UserCreate, db: Session = Depends(get_db)):
+async def register(register_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """Register a user."""
     try:
         auth_service = AuthService(db)
-        return auth_service.register(register_data)
+        return await auth_service.register(register_data)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post("/logout", summary="Revoke all tokens of the current user")
+async def logout(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Revoke every access token issued to the authenticated user."""
+    try:
+        auth_service = AuthService(db)
+        await auth_service.revoke_tokens(int(current_user.id))
+        return {"message": "Tokens revoked successfully"}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get("/me", summary="Get current user info")
 async def get_current_user_info(
     current_user: User = Depends(get_current_user),
@@ -1,18 +1,22 @@
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.event_registration_schemas import (
     EventRegistration,
+    EventRegistrationBatchCreate,
+    EventRegistrationBatchResult,
     EventRegistrationCreate,
     EventRegistrationUpdate,
     EventRegistrationWithEvent,
 )
-from app.api.schemas.pagination_schema import Page
-from app.core.dependencies import get_current_user
-from app.db.base import get_db
+from app.api.schemas.pagination_schema import CountMode, Page
+from app.core.dependencies import get_current_user, require_organizer
+from app.core.responses import model_response
+from app.db.base import get_async_db
 from app.db.models.user_model import User
+from app.infrastructure.pagination import InvalidCursorError
 from app.services.event_registration_service import EventRegistrationService
 
 # Router para endpoints de registro a eventos
@@ -22,7 +26,7 @@ router = APIRouter()
 @router.post("/", response_model=EventRegistration, summary="Register to an event")
 async def register_to_event(
     registration_data: EventRegistrationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -40,7 +44,7 @@ async def register_to_event(
     """
     try:
         registration_service = EventRegistrationService(db)
-        registration = registration_service.register_user_to_event(
+        registration = await registration_service.register_user_to_event(
             user_id=int(current_user.id), registration_data=registration_data
         )
         return registration
@@ -50,15 +54,60 @@ async def register_to_event(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post(
+    "/batch",
+    response_model=EventRegistrationBatchResult,
+    summary="Register many users to events",
+)
+async def register_batch(
+    batch: EventRegistrationBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(require_organizer),
+):
+    """
+    Registra varios usuarios a eventos en una sola petición (reservas de grupo
+    y corporativas).
+
+    **Requires:** Organizer or Admin role
+
+    Cada elemento se valida como un registro individual (evento activo,
+    usuario existente, sin registro previo, capacidad disponible). La capacidad
+    de cada evento se reparte en el orden de la petición y los elementos
+    rechazados no impiden crear los demás.
+
+    - **batch**: Lista de registros (user_id, event_id, number_of_participants)
+
+    Devuelve el resultado de cada elemento en el orden de la petición.
+    """
+    try:
+        registration_service = EventRegistrationService(db)
+        result = await registration_service.register_users_batch(batch)
+        return model_response(result)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.get(
     "/user_registrations",
     response_model=Page[EventRegistrationWithEvent],
     summary="Get user's event registrations",
 )
 async def get_user_registrations(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of registrations per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor pagination: pass next_cursor of the previous page, "
+        "or an empty value for the first page",
+    ),
+    count: CountMode = Query(
+        CountMode.NONE,
+        description="Total with cursor pagination: none (default), exact or "
+        "estimated; page-number pagination always counts",
+    ),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -68,17 +117,23 @@ async def get_user_registrations(
 
     - **page**: Número de página (comienza en 1)
     - **size**: Número de registros por página (máximo 100)
+    - **cursor**: Paginación por cursor opcional (más recientes primero)
+    - **count**: Total con cursor, sólo se calcula si se pide (`exact` o `estimated`)
     """
     try:
         registration_service = EventRegistrationService(db)
         skip = (page - 1) * size
-        registrations = registration_service.get_user_registrations(
+        registrations = await registration_service.get_user_registrations(
             user_id=int(current_user.id), 
             skip=skip, 
             page=page, 
-            limit=size
-        ) 
-        return registrations
+            limit=size,
+            cursor=cursor,
+            count_mode=count,
+        )
+        return model_response(registrations)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -92,7 +147,7 @@ async def get_event_registrations(
     event_id: int,
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of registrations per page"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -112,10 +167,10 @@ async def get_event_registrations(
             )
         registration_service = EventRegistrationService(db)
         skip = (page - 1) * size
-        registrations = registration_service.get_event_registrations(
+        registrations = await registration_service.get_event_registrations(
             event_id=event_id, skip=skip, page=page, limit=size
         )
-        return registrations
+        return model_response(registrations)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -127,7 +182,7 @@ async def get_event_registrations(
 )
 async def get_registration_by_id(
     registration_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -139,7 +194,7 @@ async def get_registration_by_id(
     """
     try:
         registration_service = EventRegistrationService(db)
-        registration = registration_service.get_registration_by_id(registration_id)
+        registration = await registration_service.get_registration_by_id(registration_id)
 
         if not registration:
             raise HTTPException(status_code=404, detail="Registro no encontrado")
@@ -160,7 +215,7 @@ async def get_registration_by_id(
 
 
 @router.get("/event/{event_id}/capacity", summary="Get event capacity information")
-async def get_event_capacity(event_id: int, db: Session = Depends(get_db)):
+async def get_event_capacity(event_id: int, db: AsyncSession = Depends(get_async_db)):
     """
     Obtiene información de capacidad de un evento.
 
@@ -174,7 +229,7 @@ async def get_event_capacity(event_id: int, db: Session = Depends(get_db)):
     """
     try:
         registration_service = EventRegistrationService(db)
-        capacity_info = registration_service.get_event_capacity_info(event_id)
+        capacity_info = await registration_service.get_event_capacity_info(event_id)
         return capacity_info
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -185,7 +240,7 @@ async def get_event_capacity(event_id: int, db: Session = Depends(get_db)):
 @router.delete("/{eventId}", summary="Cancel event registration")
 async def cancel_registration(
     eventId: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -205,7 +260,7 @@ async def cancel_registration(
     """
     try:
         registration_service = EventRegistrationService(db)
-        success = registration_service.cancel_registration(
+        success = await registration_service.cancel_registration(
             eventId=eventId, 
             user_id=int(current_user.id)
         )
@@ -226,7 +281,7 @@ async def cancel_registration(
 @router.get("/check/{event_id}", summary="Check if user is registered to event")
 async def check_user_registration(
     event_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -241,7 +296,7 @@ async def check_user_registration(
     """
     try:
         registration_service = EventRegistrationService(db)
-        registration = registration_service.get_user_registration_for_event(
+        registration = await registration_service.get_user_registration_for_event(
             user_id=int(current_user.id), 
             event_id=event_id
         )
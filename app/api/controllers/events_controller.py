@@ -1,19 +1,30 @@
 import math
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.ext.asyncio import AsyncSession as DBSession
 
 from app.api.schemas.event_schemas import (
     Event,
     EventCreate,
+    EventSparse,
     EventUpdate,
     EventWithCapacity,
 )
-from app.api.schemas.pagination_schema import Page
+from app.api.schemas.import_schemas import ImportReport
+from app.api.schemas.pagination_schema import CountMode, Page
 from app.api.schemas.session_schemas import Session as SessionSchema
 from app.api.schemas.session_schemas import SessionCreate, SessionCreateForEvent
+from app.core.cache import (
+    EVENT_LISTS_TAG,
+    UPCOMING_EVENTS_TAG,
+    event_sessions_tag,
+    event_tag,
+    response_cache,
+)
+from app.core.conditional import conditional_response, with_validator
+from app.core.config import settings
 from app.core.dependencies import get_current_user, require_admin, require_organizer
 from app.core.exceptions import (
     NotFoundException,
@@ -21,18 +32,41 @@ from app.core.exceptions import (
     ValidationException,
     create_validation_error,
 )
-from app.db.base import get_db
+from app.core.responses import model_response
+from app.db.base import get_async_db, get_async_read_db
 from app.db.models import User
+from app.infrastructure.pagination import InvalidCursorError
+from app.infrastructure.record_streams import iter_records, stream_format
+from app.services.agenda_import_service import AgendaImportService, ImportTooLargeError
 from app.services.event_service import EventService
+from app.services.validators.event_validators import parse_event_fields
 
 router = APIRouter()
 
+# Con ?fields= los elementos sólo llevan id y los campos pedidos
+EventListPage = Union[Page[Event], Page[EventSparse]]
+
 
-@router.get("/", response_model=Page[Event], summary="Get all events")
+@router.get("/", response_model=EventListPage, summary="Get all events")
 async def get_all_events(
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of events per page"),
-    db: DBSession = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor pagination: pass next_cursor of the previous page, "
+        "or an empty value for the first page",
+    ),
+    count: CountMode = Query(
+        CountMode.NONE,
+        description="Total with cursor pagination: none (default), exact or "
+        "estimated; page-number pagination always counts",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated fields to return (sparse fieldset), "
+        "e.g. title,start_date; id is always included",
+    ),
+    db: DBSession = Depends(get_async_read_db),
     # current_user: User = Depends(require_admin),
 ):
     """
@@ -40,21 +74,56 @@ async def get_all_events(
 
     - **page**: Page number to retrieve (starts at 1)
     - **size**: Number of events per page (max 100)
+    - **cursor**: Opt-in cursor pagination ordered by (start_date, id)
+    - **count**: Total of cursor pages, only computed on request
+    - **fields**: Only return these fields (only those columns are queried)
     """
     try:
+        try:
+            selected_fields = parse_event_fields(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
         event_service = EventService(db)
         skip = (page - 1) * size
-        events = event_service.get_all_events(skip=skip, page=page, limit=size)
 
-        return events
+        return await response_cache.cached_response(
+            namespace="events:list",
+            params={
+                "page": page,
+                "size": size,
+                "cursor": cursor,
+                "count": count.value if cursor is not None else None,
+                "fields": ",".join(selected_fields) if selected_fields else None,
+            },
+            ttl=settings.cache_ttl_events_list,
+            tags=[EVENT_LISTS_TAG],
+            producer=lambda: event_service.get_all_events(
+                skip=skip,
+                page=page,
+                limit=size,
+                cursor=cursor,
+                fields=selected_fields,
+                count_mode=count,
+            ),
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 @router.get(
-    "/search", response_model=Page[Event], summary="Search events by multiple criteria"
+    "/search",
+    response_model=EventListPage,
+    summary="Search events by multiple criteria",
 )
 async def search_events(
+    q: Optional[str] = Query(
+        None, description="Free-text search over title and location, by relevance"
+    ),
     title: Optional[str] = Query(None, description="Search by title or part of title"),
     location: Optional[str] = Query(
         None, description="Search by location or part of location"
@@ -68,11 +137,22 @@ async def search_events(
     ),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Number of events per page"),
-    db: DBSession = Depends(get_db),
+    count: CountMode = Query(
+        CountMode.EXACT,
+        description="Total of matches: exact, estimated (planner stats) or none",
+    ),
+    fields: Optional[str] = Query(
+        None,
+        description="Comma separated fields to return (sparse fieldset), "
+        "e.g. title,start_date; id is always included",
+    ),
+    db: DBSession = Depends(get_async_read_db),
 ):
     """
     Search events by multiple criteria:
 
+    - **q**: Free-text search over title and location (prefix match on every
+      word), results ordered by relevance
     - **title**: Search by title or part of title (case insensitive)
     - **location**: Search by location or part of location (case insensitive)
     - **is_active**: Filter by active status (true/false)
@@ -80,8 +160,16 @@ async def search_events(
     - **date_to**: End of date range (events that occur until this date) - YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS
     - **page**: Page number (starts at 1)
     - **size**: Number of events per page (max 100)
+    - **count**: `exact` (default), `estimated` for large result sets, or `none`
+      to skip counting (use `has_next` to page)
+    - **fields**: Only return these fields (only those columns are queried)
     """
     try:
+        try:
+            selected_fields = parse_event_fields(fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
         # Convert date strings to datetime objects
         parsed_date_from = None
         parsed_date_to = None
@@ -110,52 +198,42 @@ async def search_events(
         skip = (page - 1) * size
 
         event_service = EventService(db)
-        events = event_service.search_events(
-            title=title,
-            location=location,
-            is_active=is_active,
-            date_from=parsed_date_from,
-            date_to=parsed_date_to,
-            page=page,
-            skip=skip,
-            limit=size,
+        return await response_cache.cached_response(
+            namespace="events:search",
+            params={
+                "q": q,
+                "title": title,
+                "location": location,
+                "is_active": is_active,
+                "date_from": parsed_date_from,
+                "date_to": parsed_date_to,
+                "page": page,
+                "size": size,
+                "count": count.value,
+                "fields": ",".join(selected_fields) if selected_fields else None,
+            },
+            ttl=settings.cache_ttl_events_search,
+            tags=[EVENT_LISTS_TAG],
+            producer=lambda: event_service.search_events(
+                title=title,
+                location=location,
+                is_active=is_active,
+                date_from=parsed_date_from,
+                date_to=parsed_date_to,
+                page=page,
+                skip=skip,
+                limit=size,
+                count_mode=count,
+                q=q,
+                fields=selected_fields,
+            ),
         )
-        return events
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/{event_id}", response_model=Event, summary="Get event by ID")
-async def get_event_by_id(
-    event_id: int, db: DBSession = Depends(get_db), request: Request = None
-):
-    """
-    Retrieve a specific event by its ID.
-
-    - **event_id**: The unique identifier of the event
-    """
-    try:
-        event_service = EventService(db)
-        event = event_service.get_event_by_id(event_id)
-        if not event:
-            raise NotFoundException(
-                message="Evento no encontrado",
-                path=str(request.url.path) if request else None,
-                method=request.method if request else None,
-            )
-        return event
-    except (NotFoundException, ValidationException, ServerException):
-        raise
-    except Exception as e:
-        raise ServerException(
-            message=f"Error interno del servidor: {str(e)}",
-            path=str(request.url.path) if request else None,
-            method=request.method if request else None,
-        )
-
-
 @router.get(
     "/upcoming/with-capacity",
     response_model=Page[EventWithCapacity],
@@ -164,7 +242,7 @@ async def get_event_by_id(
 async def get_upcoming_events_with_capacity(
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of events per page"),
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_read_db),
 ):
     """
     Retrieve upcoming events with capacity information and pagination.
@@ -180,10 +258,15 @@ async def get_upcoming_events_with_capacity(
     try:
         event_service = EventService(db)
         skip = (page - 1) * size
-        events = event_service.get_upcoming_events_with_capacity(
-            skip=skip, page=page, limit=size
+        return await response_cache.cached_response(
+            namespace="events:upcoming",
+            params={"page": page, "size": size},
+            ttl=settings.cache_ttl_upcoming_events,
+            tags=[UPCOMING_EVENTS_TAG],
+            producer=lambda: event_service.get_upcoming_events_with_capacity(
+                skip=skip, page=page, limit=size
+            ),
         )
-        return events
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -196,7 +279,7 @@ async def get_upcoming_events_with_capacity(
 async def get_all_events_with_capacity(
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of events per page"),
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_read_db),
 ):
     """
     Retrieve all events with capacity information and pagination.
@@ -211,18 +294,67 @@ async def get_all_events_with_capacity(
     try:
         event_service = EventService(db)
         skip = (page - 1) * size
-        events = event_service.get_all_events_with_capacity(
+        events = await event_service.get_all_events_with_capacity(
             skip=skip, page=page, limit=size
         )
-        return events
+        return model_response(events)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get("/{event_id}", response_model=Event, summary="Get event by ID")
+async def get_event_by_id(
+    event_id: int, db: DBSession = Depends(get_async_read_db), request: Request = None
+):
+    """
+    Retrieve a specific event by its ID.
+
+    Supports conditional requests: `ETag`/`Last-Modified` are returned and a
+    matching `If-None-Match` or `If-Modified-Since` is answered with 304.
+
+    - **event_id**: The unique identifier of the event
+    """
+    try:
+        event_service = EventService(db)
+        cache_control = settings.cache_control_event_detail
+        # El validador también resuelve el 404 sin cargar el evento
+        validator = await event_service.get_event_validator(event_id)
+        event = None
+        if validator:
+            if request is not None:
+                not_modified = conditional_response(request, validator, cache_control)
+                if not_modified:
+                    return not_modified
+
+            event = await response_cache.cached_response(
+                namespace=f"events:detail:{event_id}",
+                # La versión en la clave impide servir un cuerpo anterior con el ETag nuevo
+                params={"version": validator.etag},
+                ttl=settings.cache_ttl_event_detail,
+                tags=[event_tag(event_id)],
+                producer=lambda: event_service.get_event_by_id(event_id),
+            )
+        if not event:
+            raise NotFoundException(
+                message="Evento no encontrado",
+                path=str(request.url.path) if request else None,
+                method=request.method if request else None,
+            )
+        return with_validator(event, validator, cache_control)
+    except (NotFoundException, ValidationException, ServerException):
+        raise
+    except Exception as e:
+        raise ServerException(
+            message=f"Error interno del servidor: {str(e)}",
+            path=str(request.url.path) if request else None,
+            method=request.method if request else None,
+        )
+
+
 @router.post("/", response_model=Event, summary="Create new event")
 async def create_event(
     event: EventCreate,
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -234,7 +366,7 @@ async def create_event(
     """
     try:
         event_service = EventService(db)
-        new_event = event_service.create_new_event(event)
+        new_event = await event_service.create_new_event(event)
         return new_event
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -242,11 +374,75 @@ async def create_event(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post(
+    "/import",
+    response_model=ImportReport,
+    summary="Import events and sessions in bulk",
+    openapi_extra={
+        "requestBody": {
+            "content": {
+                "text/csv": {"schema": {"type": "string"}},
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def import_agenda(
+    request: Request,
+    dry_run: bool = Query(False, description="Validate only, write nothing"),
+    batch_size: Optional[int] = Query(
+        None, ge=1, le=5000, description="Rows per write transaction"
+    ),
+    db: DBSession = Depends(get_async_db),
+    current_user: User = Depends(require_organizer),
+):
+    """
+    Import whole agendas (events and their sessions) from a CSV or NDJSON body.
+
+    **Requires:** Organizer or Admin role
+
+    The body is parsed as it streams (`Content-Type: text/csv` with a header
+    row, or `application/x-ndjson` with one object per line). Each row has a
+    `type` (`event` or `session`) and the fields of `POST /events/` or
+    `POST /events/{id}/sessions`. Events may set a `ref` (default: title);
+    sessions point to an imported event with `event_ref` or to an existing
+    one with `event_id`.
+
+    All rows are validated before writing, including schedule conflicts
+    (with the 15-minute buffer) between imported and existing sessions.
+    Valid rows are written in transactions of `batch_size` rows; invalid
+    rows are reported by line and do not block the rest.
+
+    - **dry_run**: Only validate and report
+    - **batch_size**: Rows per transaction (default `IMPORT_BATCH_SIZE`)
+    """
+    format = stream_format(request.headers.get("content-type"))
+    if format is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Content-Type must be text/csv or application/x-ndjson",
+        )
+    try:
+        import_service = AgendaImportService(db)
+        report = await import_service.import_agenda(
+            iter_records(request.stream(), format),
+            dry_run=dry_run,
+            batch_size=batch_size,
+        )
+        return model_response(report)
+    except ImportTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="The body must be UTF-8 encoded")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
 @router.put("/{event_id}", response_model=Event, summary="Update event by ID")
 async def update_event(
     event_id: int,
     event: EventUpdate,
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -259,7 +455,7 @@ async def update_event(
     """
     try:
         event_service = EventService(db)
-        updated_event = event_service.update_event(event_id, event)
+        updated_event = await event_service.update_event(event_id, event)
         if not updated_event:
             raise HTTPException(status_code=404, detail="Event not found")
         return updated_event
@@ -274,7 +470,7 @@ async def update_event(
 @router.delete("/{event_id}", summary="Delete event by ID")
 async def delete_event(
     event_id: int,
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -286,7 +482,7 @@ async def delete_event(
     """
     try:
         event_service = EventService(db)
-        deleted = event_service.delete_event(event_id)
+        deleted = await event_service.delete_event(event_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Event not found")
         return {"message": "Event deleted successfully"}
@@ -304,13 +500,16 @@ async def delete_event(
 )
 async def get_event_sessions(
     event_id: int,
+    request: Request,
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of sessions per page"),
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_read_db),
 ):
     """
     Retrieve all sessions for a specific event with pagination.
 
+    Supports conditional requests with `ETag` / `If-None-Match` (304).
+
     - **event_id**: The unique identifier of the event
     - **page**: Page number to retrieve (starts at 1)
     - **size**: Number of sessions per page (max 100)
@@ -319,11 +518,25 @@ async def get_event_sessions(
         from app.services.session_service import SessionService
 
         session_service = SessionService(db)
+        cache_control = settings.cache_control_event_sessions
+        validator = await session_service.get_event_sessions_validator(
+            event_id, page=page, limit=size
+        )
+        not_modified = conditional_response(request, validator, cache_control)
+        if not_modified:
+            return not_modified
+
         skip = (page - 1) * size
-        sessions = session_service.get_sessions_by_event(
-            event_id, skip=skip, page=page, limit=size
+        response = await response_cache.cached_response(
+            namespace=f"events:{event_id}:sessions",
+            params={"page": page, "size": size, "version": validator.etag},
+            ttl=settings.cache_ttl_event_sessions,
+            tags=[event_sessions_tag(event_id)],
+            producer=lambda: session_service.get_sessions_by_event(
+                event_id, skip=skip, page=page, limit=size
+            ),
         )
-        return sessions
+        return with_validator(response, validator, cache_control)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -336,7 +549,7 @@ async def get_event_sessions(
 async def create_event_session(
     event_id: int,
     session: SessionCreateForEvent,
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_db),
     current_user: User = Depends(require_organizer),
 ):
     """
@@ -362,7 +575,7 @@ async def create_event_session(
         session_data["event_id"] = event_id
 
         session_service = SessionService(db)
-        new_session = session_service.create_session(SessionCreate(**session_data))
+        new_session = await session_service.create_session(SessionCreate(**session_data))
         return new_session
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
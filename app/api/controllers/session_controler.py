@@ -3,12 +3,14 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session as DBSession
+from sqlalchemy.ext.asyncio import AsyncSession as DBSession
 
-from app.api.schemas.pagination_schema import Page
+from app.api.schemas.pagination_schema import CountMode, Page
 from app.api.schemas.session_schemas import Session as SessionSchema
 from app.api.schemas.session_schemas import SessionCreate, SessionUpdate
-from app.db.base import get_db
+from app.core.responses import model_response
+from app.db.base import get_async_db, get_async_read_db
+from app.infrastructure.pagination import InvalidCursorError
 from app.services.session_service import SessionService
 
 router = APIRouter()
@@ -18,19 +20,35 @@ router = APIRouter()
 async def get_all_sessions(
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of sessions per page"),
-    db: DBSession = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor pagination: pass next_cursor of the previous page, "
+        "or an empty value for the first page",
+    ),
+    count: CountMode = Query(
+        CountMode.NONE,
+        description="Total with cursor pagination: none (default), exact or "
+        "estimated; page-number pagination always counts",
+    ),
+    db: DBSession = Depends(get_async_read_db),
 ):
     """
     Retrieve all sessions with pagination.
 
     - **page**: Page number to retrieve (starts at 1)
     - **size**: Number of sessions per page (max 100)
+    - **cursor**: Opt-in cursor pagination ordered by (start_time, id)
+    - **count**: Total of cursor pages, only computed on request
     """
     try:
         session_service = SessionService(db)
         skip = (page - 1) * size
-        sessions = session_service.get_all_sessions(skip=skip, page=page, limit=size)
-        return sessions
+        sessions = await session_service.get_all_sessions(
+            skip=skip, page=page, limit=size, cursor=cursor, count_mode=count
+        )
+        return model_response(sessions)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -44,7 +62,7 @@ async def get_sessions_by_event(
     event_id: int,
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of sessions per page"),
-    db: DBSession = Depends(get_db),
+    db: DBSession = Depends(get_async_read_db),
 ):
     """
     Retrieve all sessions for a specific event with pagination.
@@ -56,16 +74,16 @@ async def get_sessions_by_event(
     try:
         session_service = SessionService(db)
         skip = (page - 1) * size
-        sessions = session_service.get_sessions_by_event(
+        sessions = await session_service.get_sessions_by_event(
             event_id, skip=skip, page=page, limit=size
         )
-        return sessions
+        return model_response(sessions)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
 @router.get("/{session_id}", response_model=SessionSchema, summary="Get session by ID")
-async def get_session_by_id(session_id: int, db: DBSession = Depends(get_db)):
+async def get_session_by_id(session_id: int, db: DBSession = Depends(get_async_read_db)):
     """
     Retrieve a specific session by its ID.
 
@@ -73,7 +91,7 @@ async def get_session_by_id(session_id: int, db: DBSession = Depends(get_db)):
     """
     try:
         session_service = SessionService(db)
-        session = session_service.get_session_by_id(session_id)
+        session = await session_service.get_session_by_id(session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         return session
@@ -84,7 +102,7 @@ async def get_session_by_id(session_id: int, db: DBSession = Depends(get_db)):
 
 
 @router.post("/", response_model=SessionSchema, summary="Create new session")
-async def create_session(session: SessionCreate, db: DBSession = Depends(get_db)):
+async def create_session(session: SessionCreate, db: DBSession = Depends(get_async_db)):
     """
     Create a new session.
 
@@ -96,7 +114,7 @@ async def create_session(session: SessionCreate, db: DBSession = Depends(get_db)
     """
     try:
         session_service = SessionService(db)
-        new_session = session_service.create_session(session)
+        new_session = await session_service.create_session(session)
         return new_session
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -108,7 +126,7 @@ async def create_session(session: SessionCreate, db: DBSession = Depends(get_db)
     "/{session_id}", response_model=SessionSchema, summary="Update session by ID"
 )
 async def update_session(
-    session_id: int, session: SessionUpdate, db: DBSession = Depends(get_db)
+    session_id: int, session: SessionUpdate, db: DBSession = Depends(get_async_db)
 ):
     """
     Update an existing session.
@@ -124,7 +142,7 @@ async def update_session(
     """
     try:
         session_service = SessionService(db)
-        updated_session = session_service.update_session(session_id, session)
+        updated_session = await session_service.update_session(session_id, session)
         if not updated_session:
             raise HTTPException(status_code=404, detail="Session not found")
         return updated_session
@@ -137,7 +155,7 @@ async def update_session(
 
 
 @router.delete("/{session_id}", summary="Delete session by ID")
-async def delete_session(session_id: int, db: DBSession = Depends(get_db)):
+async def delete_session(session_id: int, db: DBSession = Depends(get_async_db)):
     """
     Delete a session permanently.
 
@@ -145,7 +163,7 @@ async def delete_session(session_id: int, db: DBSession = Depends(get_db)):
     """
     try:
         session_service = SessionService(db)
-        deleted = session_service.delete_session(session_id)
+        deleted = await session_service.delete_session(session_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Session not found")
         return {"message": "Session deleted successfully"}
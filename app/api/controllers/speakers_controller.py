@@ -1,24 +1,37 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.speaker_schemas import Speaker
-from app.db.base import get_db
+from app.core.conditional import conditional_response, with_validator
+from app.core.config import settings
+from app.core.responses import model_response
+from app.db.base import get_async_read_db
 from app.services.speaker_service import SpeakerService
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[Speaker], summary="Get all speakers")
-async def get_all_speakers(db: Session = Depends(get_db)):
+async def get_all_speakers(
+    request: Request, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Retrieve all speakers.
+
+    Supports conditional requests with `ETag` / `If-None-Match` (304).
     """
     try:
         speaker_service = SpeakerService(db)
-        speakers = speaker_service.get_all_speakers()
+        cache_control = settings.cache_control_speakers
+        validator = await speaker_service.get_speakers_validator()
+        not_modified = conditional_response(request, validator, cache_control)
+        if not_modified:
+            return not_modified
+
+        speakers = await speaker_service.get_all_speakers()
 
-        return speakers
+        return with_validator(model_response(speakers), validator, cache_control)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
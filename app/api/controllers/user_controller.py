@@ -2,22 +2,35 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.schemas.pagination_schema import CountMode, Page
 from app.api.schemas.user_schemas import User, UserUpdate
 from app.core.dependencies import get_current_user, require_admin
-from app.db.base import get_db
+from app.core.responses import model_response
+from app.db.base import get_async_db
 from app.db.models import User as UserModel
+from app.infrastructure.pagination import InvalidCursorError
 from app.services.user_service import UserService
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[User], summary="Get all users")
+@router.get("/", response_model=Page[User], summary="Get all users")
 async def get_all_users(
     page: int = Query(1, ge=1, description="Page number to retrieve"),
     size: int = Query(20, ge=1, le=100, description="Number of events per page"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor pagination: pass next_cursor of the previous page, "
+        "or an empty value for the first page",
+    ),
+    count: CountMode = Query(
+        CountMode.NONE,
+        description="Total with cursor pagination: none (default), exact or "
+        "estimated; page-number pagination always counts",
+    ),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserModel = Depends(require_admin),
 ):
     """
@@ -27,12 +40,18 @@ async def get_all_users(
 
     - **skip**: Number of users to skip (for pagination)
     - **limit**: Maximum number of users to return (max 1000)
+    - **cursor**: Opt-in cursor pagination ordered by id
+    - **count**: Total of cursor pages, only computed on request
     """
     try:
         user_service = UserService(db)
         skip = (page - 1) * size
-        users = user_service.get_all_users(skip=skip, page=page, limit=size)
-        return users
+        users = await user_service.get_all_users(
+            skip=skip, page=page, limit=size, cursor=cursor, count_mode=count
+        )
+        return model_response(users)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
@@ -51,7 +70,7 @@ async def get_current_user_profile(current_user: UserModel = Depends(get_current
 async def update_current_user_profile(
     user_update: UserUpdate,
     current_user: UserModel = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Actualiza el perfil del usuario autenticado.
@@ -64,7 +83,7 @@ async def update_current_user_profile(
         user_service = UserService(db)
         # Convertir el esquema a diccionario, excluyendo valores None
         update_data = {k: v for k, v in user_update.dict().items() if v is not None}
-        updated_user = user_service.update_user(current_user.id, update_data)
+        updated_user = await user_service.update_user(current_user.id, update_data)
         return updated_user
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -23,6 +23,50 @@ class EventRegistrationCreate(BaseModel):
         return v
 
 
+# Máximo de registros aceptados por petición de registro en lote
+MAX_BATCH_REGISTRATIONS = 1000
+
+
+class EventRegistrationBatchItem(BaseModel):
+    """Registro de un usuario dentro de un registro en lote"""
+
+    user_id: int = Field(..., gt=0, description="ID del usuario a registrar")
+    event_id: int = Field(..., gt=0, description="ID del evento")
+    number_of_participants: int = Field(
+        1, ge=1, le=10, description="Número de participantes (máximo 10)"
+    )
+
+
+class EventRegistrationBatchCreate(BaseModel):
+    """Esquema para registrar varios usuarios a eventos en una sola petición"""
+
+    items: List[EventRegistrationBatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_REGISTRATIONS,
+        description=f"Registros a crear (máximo {MAX_BATCH_REGISTRATIONS})",
+    )
+
+
+class EventRegistrationBatchItemResult(BaseModel):
+    """Resultado de un elemento del registro en lote"""
+
+    index: int
+    user_id: int
+    event_id: int
+    status: Literal["created", "error"]
+    registration_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class EventRegistrationBatchResult(BaseModel):
+    """Resultado del registro en lote, en el orden de la petición"""
+
+    created: int
+    failed: int
+    results: List[EventRegistrationBatchItemResult]
+
+
 class EventRegistrationUpdate(BaseModel):
     """Esquema para actualizar un registro de evento"""
 
@@ -70,3 +114,23 @@ class EventRegistrationWithEvent(BaseModel):
     location: str
     start_date: datetime
     end_date: datetime
+
+    @classmethod
+    def from_registration(cls, registration) -> "EventRegistrationWithEvent":
+        """Build the schema from a registration row with its event loaded."""
+        event = registration.event
+        return cls.model_validate(
+            {
+                "id": registration.id,
+                "event_id": registration.event_id,
+                "user_id": registration.user_id,
+                "number_of_participants": registration.number_of_participants,
+                "created_at": registration.created_at,
+                "updated_at": registration.updated_at,
+                "title": event.title,
+                "date": event.start_date,
+                "location": event.location,
+                "start_date": event.start_date,
+                "end_date": event.end_date,
+            }
+        )
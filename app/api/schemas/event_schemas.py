@@ -36,7 +36,44 @@ class Event(EventBase):
         from_attributes = True
 
 
+# Campos de Event que admiten los listados con ?fields= (conjunto disperso)
+EVENT_LIST_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "location",
+    "start_date",
+    "end_date",
+    "capacity",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+
+class EventSparse(BaseModel):
+    """Evento de un listado con ?fields=: sólo id y los campos pedidos"""
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    capacity: Optional[int] = None
+    is_active: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 class EventWithCapacity(Event):
     """Esquema para eventos con información de capacidad"""
     registered_participants: int = 0
     available_capacity: int = 0
+
+    @classmethod
+    def from_row(cls, event, registered_participants: int) -> "EventWithCapacity":
+        """Build the schema from an event row in a single validation pass."""
+        data = {name: getattr(event, name) for name in Event.model_fields}
+        data["registered_participants"] = registered_participants
+        data["available_capacity"] = event.capacity - registered_participants
+        return cls.model_validate(data)
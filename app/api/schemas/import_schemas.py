@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+from app.api.schemas.event_schemas import EventCreate
+from app.api.schemas.session_schemas import SessionCreateForEvent
+
+_datetime_adapter = TypeAdapter(datetime)
+
+
+def _naive_utc(value: Any) -> Any:
+    """Fechas con zona horaria a UTC sin zona, como las columnas DateTime.
+
+    Se ejecuta antes que los validadores heredados, que comparan con
+    ``datetime.now()`` y fallarían con TypeError ante una fecha con zona.
+    """
+    if value is None:
+        return value
+    parsed = _datetime_adapter.validate_python(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class EventImportRow(EventCreate):
+    """Evento de una importación; ``ref`` lo identifica dentro del fichero"""
+
+    ref: Optional[str] = Field(
+        None, description="Referencia usada por las sesiones (por defecto el título)"
+    )
+
+    _naive_dates = field_validator("start_date", "end_date", mode="before")(
+        _naive_utc
+    )
+
+
+class SessionImportRow(SessionCreateForEvent):
+    """Sesión de una importación, de un evento del fichero o de uno existente"""
+
+    event_ref: Optional[str] = Field(
+        None, description="ref (o título) de un evento del mismo fichero"
+    )
+    event_id: Optional[int] = Field(None, gt=0, description="ID de un evento existente")
+
+    _naive_times = field_validator("start_time", "end_time", mode="before")(
+        _naive_utc
+    )
+
+
+class ImportRowError(BaseModel):
+    """Fila rechazada de una importación"""
+
+    line: int = Field(..., description="Línea del fichero donde empieza la fila")
+    type: Optional[Literal["event", "session"]] = None
+    error: str
+
+
+class ImportReport(BaseModel):
+    """Resultado de una importación de agenda"""
+
+    dry_run: bool
+    rows: int = Field(..., description="Filas leídas")
+    events_imported: int = Field(
+        ..., description="Eventos creados (válidos en dry_run)"
+    )
+    sessions_imported: int = Field(
+        ..., description="Sesiones creadas (válidas en dry_run)"
+    )
+    event_ids: Dict[str, int] = Field(
+        default_factory=dict, description="ID de cada evento creado por su ref"
+    )
+    errors: List[ImportRowError] = Field(default_factory=list)
@@ -1,16 +1,38 @@
-from typing import Generic, List, TypeVar
+from enum import Enum
+from typing import Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
 
+class CountMode(str, Enum):
+    """How the total number of results is computed."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 class Page(BaseModel, Generic[T]):
     items: List[T]
     page: int = Field(..., description="Current page number")
     size: int = Field(..., description="Number of items per page")
-    total_items: int = Field(..., description="Total number of items")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_items: Optional[int] = Field(
+        ..., description="Total number of items (null when counting is skipped)"
+    )
+    total_pages: Optional[int] = Field(
+        ..., description="Total number of pages (null when counting is skipped)"
+    )
+    total_is_estimate: bool = Field(
+        False, description="Whether total_items is a planner estimate"
+    )
+    has_next: Optional[bool] = Field(
+        None, description="Whether there is a next page (search endpoints)"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor of the next page (cursor pagination only)"
+    )
 
     class Config:
         arbitrary_types_allowed = True
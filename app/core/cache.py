@@ -0,0 +1,213 @@
+"""
+Response cache module.
+
+This module provides a small tag-aware cache for public read endpoints. It
+uses Redis when ``REDIS_URL`` is configured and the ``redis`` package is
+available, and falls back to an in-process LRU otherwise.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from fastapi import Response
+
+from app.core.config import settings
+from app.core.responses import dump_json
+
+logger = logging.getLogger(__name__)
+
+# Tags usados para invalidar de forma selectiva
+EVENT_LISTS_TAG = "events"
+UPCOMING_EVENTS_TAG = "events:upcoming"
+
+# Parámetro de paginación por cursor, sensible a mayúsculas
+CURSOR_PARAM = "cursor"
+
+
+def event_tag(event_id: int) -> str:
+    """Tag for the detail of a single event."""
+    return f"event:{event_id}"
+
+
+def event_sessions_tag(event_id: int) -> str:
+    """Tag for the sessions listing of a single event."""
+    return f"event:{event_id}:sessions"
+
+
+def build_cache_key(namespace: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a normalized cache key.
+
+    Parameters are sorted, ``None`` values are dropped and strings are
+    stripped and lower-cased, so equivalent requests share the same entry.
+    Pagination cursors are opaque and kept verbatim (even when empty).
+    """
+    parts = []
+    for name, value in sorted((params or {}).items()):
+        if value is None:
+            continue
+        if name == CURSOR_PARAM:
+            pass
+        elif isinstance(value, str):
+            value = value.strip().lower()
+            if not value:
+                continue
+        elif isinstance(value, bool):
+            value = "true" if value else "false"
+        elif hasattr(value, "isoformat"):
+            value = value.isoformat()
+        parts.append(f"{name}={value}")
+    return f"{settings.cache_key_prefix}:{namespace}:{'&'.join(parts)}"
+
+
+class InMemoryCacheBackend:
+    """In-process LRU cache with TTL, used when Redis is not available."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int, tags: Iterable[str]) -> None:
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in self._tags.pop(tag, set()):
+                self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._tags.clear()
+
+
+class RedisCacheBackend:
+    """Redis cache; each tag is a Redis set holding the keys to invalidate."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{settings.cache_key_prefix}:tag:{tag}"
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.client.get(key)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set(self, key: str, value: str, ttl: int, tags: Iterable[str]) -> None:
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(key, value, ex=ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), key)
+                # El set del tag nunca vive más que la entrada más longeva
+                pipe.expire(self._tag_key(tag), settings.cache_max_ttl)
+            await pipe.execute()
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            keys = await self.client.smembers(tag_key)
+            await self.client.delete(tag_key, *keys)
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=f"{settings.cache_key_prefix}:*"):
+            await self.client.delete(key)
+
+
+def create_cache_backend():
+    """Create the Redis backend if configured, or the in-process fallback."""
+    if settings.redis_url:
+        try:
+            from redis import asyncio as redis_asyncio  # type:ignore
+
+            return RedisCacheBackend(redis_asyncio.from_url(settings.redis_url))
+        except ImportError:
+            logger.warning("redis package not installed, using in-memory cache")
+    return InMemoryCacheBackend(max_entries=settings.cache_max_entries)
+
+
+class ResponseCache:
+    """Cache of serialized JSON responses for read endpoints."""
+
+    def __init__(self, backend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+
+    async def cached_response(
+        self,
+        namespace: str,
+        params: Dict[str, Any],
+        ttl: int,
+        tags: List[str],
+        producer: Callable[[], Awaitable[Any]],
+    ) -> Optional[Response]:
+        """
+        Return the cached JSON response or build it with ``producer``.
+
+        Returns ``None`` (and caches nothing) when the producer returns
+        ``None``, so controllers can still answer 404.
+        """
+        key = build_cache_key(namespace, params)
+
+        if self.enabled:
+            try:
+                cached = await self.backend.get(key)
+            except Exception as e:
+                logger.warning("Cache read failed for %s: %s", key, e)
+                cached = None
+            if cached is not None:
+                return Response(
+                    content=cached,
+                    media_type="application/json",
+                    headers={"X-Cache": "HIT"},
+                )
+
+        result = await producer()
+        if result is None:
+            return None
+
+        content = dump_json(result)
+
+        if self.enabled:
+            try:
+                await self.backend.set(key, content, ttl, tags)
+            except Exception as e:
+                logger.warning("Cache write failed for %s: %s", key, e)
+
+        return Response(
+            content=content, media_type="application/json", headers={"X-Cache": "MISS"}
+        )
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every cached response associated with the given tags."""
+        if not self.enabled:
+            return
+        try:
+            await self.backend.invalidate(tags)
+        except Exception as e:
+            logger.warning("Cache invalidation failed for %s: %s", tags, e)
+
+    async def clear(self) -> None:
+        """Drop every cached response."""
+        await self.backend.clear()
+
+
+response_cache = ResponseCache(create_cache_backend(), enabled=settings.cache_enabled)
@@ -0,0 +1,95 @@
+"""
+HTTP conditional requests.
+
+Read endpoints compute a validator (strong ``ETag`` and optionally
+``Last-Modified``) from a cheap version query before running the service, and
+answer ``304 Not Modified`` when the client's ``If-None-Match`` (or, without
+it, ``If-Modified-Since``) still matches. ``Cache-Control`` is configurable
+per route through ``Settings``.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, NamedTuple, Optional
+
+from fastapi import Request, Response
+
+
+class Validator(NamedTuple):
+    """Validators of the current representation of a resource."""
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag from the parts identifying a representation (versions, params)."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite devuelve fechas naive en UTC (CURRENT_TIMESTAMP)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison of If-None-Match against the current ETag (RFC 9110)."""
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in header.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """Whether the client's cached copy is still current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, validator.etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validator.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # Last-Modified tiene resolución de segundos
+        last_modified = _as_utc(validator.last_modified).replace(microsecond=0)
+        return last_modified <= since
+    return False
+
+
+def validator_headers(validator: Validator, cache_control: str) -> Dict[str, str]:
+    """ETag, Last-Modified and Cache-Control headers for a response."""
+    headers = {"ETag": validator.etag}
+    if validator.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            _as_utc(validator.last_modified), usegmt=True
+        )
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def conditional_response(
+    request: Request, validator: Validator, cache_control: str
+) -> Optional[Response]:
+    """The 304 response when the client's copy is current, else ``None``."""
+    if not is_not_modified(request, validator):
+        return None
+    return Response(
+        status_code=304, headers=validator_headers(validator, cache_control)
+    )
+
+
+def with_validator(
+    response: Response, validator: Validator, cache_control: str
+) -> Response:
+    """Add the validator and Cache-Control headers to a full response."""
+    response.headers.update(validator_headers(validator, cache_control))
+    return response
@@ -8,23 +8,25 @@ from typing import List, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.base import get_db
+from app.core.config import settings
+from app.db.base import get_async_db
 from app.db.models import Role, User
 from app.services.auth_service import AuthService
 
 security = HTTPBearer()
 
 
-def get_current_user(
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Get current authenticated user."""
     try:
         auth_service = AuthService(db)
-        return auth_service.get_current_user(credentials.credentials)
+        return await auth_service.get_current_user(credentials.credentials)
     except HTTPException:
         raise
     except Exception as e:
@@ -35,7 +37,9 @@ def get_current_user(
         )
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_active_user(
+    current_user: User = Depends(get_current_user),
+) -> User:
     """Get current active user."""
     if not current_user.is_active:
         raise HTTPException(
@@ -44,16 +48,25 @@ def get_current_active_user(current_user: User = Depends(get_current_user)) -> U
     return current_user
 
 
+async def get_user_role_name(user: User, db: AsyncSession) -> Optional[str]:
+    """Get the role name used for authorization checks."""
+    if settings.auth_stateless:
+        # En modo stateless el rol viene de los claims del JWT
+        return user.role.name if user.role else None  # type:ignore
+    role = await db.scalar(select(Role).where(Role.id == user.role_id))
+    return role.name if role else None  # type:ignore
+
+
 def require_roles(required_roles: List[str]):
     """Dependency to require specific roles."""
 
-    def role_checker(
+    async def role_checker(
         current_user: User = Depends(get_current_active_user),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
     ) -> User:
         # Get user role
-        role = db.query(Role).filter(Role.id == current_user.role_id).first()
-        if not role or role.name not in required_roles:
+        role_name = await get_user_role_name(current_user, db)
+        if role_name not in required_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required roles: {', '.join(required_roles)}",
@@ -63,12 +76,13 @@ def require_roles(required_roles: List[str]):
     return role_checker
 
 
-def require_admin(
-    current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)
+async def require_admin(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Require admin role."""
-    role = db.query(Role).filter(Role.id == current_user.role_id).first()
-    if not role or role.name != "admin":
+    role_name = await get_user_role_name(current_user, db)
+    if role_name != "admin":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied. Admin role required.",
@@ -76,12 +90,13 @@ def require_admin(
     return current_user
 
 
-def require_organizer(
-    current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)
+async def require_organizer(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Require organizer role."""
-    role = db.query(Role).filter(Role.id == current_user.role_id).first()
-    if not role or role.name not in ["admin", "organizer"]:
+    role_name = await get_user_role_name(current_user, db)
+    if role_name not in ["admin", "organizer"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied. Organizer role required.",
@@ -89,12 +104,13 @@ def require_organizer(
     return current_user
 
 
-def require_moderator(
-    current_user: User = Depends(get_current_active_user), db: Session = Depends(get_db)
+async def require_moderator(
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db),
 ) -> User:
     """Require moderator role."""
-    role = db.query(Role).filter(Role.id == current_user.role_id).first()
-    if not role or role.name not in ["admin", "moderator"]:
+    role_name = await get_user_role_name(current_user, db)
+    if role_name not in ["admin", "moderator"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied. Moderator role required.",
@@ -102,9 +118,9 @@ def require_moderator(
     return current_user
 
 
-def optional_auth(
+async def optional_auth(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> Optional[User]:
     """Optional authentication - returns user if authenticated, None otherwise."""
     if not credentials:
@@ -112,6 +128,6 @@ def optional_auth(
 
     try:
         auth_service = AuthService(db)
-        return auth_service.get_current_user(credentials.credentials)
+        return await auth_service.get_current_user(credentials.credentials)
     except HTTPException:
         return None
@@ -9,10 +9,12 @@ from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from app.api.schemas.error_schemas import ErrorDetail, ErrorResponse
 from app.core.exceptions import BaseAPIException
+from app.core.metrics import record_exception
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Manejador para errores de validación de Pydantic"""
+    record_exception("validation", exc)
     details = []
 
     for error in exc.errors():
@@ -42,11 +44,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 async def custom_exception_handler(request: Request, exc: BaseAPIException):
     """Manejador para excepciones personalizadas de la API"""
+    record_exception("custom", exc)
     return JSONResponse(status_code=exc.status_code, content=exc.detail)
 
 
 async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
     """Manejador para errores de SQLAlchemy"""
+    record_exception("sqlalchemy", exc)
     error_message = "Error en la base de datos"
 
     if isinstance(exc, IntegrityError):
@@ -72,6 +76,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
 
 async def general_exception_handler(request: Request, exc: Exception):
     """Manejador general para cualquier excepción no manejada"""
+    record_exception("general", exc)
     error_response = ErrorResponse(
         success=False,
         error="Internal Server Error",
@@ -92,6 +97,7 @@ async def http_exception_handler(
     request: Request, exc: Union[Exception, BaseAPIException]
 ):
     """Manejador para excepciones HTTP estándar"""
+    record_exception("http", exc)
     if hasattr(exc, "status_code") and hasattr(exc, "detail"):
         # Si ya es una excepción estructurada, la devolvemos tal como está
         if isinstance(exc.detail, dict) and "success" in exc.detail:
@@ -0,0 +1,300 @@
+"""
+Prometheus metrics module.
+
+Minimal in-process metrics (counters, gauges and histograms) rendered in the
+Prometheus text exposition format by ``GET /metrics``. Updating a metric is a
+dict lookup under a lock, so the instrumentation stays cheap on every request.
+Values are per worker process.
+"""
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# Buckets en segundos para la latencia HTTP y el tiempo de base de datos
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return self._header() + list(self.samples())
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    type_name = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels: str, value: float) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = LATENCY_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(buckets)
+        # Por etiquetas: [cuentas por bucket..., suma, total]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, *labels: str, value: float) -> None:
+        with self._lock:
+            data = self._values.get(labels)
+            if data is None:
+                data = self._values[labels] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[i] += 1
+                    break
+            data[-2] += value
+            data[-1] += 1
+
+    def count(self, *labels: str) -> int:
+        data = self._values.get(labels)
+        return int(data[-1]) if data else 0
+
+    def sum(self, *labels: str) -> float:
+        data = self._values.get(labels)
+        return data[-2] if data else 0.0
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = [(labels, list(data)) for labels, data in self._values.items()]
+        names = self.labelnames + ("le",)
+        for labels, data in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, data):
+                cumulative += bucket_count
+                le = _format_labels(names, labels + (_format_value(float(bound)),))
+                yield f"{self.name}_bucket{le} {cumulative}"
+            inf = _format_labels(names, labels + ("+Inf",))
+            yield f"{self.name}_bucket{inf} {int(data[-1])}"
+            plain = _format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{plain} {_format_value(float(data[-2]))}"
+            yield f"{self.name}_count{plain} {int(data[-1])}"
+
+
+class MetricsRegistry:
+    """Holds the metrics and the collectors evaluated at scrape time."""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], Iterable[_Metric]]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[_Metric]]) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            for metric in collector():
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.register(
+    Counter(
+        "http_requests_total",
+        "HTTP requests by method, route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_LATENCY = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by method and route template.",
+        ("method", "route"),
+    )
+)
+HTTP_IN_PROGRESS = registry.register(
+    Gauge(
+        "http_requests_in_progress",
+        "HTTP requests currently being served.",
+        ("method",),
+    )
+)
+DB_QUERIES_PER_REQUEST = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "Database statements executed per HTTP request.",
+        ("method", "route"),
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+DB_TIME_PER_REQUEST = registry.register(
+    Histogram(
+        "http_request_db_seconds",
+        "Time spent in database statements per HTTP request.",
+        ("method", "route"),
+    )
+)
+EXCEPTIONS = registry.register(
+    Counter(
+        "http_exceptions_total",
+        "Exceptions turned into responses, by error handler and exception type.",
+        ("handler", "exception"),
+    )
+)
+
+
+def record_exception(handler: str, exc: Exception) -> None:
+    """Count an exception handled by ``handler``."""
+    EXCEPTIONS.inc(handler, type(exc).__name__)
+
+
+class RequestDBStats:
+    """Statements and database time of the current request."""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+_request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar(
+    "request_db_stats", default=None
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _request_db_stats.get() is not None:
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_db_stats.get()
+    if stats is None:
+        return
+    started = conn.info.get("query_start_time")
+    if started:
+        stats.seconds += time.perf_counter() - started.pop()
+    stats.queries += 1
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request metrics per route template.
+
+    Paths that match no route are grouped under ``unmatched`` so unknown URLs
+    cannot blow up the number of series.
+    """
+
+    def __init__(self, app, exclude_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        self.exclude_paths = set(exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestDBStats()
+        token = _request_db_stats.set(stats)
+        HTTP_IN_PROGRESS.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_PROGRESS.dec(method)
+            _request_db_stats.reset(token)
+
+            route = scope.get("route")
+            route_name = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUESTS.inc(method, route_name, str(status_code))
+            HTTP_LATENCY.observe(method, route_name, value=elapsed)
+            DB_QUERIES_PER_REQUEST.observe(method, route_name, value=stats.queries)
+            DB_TIME_PER_REQUEST.observe(method, route_name, value=stats.seconds)
@@ -0,0 +1,52 @@
+"""
+JSON response helpers.
+
+``DefaultJSONResponse`` renders with orjson when it is installed (stdlib json
+otherwise) and is the app's default response class. ``model_response``
+serializes already validated schemas straight to JSON with pydantic-core, so
+endpoints returning trusted internal models skip FastAPI's second validation
+pass against ``response_model`` (which stays declared for the OpenAPI docs).
+"""
+
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: se usa el json de la stdlib
+    orjson = None
+
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+# Any serializa cada modelo con su propia clase (subclases incluidas)
+_ANY = TypeAdapter(Any)
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize schemas, lists of schemas or plain data to JSON bytes."""
+    if isinstance(content, BaseModel) or (
+        isinstance(content, list) and all(isinstance(i, BaseModel) for i in content)
+    ):
+        return _ANY.dump_json(content)
+    if orjson is not None:
+        return orjson.dumps(jsonable_encoder(content))
+    return json.dumps(jsonable_encoder(content)).encode()
+
+
+def model_response(
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """JSON response for trusted schemas, without re-validating them."""
+    return Response(
+        content=dump_json(content),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,50 @@
+"""
+Production server configuration.
+
+Resolves the number of worker processes and the uvicorn options from
+``Settings``. ``gunicorn.conf.py`` uses it to run the app on gunicorn with
+uvicorn workers; ``python -m app.core.server`` runs uvicorn's own process
+manager instead, for hosts without gunicorn.
+"""
+
+import os
+from typing import Any, Dict
+
+from app.core.config import settings
+
+
+def worker_count() -> int:
+    """Worker processes of the server: ``WEB_CONCURRENCY`` or one per CPU."""
+    if settings.web_concurrency > 0:
+        return settings.web_concurrency
+    return os.cpu_count() or 1
+
+
+def uvicorn_config() -> Dict[str, Any]:
+    """Event loop and HTTP parser of every uvicorn worker."""
+    return {"loop": settings.server_loop, "http": settings.server_http}
+
+
+def main() -> None:
+    """
+    Run uvicorn with ``--workers``.
+
+    uvicorn has no max-requests jitter and, depending on the version, does not
+    replace workers that exit, so worker recycling is left to gunicorn.
+    """
+    import uvicorn
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=worker_count(),
+        backlog=settings.server_backlog,
+        timeout_keep_alive=settings.server_keepalive,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        **uvicorn_config(),
+    )
+
+
+if __name__ == "__main__":
+    main()
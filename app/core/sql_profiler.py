@@ -0,0 +1,170 @@
+"""
+SQL profiler module.
+
+Records the statements executed while serving a request (or inside a
+``profile_queries`` block) and flags requests that exceed a query budget or
+repeat the same statement many times, the usual signature of an N+1 pattern.
+Meant for debug and staging; it is only installed when
+``SQL_PROFILER_ENABLED`` is set.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryProfile:
+    """Statements, count and database time of a profiled block."""
+
+    def __init__(self, keep_parameters: bool = False):
+        self.queries = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()
+        # (sentencia, parámetros) en orden, sólo si se piden (p.ej. para EXPLAIN)
+        self.keep_parameters = keep_parameters
+        self.executed: List[Tuple[str, Any]] = []
+
+    def record(self, statement: str, elapsed: float, parameters: Any = None) -> None:
+        self.queries += 1
+        self.seconds += elapsed
+        # Los parámetros van aparte: el N+1 repite exactamente el mismo SQL
+        self.statements[" ".join(statement.split())] += 1
+        if self.keep_parameters:
+            self.executed.append((statement, parameters))
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most repeated first."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def violations(self, max_queries: int, max_repeats: int) -> List[str]:
+        """Human readable list of budget violations (empty when within budget)."""
+        problems = []
+        if self.queries > max_queries:
+            problems.append(f"{self.queries} queries (budget {max_queries})")
+        for statement, count in self.repeated(max_repeats + 1):
+            problems.append(f"statement repeated {count} times: {statement[:200]}")
+        return problems
+
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "sql_profile", default=None
+)
+# Perfiles que capturan cualquier sentencia, sea cual sea el contexto (tests)
+_global_profiles: List[QueryProfile] = []
+
+
+def _active_profiles() -> List[QueryProfile]:
+    profile = _current_profile.get()
+    if profile is None:
+        return _global_profiles
+    return [profile] + _global_profiles
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile.get() is not None or _global_profiles:
+        conn.info.setdefault("profiler_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("profiler_start_time")
+    if not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    for profile in _active_profiles():
+        profile.record(statement, elapsed, parameters)
+
+
+@contextmanager
+def profile_queries(
+    capture_all: bool = False, keep_parameters: bool = False
+) -> Iterator[QueryProfile]:
+    """
+    Profile the statements executed inside the block.
+
+    With ``capture_all`` statements from any thread or task are recorded,
+    which is what tests driving the app through ``TestClient`` need. With
+    ``keep_parameters`` each statement and its parameters are also kept in
+    ``QueryProfile.executed``.
+    """
+    profile = QueryProfile(keep_parameters)
+    if capture_all:
+        _global_profiles.append(profile)
+        try:
+            yield profile
+        finally:
+            _global_profiles.remove(profile)
+    else:
+        token = _current_profile.set(profile)
+        try:
+            yield profile
+        finally:
+            _current_profile.reset(token)
+
+
+class SQLProfilerMiddleware:
+    """
+    ASGI middleware that profiles the SQL of every request.
+
+    Adds ``X-DB-Queries`` and ``X-DB-Time-ms`` headers and logs a warning when
+    the request exceeds the query budget or repeats a statement.
+    """
+
+    def __init__(
+        self,
+        app,
+        max_queries: Optional[int] = None,
+        max_repeats: Optional[int] = None,
+    ):
+        self.app = app
+        self.max_queries = (
+            settings.sql_profiler_max_queries if max_queries is None else max_queries
+        )
+        self.max_repeats = (
+            settings.sql_profiler_max_repeats if max_repeats is None else max_repeats
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(profile.queries).encode()))
+                    headers.append(
+                        (b"x-db-time-ms", f"{profile.seconds * 1000:.1f}".encode())
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        problems = profile.violations(self.max_queries, self.max_repeats)
+        if problems:
+            logger.warning(
+                "SQL budget exceeded on %s %s (%d queries, %.1f ms): %s",
+                scope["method"],
+                scope["path"],
+                profile.queries,
+                profile.seconds * 1000,
+                "; ".join(problems),
+            )
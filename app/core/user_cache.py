@@ -0,0 +1,70 @@
+"""
+Authenticated user cache module.
+
+This module keeps a short-TTL, in-process snapshot of the users seen by the
+stateless auth mode, so authenticated requests can skip the ``users`` lookup.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.db.models import Role, User
+
+
+class UserCache:
+    """In-process LRU of user snapshots with a short TTL."""
+
+    def __init__(self, ttl: int = 30, max_entries: int = 10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+
+    def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """Return the snapshot of a user, or None if missing or expired."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        snapshot, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(user_id, None)
+            return None
+        self._entries.move_to_end(user_id)
+        return snapshot
+
+    def set(self, user: User) -> Dict[str, Any]:
+        """Store a snapshot of the user's columns and return it."""
+        # Se guarda una copia de los valores y no el objeto ORM, que
+        # pertenece a la sesión de otra petición
+        snapshot = {
+            column.key: getattr(user, column.key) for column in User.__table__.columns
+        }
+        snapshot["role_name"] = user.role.name if user.role else None
+        self._entries[int(user.id)] = (snapshot, time.monotonic() + self.ttl)  # type:ignore
+        self._entries.move_to_end(int(user.id))  # type:ignore
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, user_id: int) -> None:
+        """Drop the snapshot of a user."""
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every snapshot."""
+        self._entries.clear()
+
+
+def build_user(snapshot: Dict[str, Any], role_name: Optional[str]) -> User:
+    """Build a transient (session-less) ``User`` from a cached snapshot."""
+    data = {key: value for key, value in snapshot.items() if key != "role_name"}
+    user = User(**data)
+    if role_name:
+        user.role = Role(id=snapshot["role_id"], name=role_name)  # type:ignore
+    return user
+
+
+user_cache = UserCache(
+    ttl=settings.auth_user_cache_ttl, max_entries=settings.auth_user_cache_max_entries
+)
@@ -0,0 +1,15 @@
+"""
+Gunicorn worker classes.
+
+Requires gunicorn; imported by gunicorn through ``worker_class`` only.
+"""
+
+from uvicorn.workers import UvicornWorker
+
+from app.core.server import uvicorn_config
+
+
+class ConfiguredUvicornWorker(UvicornWorker):
+    """Uvicorn worker using the event loop and HTTP parser from Settings."""
+
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, **uvicorn_config()}
@@ -1,25 +1,93 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.db.pool import engine_options
+
+# Drivers asíncronos equivalentes a los síncronos configurados en database_url
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Translate a sync database URL into its async driver equivalent."""
+    scheme, separator, rest = database_url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{separator}{rest}"
+
 
 # Create SQLAlchemy engine with proper encoding for PostgreSQL
 
     # PostgreSQL configuration with explicit UTF-8 encoding
-engine = create_engine(settings.database_url)
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Motor asíncrono usado por la API para no bloquear el event loop
+ASYNC_DATABASE_URL = settings.async_database_url or get_async_database_url(
+    settings.database_url
+)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, **engine_options(ASYNC_DATABASE_URL, is_async=True)
+)
+
+# Create AsyncSessionLocal class
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
+# Réplica de lectura opcional; sin ella las lecturas van al primario
+if settings.replica_database_url:
+    REPLICA_ASYNC_DATABASE_URL = get_async_database_url(settings.replica_database_url)
+    replica_async_engine = create_async_engine(
+        REPLICA_ASYNC_DATABASE_URL,
+        **engine_options(REPLICA_ASYNC_DATABASE_URL, is_async=True),
+    )
+else:
+    replica_async_engine = None
+
+ReadSessionLocal = (
+    async_sessionmaker(
+        bind=replica_async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+    if replica_async_engine is not None
+    else AsyncSessionLocal
+)
+
 # Create Base class
 Base = declarative_base()
 
 
 def get_db():
-    """Dependency to get database session."""
+    """Dependency to get database session (scripts, seeds and migrations)."""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency to get an async database session for API requests."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    """
+    Dependency to get an async session for read-only endpoints.
+
+    Uses the read replica when ``REPLICA_DATABASE_URL`` is set. Replicas may
+    lag behind the primary, so writes and read-after-write flows must keep
+    using ``get_async_db``.
+    """
+    async with ReadSessionLocal() as db:
+        yield db
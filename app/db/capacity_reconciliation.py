@@ -0,0 +1,56 @@
+"""
+Capacity reconciliation for the Events API database.
+
+This module compares the denormalized ``events.registered_participants``
+counter with the real sum of ``event_registrations.number_of_participants``
+and optionally repairs any drift.
+"""
+
+from typing import List
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.db.models import Event, EventRegistration
+
+
+def _registered_sum():
+    """Correlated SUM of participants for each event row."""
+    return (
+        select(func.coalesce(func.sum(EventRegistration.number_of_participants), 0))
+        .where(EventRegistration.event_id == Event.id)
+        .scalar_subquery()
+    )
+
+
+def find_capacity_mismatches(db: Session) -> List[dict]:
+    """Return the events whose counter differs from the real registrations."""
+    real_sum = _registered_sum().label("real_registered")
+    rows = db.execute(
+        select(Event.id, Event.title, Event.registered_participants, real_sum).where(
+            Event.registered_participants != real_sum
+        )
+    ).all()
+
+    return [
+        {
+            "event_id": row.id,
+            "title": row.title,
+            "counter": row.registered_participants,
+            "actual": row.real_registered,
+        }
+        for row in rows
+    ]
+
+
+def fix_capacity_mismatches(db: Session) -> int:
+    """Reset every drifted counter to the real sum and return how many changed."""
+    real_sum = _registered_sum()
+    result = db.execute(
+        update(Event)
+        .where(Event.registered_participants != real_sum)
+        .values(registered_participants=real_sum, updated_at=Event.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount or 0
@@ -1,4 +1,16 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -7,6 +19,17 @@ from app.db.base import Base
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Soporta la paginación por cursor (start_date, id)
+        Index("ix_events_start_date_id", "start_date", "id"),
+        # Índice parcial para los próximos eventos activos
+        Index(
+            "ix_events_active_start_date",
+            "start_date",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(255), nullable=False, index=True)
@@ -15,6 +38,10 @@ class Event(Base):
     start_date = Column(DateTime, nullable=False)
     end_date = Column(DateTime, nullable=False)
     capacity = Column(Integer, nullable=False, default=0)
+    # Contador desnormalizado de SUM(event_registrations.number_of_participants)
+    registered_participants = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -22,3 +49,45 @@ class Event(Base):
     # Relationships
     registrations = relationship("EventRegistration", back_populates="event")
     sessions = relationship("Session", back_populates="event")
+
+
+# Índice FTS5 para la búsqueda de texto en SQLite (tests y desarrollo local).
+# En PostgreSQL la búsqueda usa la columna search_vector creada por Alembic.
+_SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+        title, location, content='events', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, title, location)
+        VALUES (new.id, new.title, new.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, location)
+        VALUES ('delete', old.id, old.title, old.location);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, title, location)
+        VALUES ('delete', old.id, old.title, old.location);
+        INSERT INTO events_fts(rowid, title, location)
+        VALUES (new.id, new.title, new.location);
+    END
+    """,
+]
+
+for _statement in _SQLITE_FTS_DDL:
+    event.listen(
+        Event.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite")
+    )
+event.listen(
+    Event.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS events_fts").execute_if(dialect="sqlite"),
+)
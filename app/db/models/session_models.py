@@ -1,4 +1,13 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -7,6 +16,13 @@ from app.db.base import Base
 
 class Session(Base):
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Soporta la paginación por cursor (start_time, id)
+        Index("ix_sessions_start_time_id", "start_time", "id"),
+        # Sesiones de un evento por horario: listados y detección de conflictos
+        Index("ix_sessions_event_id_start_time", "event_id", "start_time"),
+        Index("ix_sessions_speaker_id", "speaker_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(255), nullable=False)
@@ -18,7 +18,9 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False)
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False, index=True)
+    # Se incrementa para revocar todos los tokens emitidos al usuario
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     role = relationship("Role", back_populates="users")
@@ -0,0 +1,211 @@
+"""
+Connection pool configuration and metrics.
+
+Builds the pool options of the engines from ``Settings`` and instruments the
+queue pools so each worker can report checked-out connections, time spent
+waiting for a connection and overflow usage.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.core.server import worker_count
+
+
+class PoolMetrics:
+    """Counters of a connection pool for the current worker process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.overflow_checkouts = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+
+    def _record_wait(self, wait: float) -> None:
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+
+    def record_checkout(self, wait: float, overflow: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._record_wait(wait)
+            if overflow:
+                self.overflow_checkouts += 1
+
+    def record_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self._record_wait(wait)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                # Incluye las esperas que acabaron en timeout
+                "wait_seconds_avg": round(self.wait_seconds_total / attempts, 6)
+                if attempts
+                else 0.0,
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout; ``metrics`` is shared by the pools of the class."""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type:ignore
+        except PoolTimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+        # Por encima de pool_size la conexión sale del overflow
+        overflow = self.checkedout() > self.size()  # type:ignore
+        self.metrics.record_checkout(time.perf_counter() - started, overflow)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool of the sync engine (scripts, seeds and migrations)."""
+
+    metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """Queue pool of the async engine used by the API."""
+
+    metrics = PoolMetrics()
+
+
+def _statement_timeout_args(drivername: str) -> Dict[str, Any]:
+    """Driver-specific connect_args that set statement_timeout per connection."""
+    timeout = str(settings.db_statement_timeout_ms)
+    if drivername.endswith("asyncpg"):
+        return {"server_settings": {"statement_timeout": timeout}}
+    return {"options": f"-c statement_timeout={timeout}"}
+
+
+def pool_limits() -> Tuple[int, int]:
+    """
+    ``(pool_size, max_overflow)`` of one worker process.
+
+    With ``DB_MAX_CONNECTIONS`` the server-wide budget is split between the
+    workers, so ``workers * (pool_size + max_overflow)`` never exceeds it.
+    """
+    pool_size, max_overflow = settings.db_pool_size, settings.db_max_overflow
+    if settings.db_max_connections > 0:
+        per_worker = max(settings.db_max_connections // worker_count(), 1)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = min(max_overflow, per_worker - pool_size)
+    return pool_size, max_overflow
+
+
+def engine_options(database_url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Keyword arguments for ``create_engine``/``create_async_engine``.
+
+    SQLite keeps SQLAlchemy's default pool; the pool settings only apply to
+    server databases.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        return {}
+
+    pool_size, max_overflow = pool_limits()
+    options: Dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    if settings.db_statement_timeout_ms:
+        options["connect_args"] = _statement_timeout_args(url.drivername)
+    return options
+
+
+def pool_status(engine: Engine) -> Dict[str, Any]:
+    """Current occupancy of the engine's pool plus its checkout metrics."""
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, _InstrumentedPoolMixin):
+        status.update(pool.metrics.snapshot())
+    return status
+
+
+def pool_report(**engines: Engine) -> Dict[str, Any]:
+    """Pool status of each named engine for this worker process."""
+    return {
+        "pid": os.getpid(),
+        "engines": {name: pool_status(engine) for name, engine in engines.items()},
+    }
+
+
+def pool_metrics(**engines: Engine):
+    """Prometheus gauges and counters for the pools, built at scrape time."""
+    from app.core.metrics import Counter, Gauge
+
+    gauges = {
+        "size": Gauge("db_pool_size", "Configured pool size.", ("engine",)),
+        "checked_out": Gauge(
+            "db_pool_checked_out", "Connections currently checked out.", ("engine",)
+        ),
+        "overflow": Gauge(
+            "db_pool_overflow", "Overflow connections currently open.", ("engine",)
+        ),
+    }
+    counters = {
+        "checkouts": Counter(
+            "db_pool_checkouts_total", "Connection checkouts.", ("engine",)
+        ),
+        "overflow_checkouts": Counter(
+            "db_pool_overflow_checkouts_total",
+            "Checkouts served by an overflow connection.",
+            ("engine",),
+        ),
+        "timeouts": Counter(
+            "db_pool_timeouts_total", "Checkouts that timed out.", ("engine",)
+        ),
+        "wait_seconds_total": Counter(
+            "db_pool_wait_seconds_total",
+            "Time spent waiting for a connection.",
+            ("engine",),
+        ),
+    }
+    for name, engine in engines.items():
+        status = pool_status(engine)
+        for key, gauge in gauges.items():
+            if key in status:
+                gauge.set(name, value=status[key])
+        for key, counter in counters.items():
+            if key in status:
+                counter.inc(name, amount=status[key])
+    return list(gauges.values()) + list(counters.values())
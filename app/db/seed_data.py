@@ -5,9 +5,13 @@ This module provides functions to populate the database with initial data
 for development and testing purposes.
 """
 
+import csv
+import io
+import itertools
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, Iterable, List, Sequence
 
+from sqlalchemy import func, insert, select, text
 from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
@@ -45,6 +49,8 @@ def create_seed_data(db: Session):
     print("📝 Creating event registrations...")
     create_event_registrations(db, events, users)
 
+    # Un único commit: cada tabla se inserta en lote con el flush
+    db.commit()
     print("✅ Seed data created successfully!")
     print_summary(db)
 
@@ -64,13 +70,9 @@ def create_roles(db: Session) -> dict:
         },
     ]
 
-    roles = {}
-    for role_data in roles_data:
-        role = Role(name=role_data["name"])
-        db.add(role)
-        db.commit()
-        db.refresh(role)
-        roles[role_data["name"]] = role
+    roles = {role_data["name"]: Role(name=role_data["name"]) for role_data in roles_data}
+    db.add_all(roles.values())
+    db.flush()
 
     return roles
 
@@ -170,22 +172,26 @@ def create_users(db: Session, roles: dict) -> dict:
         },
     ]
 
+    # bcrypt es lento a propósito: cada contraseña distinta se hashea una sola vez
+    hashes = {
+        password: get_password_hash(password)
+        for password in {user_data["password"] for user_data in users_data}
+    }
+
     users = {}
     for user_data in users_data:
-        user = User(
+        users[user_data["username"]] = User(
             username=user_data["username"],
             first_name=user_data["first_name"],
             last_name=user_data["last_name"],
             phone=user_data["phone"],
             email=user_data["email"],
-            password=get_password_hash(user_data["password"]),
+            password=hashes[user_data["password"]],
             is_active=user_data["is_active"],
             role_id=roles[user_data["role"]].id,
         )
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-        users[user_data["username"]] = user
+    db.add_all(users.values())
+    db.flush()
 
     return users
 
@@ -259,13 +265,11 @@ def create_speakers(db: Session) -> dict:
         },
     ]
 
-    speakers = {}
-    for speaker_data in speakers_data:
-        speaker = Speaker(**speaker_data)
-        db.add(speaker)
-        db.commit()
-        db.refresh(speaker)
-        speakers[speaker_data["name"]] = speaker
+    speakers = {
+        speaker_data["name"]: Speaker(**speaker_data) for speaker_data in speakers_data
+    }
+    db.add_all(speakers.values())
+    db.flush()
 
     return speakers
 
@@ -385,13 +389,9 @@ def create_events(db: Session) -> List[Event]:
         },
     ]
 
-    events = []
-    for event_data in events_data:
-        event = Event(**event_data)
-        db.add(event)
-        db.commit()
-        db.refresh(event)
-        events.append(event)
+    events = [Event(**event_data) for event_data in events_data]
+    db.add_all(events)
+    db.flush()
 
     return events
 
@@ -506,8 +506,8 @@ def create_sessions(db: Session, events: List[Event], speakers: dict):
         },
     ]
 
-    for session_data in sessions_data:
-        session = EventSession(
+    db.add_all(
+        EventSession(
             title=session_data["title"],
             description=session_data["description"],
             start_time=session_data["start_time"],
@@ -516,9 +516,9 @@ def create_sessions(db: Session, events: List[Event], speakers: dict):
             speaker_id=session_data["speaker"].id,
             is_active=session_data["is_active"],
         )
-        db.add(session)
-
-    db.commit()
+        for session_data in sessions_data
+    )
+    db.flush()
 
 
 def create_event_registrations(db: Session, events: List[Event], users: dict):
@@ -571,8 +571,272 @@ def create_event_registrations(db: Session, events: List[Event], users: dict):
             number_of_participants=reg_data["participants"],
         )
         db.add(registration)
+        reg_data["event"].registered_participants += reg_data["participants"]
+
+    db.flush()
+
+
+# Datos sintéticos a escala para benchmarks y pruebas de carga
+BENCHMARK_PASSWORD = "benchmark123"
+BENCHMARK_ORGANIZER = "bench_organizer"
+SCALED_TOPICS = [
+    "Python", "Cloud", "Data", "Security", "DevOps", "Frontend", "Mobile",
+    "AI", "Blockchain", "UX", "Startup", "Marketing", "Robotics", "Green Tech",
+]
+SCALED_KINDS = ["Summit", "Conference", "Workshop", "Meetup", "Bootcamp", "Forum"]
+SCALED_CITIES = [
+    "Madrid", "Barcelona", "Valencia", "Sevilla", "Bilbao", "Zaragoza",
+    "Málaga", "Granada", "Santander", "Salamanca",
+]
+SCALED_SESSIONS_PER_EVENT = 3
+
+
+def scaled_counts(scale: int) -> Dict[str, int]:
+    """Rows per table for a synthetic dataset of ``scale`` users."""
+    return {
+        "users": scale,
+        "speakers": max(scale // 1000, 10),
+        "events": max(scale // 20, 20),
+        "sessions": max(scale // 20, 20) * SCALED_SESSIONS_PER_EVENT,
+        "registrations": scale,
+    }
+
+
+def _reserve_ids(db: Session, model, count: int) -> List[int]:
+    """Reserve ``count`` primary keys so related rows can be written in bulk."""
+    table = model.__table__
+    if db.get_bind().dialect.name == "postgresql":
+        # Avanza la secuencia igual que lo harían los INSERT
+        return list(
+            db.scalars(
+                text(
+                    "SELECT nextval(pg_get_serial_sequence(:table, 'id')) "
+                    "FROM generate_series(1, :count)"
+                ),
+                {"table": table.name, "count": count},
+            )
+        )
+    last_id = db.scalar(select(func.coalesce(func.max(table.c.id), 0)))
+    return list(range(last_id + 1, last_id + 1 + count))
+
+
+def _copy_rows(db: Session, table, columns: Sequence[str], rows: List[tuple]) -> None:
+    """Stream rows into ``table`` with PostgreSQL ``COPY ... FROM STDIN``."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _write_rows(
+    db: Session,
+    model,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    batch_size: int,
+) -> int:
+    """
+    Write ``rows`` (tuples in ``columns`` order) in batches of ``batch_size``.
+
+    Uses ``COPY`` on PostgreSQL (psycopg2) and a multi-row ``executemany``
+    ``INSERT`` elsewhere. Rows are consumed lazily so millions of them never
+    live in memory at once. Returns the number of rows written.
+    """
+    table = model.__table__
+    use_copy = db.get_bind().dialect.driver == "psycopg2"
+    statement = insert(table)
+    written = 0
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return written
+        if use_copy:
+            _copy_rows(db, table, columns, batch)
+        else:
+            db.execute(statement, [dict(zip(columns, row)) for row in batch])
+        written += len(batch)
+
+
+def _get_or_create_role(db: Session, name: str) -> int:
+    role = db.scalar(select(Role).where(Role.name == name))
+    if not role:
+        role = Role(name=name)
+        db.add(role)
+        db.flush()
+    return int(role.id)
+
+
+def create_scaled_seed_data(db: Session, scale: int, batch_size: int = 10000) -> dict:
+    """
+    Create a synthetic dataset for load tests.
+
+    ``scale`` users (``bench_user_<n>``) and an organizer (``bench_organizer``)
+    share ``BENCHMARK_PASSWORD``, hashed once. Events are spread over the next
+    year with three sessions each, and every user holds one registration.
+    Primary keys are reserved up front and rows are streamed in batches
+    (``COPY`` on PostgreSQL). Returns the ids created per table.
+    """
+    counts = scaled_counts(scale)
+    now = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+    password = get_password_hash(BENCHMARK_PASSWORD)
+
+    user_role = _get_or_create_role(db, "user")
+    organizer_role = _get_or_create_role(db, "organizer")
+
+    print(f"👥 Creating {counts['users']} users...")
+    user_ids = _reserve_ids(db, User, counts["users"] + 1)
+    users = (
+        (
+            user_ids[n],
+            f"bench_user_{n}",
+            "Bench",
+            f"User {n}",
+            f"+34 6{n % 100000000:08d}",
+            f"bench_user_{n}@bench.local",
+            password,
+            True,
+            user_role,
+        )
+        for n in range(counts["users"])
+    )
+    organizer = (
+        user_ids[-1],
+        BENCHMARK_ORGANIZER,
+        "Bench",
+        "Organizer",
+        "+34 600 000 000",
+        "bench_organizer@bench.local",
+        password,
+        True,
+        organizer_role,
+    )
+    _write_rows(
+        db,
+        User,
+        (
+            "id", "username", "first_name", "last_name", "phone",
+            "email", "password", "is_active", "role_id",
+        ),
+        itertools.chain(users, [organizer]),
+        batch_size,
+    )
+
+    print(f"🎤 Creating {counts['speakers']} speakers...")
+    speaker_ids = _reserve_ids(db, Speaker, counts["speakers"])
+    _write_rows(
+        db,
+        Speaker,
+        ("id", "name", "bio", "email", "phone", "company", "is_active"),
+        (
+            (
+                speaker_id,
+                f"Bench Speaker {n}",
+                f"{SCALED_TOPICS[n % len(SCALED_TOPICS)]} practitioner",
+                f"bench_speaker_{n}@bench.local",
+                f"+34 7{n:08d}",
+                f"{SCALED_CITIES[n % len(SCALED_CITIES)]} Labs",
+                True,
+            )
+            for n, speaker_id in enumerate(speaker_ids)
+        ),
+        batch_size,
+    )
+
+    # Cada usuario (salvo el organizador) se registra en un evento: n % events
+    events = counts["events"]
+    per_event, extra = divmod(counts["registrations"], events)
+
+    def participants(n: int) -> int:
+        return per_event + (1 if n < extra else 0)
+
+    def event_start(n: int) -> datetime:
+        return now + timedelta(days=7 + n % 365)
+
+    def event_title(n: int) -> str:
+        return (
+            f"{SCALED_TOPICS[n % len(SCALED_TOPICS)]} "
+            f"{SCALED_KINDS[n % len(SCALED_KINDS)]} {n}"
+        )
+
+    print(f"🎉 Creating {events} events...")
+    event_ids = _reserve_ids(db, Event, events)
+    _write_rows(
+        db,
+        Event,
+        (
+            "id", "title", "description", "location", "start_date", "end_date",
+            "capacity", "registered_participants", "is_active",
+        ),
+        (
+            (
+                event_id,
+                event_title(n),
+                "Synthetic event for load testing",
+                f"Centro de Congresos {SCALED_CITIES[n % len(SCALED_CITIES)]}",
+                event_start(n),
+                event_start(n) + timedelta(hours=12),
+                participants(n) + 500,
+                participants(n),
+                True,
+            )
+            for n, event_id in enumerate(event_ids)
+        ),
+        batch_size,
+    )
+
+    print(f"📅 Creating {counts['sessions']} sessions...")
+    session_ids = _reserve_ids(db, EventSession, counts["sessions"])
+    _write_rows(
+        db,
+        EventSession,
+        ("id", "title", "start_time", "end_time", "event_id", "speaker_id", "is_active"),
+        (
+            (
+                session_ids[n * SCALED_SESSIONS_PER_EVENT + slot],
+                f"{event_title(n)} · Session {slot + 1}",
+                event_start(n) + timedelta(minutes=90 * slot),
+                event_start(n) + timedelta(minutes=90 * slot, hours=1),
+                event_id,
+                speaker_ids[(n + slot) % len(speaker_ids)],
+                True,
+            )
+            for n, event_id in enumerate(event_ids)
+            for slot in range(SCALED_SESSIONS_PER_EVENT)
+        ),
+        batch_size,
+    )
+
+    print(f"📝 Creating {counts['registrations']} registrations...")
+    registration_ids = _reserve_ids(db, EventRegistration, counts["registrations"])
+    _write_rows(
+        db,
+        EventRegistration,
+        ("id", "event_id", "user_id", "number_of_participants"),
+        (
+            (registration_id, event_ids[n % events], user_ids[n], 1)
+            for n, registration_id in enumerate(registration_ids)
+        ),
+        batch_size,
+    )
 
     db.commit()
+    print("✅ Scaled seed data created successfully!")
+    return {
+        "users": user_ids[:-1],
+        "organizer": user_ids[-1],
+        "speakers": speaker_ids,
+        "events": event_ids,
+        "sessions": session_ids,
+        "registrations": registration_ids,
+    }
 
 
 def print_summary(db: Session):
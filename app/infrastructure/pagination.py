@@ -0,0 +1,206 @@
+"""
+Keyset pagination module.
+
+This module provides helpers for cursor (keyset) pagination. Instead of
+``OFFSET``, each page continues after the sort key of the last row, so deep
+pages cost the same as the first one. Cursors are opaque url-safe strings.
+
+It also provides :func:`fetch_counted_page`, which returns a page together
+with its total computed in the same query, estimated or skipped, and
+:func:`count_total` for cursor pages, whose total is only computed on request.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.pagination_schema import CountMode
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of a row as an opaque cursor."""
+    payload = [
+        value.isoformat() if isinstance(value, (date, datetime)) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """
+    Decode a cursor into values typed like the sort columns.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or does not match the columns
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+    if not isinstance(payload, list) or len(payload) != len(columns):
+        raise InvalidCursorError("Invalid cursor")
+
+    values = []
+    for column, value in zip(columns, payload):
+        python_type = column.type.python_type
+        try:
+            if python_type is datetime:
+                value = datetime.fromisoformat(value)
+            elif python_type is date:
+                value = date.fromisoformat(value)
+            elif value is not None:
+                value = python_type(value)
+        except (ValueError, TypeError) as e:
+            raise InvalidCursorError("Invalid cursor") from e
+        values.append(value)
+    return values
+
+
+def apply_keyset(
+    query,
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = False,
+):
+    """
+    Order ``query`` by ``columns`` and continue after ``cursor``.
+
+    One extra row is fetched so :func:`split_keyset_page` can tell whether
+    there is a next page. An empty cursor returns the first page.
+    """
+    if descending:
+        query = query.order_by(*[column.desc() for column in columns])
+    else:
+        query = query.order_by(*[column.asc() for column in columns])
+
+    if cursor:
+        key = tuple_(*columns)
+        values = tuple_(*decode_cursor(cursor, columns))
+        query = query.where(key < values if descending else key > values)
+
+    return query.limit(limit + 1)
+
+
+def split_keyset_page(
+    rows: List[Any], columns: Sequence[Any], limit: int
+) -> Tuple[List[Any], Optional[str]]:
+    """Trim the extra row and build the cursor of the next page."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, column.key) for column in columns])
+
+
+class CountedPage(NamedTuple):
+    """A page of rows and what is known about the total number of matches."""
+
+    rows: List[Any]
+    total: Optional[int]
+    has_next: bool
+    estimated: bool = False
+
+
+async def estimate_count(db: AsyncSession, query) -> Optional[int]:
+    """
+    Estimate the rows returned by ``query`` from the planner statistics.
+
+    Only PostgreSQL exposes estimates through ``EXPLAIN``; returns None on
+    other databases.
+    """
+    connection = await db.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+
+    compiled = query.compile(dialect=connection.dialect)
+    if compiled.positional:
+        params: Any = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", params
+    )
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_total(
+    db: AsyncSession, query, count_mode: CountMode
+) -> Tuple[Optional[int], bool]:
+    """
+    Total rows of ``query`` and whether it is an estimate.
+
+    ``none`` skips counting (None), ``estimated`` uses the planner estimate
+    where available and ``exact`` runs a ``COUNT(*)``.
+    """
+    if count_mode == CountMode.NONE:
+        return None, False
+    if count_mode == CountMode.ESTIMATED:
+        total = await estimate_count(db, query)
+        if total is not None:
+            return total, True
+    count_query = select(func.count()).select_from(query.subquery())
+    return (await db.execute(count_query)).scalar() or 0, False
+
+
+async def fetch_counted_page(
+    db: AsyncSession,
+    query,
+    skip: int,
+    limit: int,
+    count_mode: CountMode = CountMode.EXACT,
+) -> CountedPage:
+    """
+    Fetch a page of ``query`` together with the total number of matches.
+
+    - ``exact``: ``COUNT(*) OVER ()`` is added to the page query itself, so
+      the total costs no extra round trip.
+    - ``estimated``: the planner estimate is used (falls back to exact where
+      the database has no estimates).
+    - ``none``: no total; one extra row tells whether there is a next page.
+    """
+    if count_mode == CountMode.ESTIMATED:
+        total = await estimate_count(db, query.order_by(None))
+        if total is not None:
+            rows, has_next = await _fetch_with_lookahead(db, query, skip, limit)
+            return CountedPage(rows, max(total, skip + len(rows)), has_next, True)
+    elif count_mode == CountMode.NONE:
+        rows, has_next = await _fetch_with_lookahead(db, query, skip, limit)
+        return CountedPage(rows, None, has_next)
+
+    counted = query.add_columns(func.count().over().label("total_count"))
+    result = await db.execute(counted.offset(skip).limit(limit))
+    rows = result.all()
+    if rows:
+        total = rows[0][-1]
+        rows = [tuple(row)[:-1] for row in rows]
+    elif skip:
+        # Página fuera de rango: la ventana no devuelve filas con el total
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total = (await db.execute(count_query)).scalar() or 0
+    else:
+        total = 0
+    return CountedPage(rows, total, skip + len(rows) < total)
+
+
+async def _fetch_with_lookahead(
+    db: AsyncSession, query, skip: int, limit: int
+) -> Tuple[List[Any], bool]:
+    """Fetch one row more than ``limit`` to know whether there is a next page."""
+    result = await db.execute(query.offset(skip).limit(limit + 1))
+    rows = [tuple(row) for row in result.all()]
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,131 @@
+"""
+Streaming record readers module.
+
+This module parses CSV and NDJSON request bodies incrementally: records are
+yielded as soon as their bytes arrive, so an upload is never buffered whole.
+Each record comes with its line number; malformed records are yielded as
+:class:`RecordError` so callers can report them per row and keep going.
+"""
+
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Union
+
+CSV_MEDIA_TYPES = ("text/csv", "application/csv")
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# csv.Error de un registro cuyo campo entrecomillado sigue abierto (strict=True)
+UNEXPECTED_END = "unexpected end of data"
+
+
+class RecordError(NamedTuple):
+    """A record that could not be parsed."""
+
+    line: int
+    error: str
+
+
+class Record(NamedTuple):
+    """A parsed record: column name to value (empty CSV values are dropped)."""
+
+    line: int
+    values: Dict[str, Any]
+
+
+def stream_format(content_type: Optional[str]) -> Optional[str]:
+    """``csv`` or ``ndjson`` for a Content-Type header, None if unsupported."""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in CSV_MEDIA_TYPES:
+        return "csv"
+    if media_type in NDJSON_MEDIA_TYPES:
+        return "ndjson"
+    return None
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode UTF-8 chunks (BOM allowed) into lines, keeping the line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        # Sólo \n separa líneas (\r\n incluido); el último trozo puede estar incompleto
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def iter_csv_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[Union[Record, RecordError]]:
+    """
+    Records of a CSV body whose first row is the header.
+
+    Quoted values may span lines: a record is complete once ``csv.reader``
+    parses it without running out of data inside a quoted field.
+    """
+    header: Optional[List[str]] = None
+    pending = ""
+    line = start_line = 0
+    async for text in iter_lines(chunks):
+        line += 1
+        if not pending:
+            start_line = line
+        pending += text
+        if not pending.strip():
+            pending = ""
+            continue
+        try:
+            row = next(csv.reader([pending], strict=True))
+        except csv.Error as e:
+            # Sólo un campo entrecomillado abierto continúa en la línea siguiente;
+            # una comilla suelta dentro de un campo sin comillas es un literal
+            if str(e) == UNEXPECTED_END:
+                continue
+            pending = ""
+            yield RecordError(start_line, f"Invalid CSV: {e}")
+            continue
+        pending = ""
+        if header is None:
+            header = [name.strip() for name in row]
+            continue
+        if len(row) > len(header):
+            yield RecordError(start_line, "More values than header columns")
+            continue
+        yield Record(
+            start_line,
+            {name: value for name, value in zip(header, row) if value.strip()},
+        )
+    if pending:
+        yield RecordError(start_line, "Unterminated quoted value")
+
+
+async def iter_ndjson_records(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[Union[Record, RecordError]]:
+    """Records of a newline-delimited JSON body (one object per line)."""
+    line = 0
+    async for text in iter_lines(chunks):
+        line += 1
+        if not text.strip():
+            continue
+        try:
+            values = json.loads(text)
+        except ValueError as e:
+            yield RecordError(line, f"Invalid JSON: {e}")
+            continue
+        if not isinstance(values, dict):
+            yield RecordError(line, "Each line must be a JSON object")
+            continue
+        yield Record(line, values)
+
+
+def iter_records(
+    chunks: AsyncIterator[bytes], format: str
+) -> AsyncIterator[Union[Record, RecordError]]:
+    """Records of a ``csv`` or ``ndjson`` body."""
+    if format == "csv":
+        return iter_csv_records(chunks)
+    return iter_ndjson_records(chunks)
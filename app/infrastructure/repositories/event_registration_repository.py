@@ -1,74 +1,278 @@
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session, joinedload
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy import and_, case, delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.api.schemas.pagination_schema import CountMode
+from app.db.models.event_models import Event
 from app.db.models.event_register_models import (
     EventRegistration as EventRegistrationModel,
 )
+from app.infrastructure.pagination import apply_keyset, count_total, split_keyset_page
+
+# Los ids crecen con cada registro: (id DESC) equivale a "más recientes primero"
+REGISTRATION_KEYSET = (EventRegistrationModel.id,)
 
 
 class EventRegistrationRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.event_registration_model = EventRegistrationModel
 
-    def get_user_registrations(
+    async def get_user_registrations(
         self, user_id: int, skip: int = 0, page: int = 1, limit: int = 20
     ):
-        return (
-            self.db.query(self.event_registration_model)
+        result = await self.db.execute(
+            select(self.event_registration_model)
             .options(joinedload(self.event_registration_model.event))
-            .filter(self.event_registration_model.user_id == user_id)
+            .where(self.event_registration_model.user_id == user_id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_all_event_registrations(self):
-        return self.db.query(self.event_registration_model).all()
+    async def get_user_registrations_by_cursor(
+        self, user_id: int, cursor: Optional[str] = None, limit: int = 20
+    ) -> Tuple[List[EventRegistrationModel], Optional[str]]:
+        query = apply_keyset(
+            select(self.event_registration_model)
+            .options(joinedload(self.event_registration_model.event))
+            .where(self.event_registration_model.user_id == user_id),
+            REGISTRATION_KEYSET,
+            cursor,
+            limit,
+            descending=True,
+        )
+        result = await self.db.execute(query)
+        return split_keyset_page(
+            list(result.scalars().all()), REGISTRATION_KEYSET, limit
+        )
+
+    async def get_all_event_registrations(self):
+        result = await self.db.execute(select(self.event_registration_model))
+        return list(result.scalars().all())
 
-    def register_user_to_event(self, event_registration: EventRegistrationModel):
+    async def register_user_to_event(self, event_registration: EventRegistrationModel):
         self.db.add(event_registration)
-        self.db.commit()
-        self.db.refresh(event_registration)
+        await self.db.commit()
+        await self.db.refresh(event_registration)
         return event_registration
 
-    def update_event_registration(self, event_registration: EventRegistrationModel):
-        self.db.commit()
-        self.db.refresh(event_registration)
-
-    def get_count_registrations(self):
-        return self.db.query(func.count(self.event_registration_model.id)).scalar() or 0
-    
-    def get_user_is_registered(self, user_id: int, event_id: int):
-        return (
-            self.db.query(EventRegistrationModel)
-            .filter(
+    async def update_event_registration(self, event_registration: EventRegistrationModel):
+        await self.db.commit()
+        await self.db.refresh(event_registration)
+
+    async def get_user_registrations_total(
+        self, user_id: int, count_mode: CountMode
+    ) -> Tuple[Optional[int], bool]:
+        """(total, is_estimate) of a user's registrations, see ``count_total``."""
+        return await count_total(
+            self.db,
+            select(EventRegistrationModel.id).where(
+                EventRegistrationModel.user_id == user_id
+            ),
+            count_mode,
+        )
+
+    async def get_count_registrations(self):
+        result = await self.db.execute(
+            select(func.count(self.event_registration_model.id))
+        )
+        return result.scalar() or 0
+
+    async def get_user_is_registered(self, user_id: int, event_id: int):
+        result = await self.db.execute(
+            select(EventRegistrationModel).where(
                 and_(
-                    EventRegistrationModel.event_id ==event_id,
+                    EventRegistrationModel.event_id == event_id,
                     EventRegistrationModel.user_id == user_id,
                 )
             )
-            .first()
-        )
-
-    def get_capacity_available(self, event_id: int):
-        return (
-            self.db.query(func.sum(EventRegistrationModel.number_of_participants))
-            .filter(EventRegistrationModel.event_id == event_id)
-            .scalar()
-            or 0
-        )
-
-    def delete_registration(self, registration_id: int):
-        self.db.query(EventRegistrationModel).filter(EventRegistrationModel.id == registration_id).delete()
-        self.db.commit()
-        return True
-
-    def get_registration_by_id(self, registration_id: int):
-        return self.db.query(EventRegistrationModel).filter(EventRegistrationModel.id == registration_id).first()
-    
-    def get_event_capacity_info(self, event_id: int):
-        return self.db.query(EventRegistrationModel).filter(EventRegistrationModel.event_id == event_id).first()
-    
-    def get_event_by_id(self, event_id: int):
-        return self.db.query(EventRegistrationModel).filter(EventRegistrationModel.id == event_id).first()
\ No newline at end of file
+        )
+        return result.scalars().first()
+
+    async def get_capacity_available(self, event_id: int):
+        """Get the participants already registered (denormalized counter)."""
+        result = await self.db.execute(
+            select(Event.registered_participants).where(Event.id == event_id)
+        )
+        return result.scalar() or 0
+
+    async def reserve_capacity(self, event_id: int, participants: int) -> bool:
+        """
+        Atomically add participants to the event counter if capacity allows.
+
+        The check and the increment happen in a single conditional UPDATE, so
+        concurrent registrations can never push the counter over capacity.
+        The caller is responsible for committing the transaction.
+        """
+        result = await self.db.execute(
+            update(Event)
+            .where(
+                Event.id == event_id,
+                Event.is_active == True,
+                Event.registered_participants + participants <= Event.capacity,
+            )
+            .values(
+                registered_participants=Event.registered_participants + participants,
+                # El contador no cambia el evento: sin esto onupdate pisaría
+                # updated_at (y su ETag/Last-Modified) en cada registro
+                updated_at=Event.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def lock_events_capacity(self, event_ids: Iterable[int]) -> Dict[int, tuple]:
+        """
+        Lock the given events and return {id: (capacity, registered, is_active)}.
+
+        Rows are locked in id order (SELECT ... FOR UPDATE, a no-op on SQLite)
+        so concurrent batches touching the same events cannot deadlock.
+        """
+        result = await self.db.execute(
+            select(
+                Event.id, Event.capacity, Event.registered_participants, Event.is_active
+            )
+            .where(Event.id.in_(sorted(set(event_ids))))
+            .order_by(Event.id)
+            .with_for_update()
+        )
+        return {row.id: tuple(row)[1:] for row in result}
+
+    async def get_registered_pairs(
+        self, pairs: Iterable[Tuple[int, int]]
+    ) -> Set[Tuple[int, int]]:
+        """The (user_id, event_id) pairs that already have a registration."""
+        pairs = set(pairs)
+        if not pairs:
+            return set()
+        # Filtra por ambas listas (índices de la restricción única y de
+        # user_id) y descarta en Python las combinaciones no pedidas
+        result = await self.db.execute(
+            select(EventRegistrationModel.user_id, EventRegistrationModel.event_id).where(
+                EventRegistrationModel.event_id.in_({event_id for _, event_id in pairs}),
+                EventRegistrationModel.user_id.in_({user_id for user_id, _ in pairs}),
+            )
+        )
+        return {tuple(row) for row in result} & pairs
+
+    async def reserve_capacity_batch(self, participants: Dict[int, int]) -> bool:
+        """
+        Add participants to several event counters in a single UPDATE.
+
+        Guarded like ``reserve_capacity``: returns False (and the caller must
+        roll back) when any event would go over capacity. Caller commits.
+        """
+        added = case(participants, value=Event.id, else_=0)
+        result = await self.db.execute(
+            update(Event)
+            .where(
+                Event.id.in_(list(participants)),
+                Event.is_active == True,
+                Event.registered_participants + added <= Event.capacity,
+            )
+            .values(
+                registered_participants=Event.registered_participants + added,
+                # Ver reserve_capacity
+                updated_at=Event.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == len(participants)
+
+    async def create_registrations(
+        self, rows: List[dict]
+    ) -> Dict[Tuple[int, int], int]:
+        """
+        Insert registrations with one multi-row INSERT.
+
+        Returns {(user_id, event_id): id}; the pairs are unique, so rows are
+        matched without asking the database to keep the parameter order.
+        """
+        result = await self.db.execute(
+            insert(EventRegistrationModel).returning(
+                EventRegistrationModel.user_id,
+                EventRegistrationModel.event_id,
+                EventRegistrationModel.id,
+            ),
+            rows,
+        )
+        return {(row.user_id, row.event_id): row.id for row in result}
+
+    async def release_capacity(self, event_id: int, participants: int) -> None:
+        """Subtract participants from the event counter (caller commits)."""
+        await self.db.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(
+                registered_participants=Event.registered_participants - participants,
+                # Ver reserve_capacity
+                updated_at=Event.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_registration(
+        self, registration_id: int
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Delete a registration and return its (event_id, number_of_participants).
+
+        Returns None when no row was deleted (e.g. a concurrent cancellation
+        got there first), so the caller only releases capacity once. Caller
+        commits.
+        """
+        result = await self.db.execute(
+            delete(EventRegistrationModel)
+            .where(EventRegistrationModel.id == registration_id)
+            .returning(
+                EventRegistrationModel.event_id,
+                EventRegistrationModel.number_of_participants,
+            )
+        )
+        row = result.first()
+        return tuple(row) if row else None
+
+    async def update_participants(
+        self, registration_id: int, current: int, participants: int
+    ) -> bool:
+        """
+        Set ``number_of_participants`` only if it still equals ``current``.
+
+        Returns False when another transaction changed it in between, so the
+        counter delta computed from ``current`` would be wrong. Caller commits.
+        """
+        result = await self.db.execute(
+            update(EventRegistrationModel)
+            .where(
+                EventRegistrationModel.id == registration_id,
+                EventRegistrationModel.number_of_participants == current,
+            )
+            .values(number_of_participants=participants)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def get_registration_by_id(self, registration_id: int):
+        result = await self.db.execute(
+            select(EventRegistrationModel).where(
+                EventRegistrationModel.id == registration_id
+            )
+        )
+        return result.scalars().first()
+
+    async def get_event_capacity_info(self, event_id: int):
+        result = await self.db.execute(
+            select(EventRegistrationModel).where(
+                EventRegistrationModel.event_id == event_id
+            )
+        )
+        return result.scalars().first()
+
+    async def get_event_by_id(self, event_id: int):
+        result = await self.db.execute(
+            select(EventRegistrationModel).where(EventRegistrationModel.id == event_id)
+        )
+        return result.scalars().first()
@@ -1,99 +1,233 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.schemas.event_schemas import EventCreate, EventUpdate
+from app.api.schemas.event_schemas import EVENT_LIST_FIELDS, EventCreate, EventUpdate
+from app.api.schemas.pagination_schema import CountMode
 from app.db.models import Event
 from app.db.models.event_register_models import (
     EventRegistration as EventRegistrationModel,
 )
+from app.infrastructure.pagination import (
+    CountedPage,
+    apply_keyset,
+    count_total,
+    fetch_counted_page,
+    split_keyset_page,
+)
+from app.infrastructure.search import apply_text_search, order_by_title_similarity
+
+# Orden estable usado por la paginación por cursor
+EVENT_KEYSET = (Event.start_date, Event.id)
+
+
+def list_columns(fields: Optional[Sequence[str]], *required) -> list:
+    """
+    Columns selected by a list query; the ORM entity is never loaded whole.
+
+    ``fields`` (all of ``EVENT_LIST_FIELDS`` when None) plus the ``required``
+    columns, e.g. the keyset of cursor pagination.
+    """
+    names = list(fields or EVENT_LIST_FIELDS)
+    for column in required:
+        if column.key not in names:
+            names.append(column.key)
+    return [getattr(Event, name) for name in names]
 
 
 class EventRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.event_model = Event
         self.event_registration_model = EventRegistrationModel
 
-    def get_event(self, event_id: int) -> Optional[Event]:
+    async def get_event(self, event_id: int) -> Optional[Event]:
         """Get a single event by ID."""
-        return self.db.query(Event).filter(Event.id == event_id).first()
+        result = await self.db.execute(select(Event).where(Event.id == event_id))
+        return result.scalars().first()
 
-    def get_all_events(self, skip: int = 0, limit: int = 100) -> List[Event]:
-        """Get all events with pagination."""
-        return self.db.query(Event).offset(skip).limit(limit).all()
+    async def get_event_version(self, event_id: int):
+        """(created_at, updated_at) of an event, or None; validator for HTTP caching."""
+        result = await self.db.execute(
+            select(Event.created_at, Event.updated_at).where(Event.id == event_id)
+        )
+        return result.first()
+
+    async def get_all_events(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get a page of events as dicts holding ``id`` and ``fields``."""
+        result = await self.db.execute(
+            select(*list_columns(fields, Event.id)).offset(skip).limit(limit)
+        )
+        return [row._asdict() for row in result]
 
-    def get_events_count(self) -> int:
+    async def get_all_events_by_cursor(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get a page of events ordered by (start_date, id) after ``cursor``."""
+        query = apply_keyset(
+            select(*list_columns(fields, *EVENT_KEYSET)), EVENT_KEYSET, cursor, limit
+        )
+        result = await self.db.execute(query)
+        rows, next_cursor = split_keyset_page(list(result.all()), EVENT_KEYSET, limit)
+        return [row._asdict() for row in rows], next_cursor
+
+    async def get_events_total(
+        self, count_mode: CountMode
+    ) -> Tuple[Optional[int], bool]:
+        """(total, is_estimate) of events for cursor pages, see ``count_total``."""
+        return await count_total(self.db, select(Event.id), count_mode)
+
+    async def get_events_count(self) -> int:
         """Get the total number of events."""
-        return self.db.query(func.count(self.event_model.id)).scalar() or 0
+        result = await self.db.execute(select(func.count(self.event_model.id)))
+        return result.scalar() or 0
+
+    async def title_exists(self, title: str) -> bool:
+        """Whether an event already uses ``title`` (served by ix_events_title)."""
+        result = await self.db.execute(
+            select(Event.id).where(Event.title == title).limit(1)
+        )
+        return result.first() is not None
+
+    async def slot_exists(self, start_date: datetime, end_date: datetime) -> bool:
+        """
+        Whether an event on the same days shares the start or the end time.
+
+        The start day is a range on ix_events_start_date_id, so the lookup
+        only visits the events that begin that day.
+        """
+        start_day = datetime.combine(start_date.date(), datetime.min.time())
+        end_day = datetime.combine(end_date.date(), datetime.min.time())
+        result = await self.db.execute(
+            select(Event.id)
+            .where(
+                Event.start_date >= start_day,
+                Event.start_date < start_day + timedelta(days=1),
+                Event.end_date >= end_day,
+                Event.end_date < end_day + timedelta(days=1),
+                or_(Event.start_date == start_date, Event.end_date == end_date),
+            )
+            .limit(1)
+        )
+        return result.first() is not None
 
-    def create_event(self, event: EventCreate) -> Event:
+    async def get_existing_titles(self, titles: Sequence[str]) -> set:
+        """The subset of ``titles`` already used by an event."""
+        if not titles:
+            return set()
+        result = await self.db.execute(
+            select(Event.title).where(Event.title.in_(set(titles)))
+        )
+        return set(result.scalars().all())
+
+    async def get_events_sharing_times(
+        self, starts: Sequence[datetime], ends: Sequence[datetime]
+    ) -> List[Tuple[datetime, datetime]]:
+        """(start_date, end_date) of the events starting or ending at those times."""
+        if not starts and not ends:
+            return []
+        result = await self.db.execute(
+            select(Event.start_date, Event.end_date).where(
+                or_(Event.start_date.in_(set(starts)), Event.end_date.in_(set(ends)))
+            )
+        )
+        return [tuple(row) for row in result]
+
+    async def create_events(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert events with one multi-row INSERT; returns {title: id}."""
+        result = await self.db.execute(
+            insert(Event).returning(Event.title, Event.id), rows
+        )
+        return {row.title: row.id for row in result}
+
+    async def create_event(self, event: EventCreate) -> Event:
         """Create a new event."""
         db_event = Event(**event.model_dump())
         self.db.add(db_event)
-        self.db.commit()
-        self.db.refresh(db_event)
+        await self.db.commit()
+        await self.db.refresh(db_event)
         return db_event
 
-    def update_event(self, event_id: int, event: EventUpdate) -> Optional[Event]:
+    async def update_event(self, event_id: int, event: EventUpdate) -> Optional[Event]:
         """Update an existing event."""
         try:
-            db_event = self.get_event(event_id)
+            db_event = await self.get_event(event_id)
             if db_event:
                 update_data = event.dict(exclude_unset=True)
                 for field, value in update_data.items():
                     setattr(db_event, field, value)
-                self.db.flush()
-                self.db.refresh(db_event)
-                self.db.commit()
+                await self.db.flush()
+                await self.db.commit()
+                await self.db.refresh(db_event)
             return db_event
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
-    def delete_event(self, event_id: int) -> bool:
+    async def delete_event(self, event_id: int) -> bool:
         """Delete an event."""
         try:
-            db_event = self.get_event(event_id)
+            db_event = await self.get_event(event_id)
             if db_event:
-                self.db.delete(db_event)
-                self.db.commit()
+                await self.db.delete(db_event)
+                await self.db.commit()
                 return True
             return False
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             raise e
 
-    def search_events(
+    def _registered_participants(self):
+        """Registered participants read from the denormalized event counter."""
+        return Event.registered_participants.label("registered_participants")
+
+    def _dialect_name(self) -> str:
+        """Name of the database dialect behind the session."""
+        return self.db.bind.dialect.name
+
+    def _build_search_query(
         self,
         title: Optional[str] = None,
         location: Optional[str] = None,
         is_active: Optional[bool] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[Event]:
+        q: Optional[str] = None,
+        columns: Optional[list] = None,
+    ):
         """
-        Search events by multiple criteria:
-        - title: search by title or part of title (case insensitive)
-        - location: search by location (case insensitive)
-        - is_active: filter by active status
-        - date_from/date_to: filter events that occur within this date range
+        Build the filtered events query shared by the search methods.
+
+        ``q`` is a free-text search over title and location ordered by
+        relevance; a ``title`` filter alone is ordered by trigram similarity
+        on PostgreSQL. Selects ``columns`` instead of the entity when given.
         """
-        query = self.db.query(Event)
+        query = select(*columns) if columns else select(Event)
+
+        if q:
+            query = apply_text_search(query, q, self._dialect_name())
+        elif title:
+            query = order_by_title_similarity(query, title, self._dialect_name())
 
         # Filter by title (case insensitive partial match)
         if title:
-            query = query.filter(Event.title.ilike(f"%{title}%"))
+            query = query.where(Event.title.ilike(f"%{title}%"))
 
         if location:
-            query = query.filter(Event.location.ilike(f"%{location}%"))
+            query = query.where(Event.location.ilike(f"%{location}%"))
 
         if is_active is not None:
-            query = query.filter(Event.is_active == is_active)
+            query = query.where(Event.is_active == is_active)
 
         # -- Lógica de fechas corregida --
         if date_from and date_to:
@@ -102,28 +236,135 @@ class EventRepository:
 
             # La consulta verifica que los rangos se solapen.
             # Usa `<` en la fecha de fin para incluir todo el día
-            query = query.filter(
+            query = query.where(
                 and_(Event.start_date < final_date_to, Event.end_date >= date_from)
             )
         elif date_from:
-            query = query.filter(Event.end_date >= date_from)
+            query = query.where(Event.end_date >= date_from)
         elif date_to:
             # Amplía date_to para incluir todo el día
             final_date_to = date_to + timedelta(days=1)
-            query = query.filter(Event.start_date < final_date_to)
+            query = query.where(Event.start_date < final_date_to)
 
-        # Apply pagination
-        return query.offset(skip).limit(limit).all()
+        return query
 
-    def get_event_registrations(self, event_id: int) -> Optional[Event]:
-        """Get all registrations for an event."""
+    def _build_upcoming_query(self):
+        """Build the query for active events that have not started yet."""
         return (
-            self.db.query(Event)
-            .filter(Event.id == event_id, Event.is_active == True)
-            .first()
+            select(Event)
+            .where(and_(Event.start_date > datetime.utcnow(), Event.is_active == True))
+            .order_by(Event.start_date.asc())
         )
-        
-    def create_event_registration(self, event_registration: EventRegistrationModel) -> EventRegistrationModel:
+
+    async def search_events(
+        self,
+        title: Optional[str] = None,
+        location: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        q: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> CountedPage:
+        """
+        Search events by multiple criteria:
+        - title: search by title or part of title (case insensitive)
+        - location: search by location (case insensitive)
+        - is_active: filter by active status
+        - date_from/date_to: filter events that occur within this date range
+        - q: free-text search over title and location, ordered by relevance
+
+        Returns the page of events (dicts holding ``id`` and ``fields``) and the
+        total of matches (see ``count_mode``).
+        """
+        columns = list_columns(fields, Event.id)
+        query = self._build_search_query(
+            title=title,
+            location=location,
+            is_active=is_active,
+            date_from=date_from,
+            date_to=date_to,
+            q=q,
+            columns=columns,
+        )
+
+        page = await fetch_counted_page(self.db, query, skip, limit, count_mode)
+        names = [column.key for column in columns]
+        return page._replace(rows=[dict(zip(names, row)) for row in page.rows])
+
+    async def get_event_with_capacity(
+        self, event_id: int
+    ) -> Optional[Tuple[Event, int]]:
+        """Get a single event together with its registered participants."""
+        result = await self.db.execute(
+            select(Event, self._registered_participants()).where(Event.id == event_id)
+        )
+        row = result.first()
+        return (row[0], row[1]) if row else None
+
+    async def get_all_events_with_capacity(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[Tuple[Event, int]]:
+        """Get a page of events with registered participants in one query."""
+        result = await self.db.execute(
+            select(Event, self._registered_participants()).offset(skip).limit(limit)
+        )
+        return [(event, registered) for event, registered in result.all()]
+
+    async def search_events_with_capacity(
+        self,
+        title: Optional[str] = None,
+        location: Optional[str] = None,
+        is_active: Optional[bool] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        q: Optional[str] = None,
+    ) -> CountedPage:
+        """Search events, their registered participants and the total of matches."""
+        query = self._build_search_query(
+            title=title,
+            location=location,
+            is_active=is_active,
+            date_from=date_from,
+            date_to=date_to,
+            q=q,
+        ).add_columns(self._registered_participants())
+        return await fetch_counted_page(self.db, query, skip, limit, count_mode)
+
+    async def get_upcoming_events_with_capacity(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[Tuple[Event, int]]:
+        """Get upcoming active events and their registered participants."""
+        query = self._build_upcoming_query().add_columns(
+            self._registered_participants()
+        )
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return [(event, registered) for event, registered in result.all()]
+
+    async def get_upcoming_events_count(self) -> int:
+        """Get the number of upcoming active events."""
+        query = self._build_upcoming_query().order_by(None)
+        result = await self.db.execute(
+            select(func.count()).select_from(query.subquery())
+        )
+        return result.scalar() or 0
+
+    async def get_event_registrations(self, event_id: int) -> Optional[Event]:
+        """Get all registrations for an event."""
+        result = await self.db.execute(
+            select(Event).where(Event.id == event_id, Event.is_active == True)
+        )
+        return result.scalars().first()
+
+    async def create_event_registration(
+        self, event_registration: EventRegistrationModel
+    ) -> EventRegistrationModel:
         # Crear el registro
         new_registration = self.event_registration_model(
             event_id=event_registration.event_id,
@@ -132,6 +373,7 @@ class EventRepository:
         )
 
         self.db.add(new_registration)
-        self.db.commit()
-        self.db.refresh(new_registration)
+        # eager_defaults devuelve created_at en el propio INSERT
+        await self.db.flush()
+        await self.db.commit()
         return new_registration
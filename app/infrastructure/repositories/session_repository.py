@@ -1,112 +1,199 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import Interval, func, insert, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.schemas.pagination_schema import CountMode
 from app.db.models import Event
 from app.db.models import Session as SessionModel
 from app.db.models import Speaker
+from app.infrastructure.pagination import apply_keyset, count_total, split_keyset_page
+
+# Orden estable usado por la paginación por cursor
+SESSION_KEYSET = (SessionModel.start_time, SessionModel.id)
+
+# Margen mínimo entre dos sesiones activas del mismo evento
+SESSION_BUFFER_MINUTES = 15
+
+# En PostgreSQL la restricción de exclusión ex_sessions_event_slot ensancha
+# cada sesión medio margen por cada lado: dos franjas se solapan justo cuando
+# las sesiones están a menos de SESSION_BUFFER_MINUTES. La expresión debe ser
+# idéntica a la de la migración para que el planner use su índice GiST.
+_SLOT_PADDING = literal_column("interval '450 seconds'", Interval)
+SESSION_SLOT = func.tsrange(
+    SessionModel.start_time - _SLOT_PADDING, SessionModel.end_time + _SLOT_PADDING
+)
 
 
 class SessionRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_all_sessions(self, skip: int = 0, limit: int = 100) -> List[SessionModel]:
-        return self.db.query(SessionModel).offset(skip).limit(limit).all()
+    async def get_all_sessions(
+        self, skip: int = 0, limit: int = 100
+    ) -> List[SessionModel]:
+        result = await self.db.execute(select(SessionModel).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_all_sessions_by_cursor(
+        self, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[SessionModel], Optional[str]]:
+        query = apply_keyset(select(SessionModel), SESSION_KEYSET, cursor, limit)
+        result = await self.db.execute(query)
+        return split_keyset_page(list(result.scalars().all()), SESSION_KEYSET, limit)
 
-    def get_sessions_by_event(
+    async def get_sessions_by_event(
         self, event_id: int, skip: int = 0, limit: int = 100
     ) -> List[SessionModel]:
-        return (
-            self.db.query(SessionModel)
-            .filter(SessionModel.event_id == event_id)
+        result = await self.db.execute(
+            select(SessionModel)
+            .where(SessionModel.event_id == event_id)
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result.scalars().all())
 
-    def get_sessions_count(self) -> int:
-        return self.db.query(func.count(SessionModel.id)).scalar() or 0
+    async def get_sessions_total(
+        self, count_mode: CountMode
+    ) -> Tuple[Optional[int], bool]:
+        """(total, is_estimate) of sessions for cursor pages, see ``count_total``."""
+        return await count_total(self.db, select(SessionModel.id), count_mode)
 
-    def get_sessions_count_by_event(self, event_id: int) -> int:
-        return (
-            self.db.query(func.count(SessionModel.id))
-            .filter(SessionModel.event_id == event_id)
-            .scalar()
-            or 0
+    async def get_sessions_count(self) -> int:
+        result = await self.db.execute(select(func.count(SessionModel.id)))
+        return result.scalar() or 0
+
+    async def get_sessions_count_by_event(self, event_id: int) -> int:
+        result = await self.db.execute(
+            select(func.count(SessionModel.id)).where(SessionModel.event_id == event_id)
+        )
+        return result.scalar() or 0
+
+    async def get_sessions_version_by_event(self, event_id: int):
+        """
+        (count, max id, last change) of the sessions of an event.
+
+        Validator for HTTP caching: inserts change the count and max id,
+        deletes the count, updates the last change.
+        """
+        result = await self.db.execute(
+            select(
+                func.count(SessionModel.id),
+                func.max(SessionModel.id),
+                func.max(func.coalesce(SessionModel.updated_at, SessionModel.created_at)),
+            ).where(SessionModel.event_id == event_id)
         )
+        return result.one()
 
-    def get_session_by_id(self, session_id: int) -> SessionModel:
-        return self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    async def get_session_by_id(self, session_id: int) -> SessionModel:
+        result = await self.db.execute(
+            select(SessionModel).where(SessionModel.id == session_id)
+        )
+        return result.scalars().first()
 
-    def create_session(self, session: SessionModel) -> SessionModel:
+    async def create_session(self, session: SessionModel) -> SessionModel:
         self.db.add(session)
-        self.db.commit()
-        self.db.refresh(session)
+        await self.db.commit()
+        await self.db.refresh(session)
         return session
 
-    def update_session(self, session_id: int, session_data: dict) -> SessionModel:
-        session = (
-            self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
-        )
+    async def update_session(self, session_id: int, session_data: dict) -> SessionModel:
+        session = await self.get_session_by_id(session_id)
         if session:
             for key, value in session_data.items():
                 if value is not None:
                     setattr(session, key, value)
-            self.db.commit()
-            self.db.refresh(session)
+            await self.db.commit()
+            await self.db.refresh(session)
         return session
 
-    def delete_session(self, session_id: int) -> bool:
-        session = (
-            self.db.query(SessionModel).filter(SessionModel.id == session_id).first()
-        )
+    async def delete_session(self, session_id: int) -> bool:
+        session = await self.get_session_by_id(session_id)
         if session:
-            self.db.delete(session)
-            self.db.commit()
+            await self.db.delete(session)
+            await self.db.commit()
             return True
         return False
 
-    def check_schedule_conflicts(
+    async def check_schedule_conflicts(
         self,
         event_id: int,
         start_time: datetime,
         end_time: datetime,
         exclude_session_id: Optional[int] = None,
     ) -> List[SessionModel]:
-        """Check for schedule conflicts with existing sessions"""
-        query = self.db.query(SessionModel).filter(
-            and_(
-                SessionModel.event_id == event_id,
-                SessionModel.is_active == True,
-                or_(
-                    and_(
-                        SessionModel.start_time < end_time,
-                        SessionModel.end_time > start_time,
-                    ),
-                    and_(
-                        SessionModel.start_time >= start_time,
-                        SessionModel.start_time < end_time,
-                    ),
-                    and_(
-                        SessionModel.end_time > start_time,
-                        SessionModel.end_time <= end_time,
-                    ),
-                ),
-            )
+        """Active sessions of the event closer than the buffer to the given slot"""
+        query = select(SessionModel).where(
+            SessionModel.event_id == event_id,
+            SessionModel.is_active == True,
         )
 
+        if self.db.bind.dialect.name == "postgresql":
+            padding = timedelta(minutes=SESSION_BUFFER_MINUTES) / 2
+            query = query.where(
+                SESSION_SLOT.op("&&")(
+                    func.tsrange(start_time - padding, end_time + padding)
+                )
+            )
+        else:
+            # Recorre ix_sessions_event_id_start_time hasta el final del margen
+            buffer = timedelta(minutes=SESSION_BUFFER_MINUTES)
+            query = query.where(
+                SessionModel.start_time < end_time + buffer,
+                SessionModel.end_time > start_time - buffer,
+            )
+
         if exclude_session_id:
-            query = query.filter(SessionModel.id != exclude_session_id)
+            query = query.where(SessionModel.id != exclude_session_id)
+
+        result = await self.db.execute(query.order_by(SessionModel.start_time))
+        return list(result.scalars().all())
+
+    async def get_active_slots_by_events(
+        self, event_ids: Sequence[int]
+    ) -> Dict[int, List[Tuple[datetime, datetime]]]:
+        """(start_time, end_time) of the active sessions of each event, in one query."""
+        slots: Dict[int, List[Tuple[datetime, datetime]]] = {}
+        if not event_ids:
+            return slots
+        result = await self.db.execute(
+            select(SessionModel.event_id, SessionModel.start_time, SessionModel.end_time)
+            .where(
+                SessionModel.event_id.in_(set(event_ids)),
+                SessionModel.is_active == True,
+            )
+        )
+        for event_id, start_time, end_time in result:
+            slots.setdefault(event_id, []).append((start_time, end_time))
+        return slots
+
+    async def get_events_by_ids(self, event_ids: Sequence[int]) -> Dict[int, Event]:
+        """Events by id, for validating sessions in bulk."""
+        if not event_ids:
+            return {}
+        result = await self.db.execute(select(Event).where(Event.id.in_(set(event_ids))))
+        return {event.id: event for event in result.scalars()}
+
+    async def get_existing_speaker_ids(self, speaker_ids: Sequence[int]) -> set:
+        """The subset of ``speaker_ids`` that exist."""
+        if not speaker_ids:
+            return set()
+        result = await self.db.execute(
+            select(Speaker.id).where(Speaker.id.in_(set(speaker_ids)))
+        )
+        return set(result.scalars().all())
 
-        return query.all()
+    async def create_sessions(self, rows: List[dict]) -> None:
+        """Insert sessions with one multi-row INSERT (caller commits)."""
+        await self.db.execute(insert(SessionModel), rows)
 
-    def get_event_by_id(self, event_id: int) -> Event:
+    async def get_event_by_id(self, event_id: int) -> Event:
         """Get event by ID for validation purposes"""
-        return self.db.query(Event).filter(Event.id == event_id).first()
+        result = await self.db.execute(select(Event).where(Event.id == event_id))
+        return result.scalars().first()
 
-    def get_speaker_by_id(self, speaker_id: int) -> Speaker:
+    async def get_speaker_by_id(self, speaker_id: int) -> Speaker:
         """Get speaker by ID for validation purposes"""
-        return self.db.query(Speaker).filter(Speaker.id == speaker_id).first()
+        result = await self.db.execute(select(Speaker).where(Speaker.id == speaker_id))
+        return result.scalars().first()
@@ -1,14 +1,27 @@
 from typing import List
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.speaker_model import Speaker
 
 
 class SpeakerRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_all_speakers(self) -> List[Speaker]:
+    async def get_all_speakers(self) -> List[Speaker]:
         """Get all speakers."""
-        return self.db.query(Speaker).all()
+        result = await self.db.execute(select(Speaker))
+        return list(result.scalars().all())
+
+    async def get_speakers_version(self):
+        """(count, max id, last change) of the speakers; validator for HTTP caching."""
+        result = await self.db.execute(
+            select(
+                func.count(Speaker.id),
+                func.max(Speaker.id),
+                func.max(func.coalesce(Speaker.updated_at, Speaker.created_at)),
+            )
+        )
+        return result.one()
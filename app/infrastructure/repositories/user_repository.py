@@ -1,47 +1,82 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import and_, func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.api.schemas.pagination_schema import CountMode
 from app.api.schemas.user_schemas import UserCreate, UserUpdate
 from app.db.models import User
+from app.infrastructure.pagination import apply_keyset, count_total, split_keyset_page
+
+# Orden estable usado por la paginación por cursor
+USER_KEYSET = (User.id,)
 
 
 class UserRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.user_model = User
 
-    def get_user(self, user_id: int) -> Optional[User]:
-        """Get a single user by ID."""
-        return self.db.query(User).filter(User.id == user_id).first()
+    async def get_user(self, user_id: int) -> Optional[User]:
+        """Get a single user by ID with role relationship."""
+        result = await self.db.execute(
+            select(User).options(selectinload(User.role)).where(User.id == user_id)
+        )
+        return result.scalars().first()
 
-    def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
+    async def get_all_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all users with pagination."""
-        return self.db.query(User).offset(skip).limit(limit).all()
+        result = await self.db.execute(select(User).offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def get_all_users_by_cursor(
+        self, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[User], Optional[str]]:
+        """Get a page of users ordered by id after ``cursor``."""
+        query = apply_keyset(select(User), USER_KEYSET, cursor, limit)
+        result = await self.db.execute(query)
+        return split_keyset_page(list(result.scalars().all()), USER_KEYSET, limit)
 
-    def authenticate_user(self, username: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Login a user."""
-        return (
-            self.db.query(User)
-            .filter(User.username == username, User.password == password)
-            .first()
+        result = await self.db.execute(
+            select(User).where(User.username == username, User.password == password)
         )
+        return result.scalars().first()
 
-    def get_users_count(self) -> int:
+    async def get_existing_ids(self, user_ids: List[int]) -> set:
+        """The subset of ``user_ids`` that exist."""
+        result = await self.db.execute(select(User.id).where(User.id.in_(user_ids)))
+        return set(result.scalars().all())
+
+    async def get_users_total(
+        self, count_mode: CountMode
+    ) -> Tuple[Optional[int], bool]:
+        """(total, is_estimate) of users for cursor pages, see ``count_total``."""
+        return await count_total(self.db, select(User.id), count_mode)
+
+    async def get_users_count(self) -> int:
         """Get the total number of users."""
-        return self.db.query(func.count(self.user_model.id)).scalar() or 0
+        result = await self.db.execute(select(func.count(self.user_model.id)))
+        return result.scalar() or 0
 
-    def get_user_by_username(self, username: str) -> Optional[User]:
+    async def get_user_by_username(self, username: str) -> Optional[User]:
         """Get a user by username with role relationship."""
-        return self.db.query(User).filter(User.username == username).first()
+        result = await self.db.execute(
+            select(User)
+            .options(selectinload(User.role))
+            .where(User.username == username)
+        )
+        return result.scalars().first()
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get a user by email."""
-        return self.db.query(User).filter(User.email == email).first()
+        result = await self.db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
 
-    def create_user(self, user_data: UserCreate) -> User:
+    async def create_user(self, user_data: UserCreate) -> User:
         """Create a user."""
         # Exclude confirm_password from the data
         user_dict = user_data.model_dump()
@@ -50,7 +85,28 @@ class UserRepository:
 
         user_new = User(**user_dict)
         self.db.add(user_new)
-        self.db.commit()
-        self.db.refresh(user_new) 
-        
+        await self.db.commit()
+        await self.db.refresh(user_new)
+
         return user_new
+
+    async def increment_token_version(self, user_id: int) -> None:
+        """Increment the token version of a user, invalidating issued tokens."""
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(token_version=User.token_version + 1)
+        )
+        await self.db.commit()
+
+    async def update_password(self, user_id: int, hashed_password: str) -> None:
+        """Replace the stored password hash of a user."""
+        # Sin sincronizar la sesión: expirar updated_at (onupdate) forzaría una
+        # carga perezosa que no está permitida en AsyncSession
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(password=hashed_password)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
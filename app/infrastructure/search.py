@@ -0,0 +1,74 @@
+"""
+Event text search module.
+
+This module builds the full-text part of the event search. PostgreSQL uses
+the ``events.search_vector`` tsvector column (GIN indexed) ranked with
+``ts_rank``; SQLite, used by the tests, uses the ``events_fts`` FTS5 table
+ranked with bm25. Both match every word of the query as a prefix.
+"""
+
+import re
+from typing import List
+
+from sqlalchemy import column, func, literal_column, select, table, text
+
+from app.db.models import Event
+
+# Tabla FTS5 (solo SQLite), mantenida por triggers: ver event_models.py
+events_fts = table("events_fts", column("rowid"))
+
+
+def search_terms(q: str) -> List[str]:
+    """Split a free-text query into words, dropping search syntax characters."""
+    return re.findall(r"\w+", q.lower())
+
+
+def apply_text_search(query, q: str, dialect_name: str):
+    """
+    Filter ``query`` to events matching ``q`` and order them by relevance.
+
+    Terms are matched against title (higher weight) and location.
+    """
+    terms = search_terms(q)
+    if not terms:
+        return query
+
+    if dialect_name == "postgresql":
+        ts_query = func.to_tsquery(
+            "simple", " & ".join(f"{term}:*" for term in terms)
+        )
+        vector = literal_column("events.search_vector")
+        return query.where(vector.op("@@")(ts_query)).order_by(
+            func.ts_rank(vector, ts_query).desc(), Event.id
+        )
+
+    if dialect_name == "sqlite":
+        match = " ".join(f'"{term}"*' for term in terms)
+        # bm25 no puede usarse junto a funciones de ventana (COUNT(*) OVER ()),
+        # por eso la puntuación se calcula en una subconsulta.
+        # Más peso para el título, como setweight 'A' en PostgreSQL
+        ranked = (
+            select(
+                events_fts.c.rowid.label("event_id"),
+                func.bm25(literal_column("events_fts"), 10.0, 1.0).label("score"),
+            )
+            .where(text("events_fts MATCH :search_match").bindparams(search_match=match))
+            .subquery("events_fts_ranked")
+        )
+        return query.join(ranked, ranked.c.event_id == Event.id).order_by(
+            ranked.c.score, Event.id
+        )
+
+    # Otros motores: coincidencia parcial sin ranking
+    for term in terms:
+        query = query.where(
+            Event.title.ilike(f"%{term}%") | Event.location.ilike(f"%{term}%")
+        )
+    return query
+
+
+def order_by_title_similarity(query, title: str, dialect_name: str):
+    """Order a title-filtered query by trigram similarity (PostgreSQL only)."""
+    if dialect_name != "postgresql":
+        return query
+    return query.order_by(func.similarity(Event.title, title).desc(), Event.id)
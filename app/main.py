@@ -1,10 +1,14 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import settings
-from app.db.base import Base, engine
+from app.db.base import Base, async_engine, engine, replica_async_engine
+from app.db.pool import pool_metrics, pool_report
+from app.core.metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, registry
+from app.core.sql_profiler import SQLProfilerMiddleware
+from app.core.responses import DefaultJSONResponse
 from app.core.exceptions import BaseAPIException
 from app.core.error_handlers import (
     validation_exception_handler,
@@ -23,6 +27,8 @@ app = FastAPI(
     title=settings.project_name,
     debug=settings.debug,
     openapi_url=f"{settings.api_v1_str}/openapi.json",
+    # orjson cuando está instalado
+    default_response_class=DefaultJSONResponse,
 )
 
 # Agregar middleware CORS
@@ -34,6 +40,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Perfilado SQL por petición, solo en debug/staging
+if settings.sql_profiler_enabled:
+    app.add_middleware(SQLProfilerMiddleware)
+
+# Métricas por ruta para Prometheus (middleware más externo)
+app.add_middleware(MetricsMiddleware)
+
 # Registrar manejadores de errores
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(BaseAPIException, custom_exception_handler)
@@ -54,3 +67,26 @@ async def root():
 async def health_check():
     """Endpoint de verificación de salud."""
     return {"status": "healthy"}
+
+
+def _pool_engines():
+    """Engines cuyo pool se expone en /health/pool y /metrics."""
+    engines = {"api": async_engine.sync_engine, "sync": engine}
+    if replica_async_engine is not None:
+        engines["replica"] = replica_async_engine.sync_engine
+    return engines
+
+
+registry.register_collector(lambda: pool_metrics(**_pool_engines()))
+
+
+@app.get("/health/pool")
+async def pool_health():
+    """Estado y métricas del pool de conexiones de este worker."""
+    return pool_report(**_pool_engines())
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Métricas de este worker en formato de texto de Prometheus."""
+    return Response(content=registry.render(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,375 @@
+from datetime import timedelta
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas.import_schemas import (
+    EventImportRow,
+    ImportReport,
+    ImportRowError,
+    SessionImportRow,
+)
+from app.core.cache import (
+    EVENT_LISTS_TAG,
+    UPCOMING_EVENTS_TAG,
+    event_sessions_tag,
+    response_cache,
+)
+from app.core.config import settings
+from app.infrastructure.record_streams import Record, RecordError
+from app.infrastructure.repositories.event_repository import EventRepository
+from app.infrastructure.repositories.session_repository import (
+    SESSION_BUFFER_MINUTES,
+    SessionRepository,
+)
+from app.services.validators.event_validators import validate_event_data
+from app.services.validators.session_validators import (
+    find_schedule_conflicts,
+    validate_session_schedule,
+)
+
+# Columnas escritas de cada tipo de fila
+EVENT_COLUMNS = {
+    "title",
+    "description",
+    "location",
+    "start_date",
+    "end_date",
+    "capacity",
+    "is_active",
+}
+SESSION_COLUMNS = {
+    "title",
+    "description",
+    "speaker_id",
+    "start_time",
+    "end_time",
+    "capacity",
+}
+
+
+class ImportTooLargeError(ValueError):
+    """La importación supera ``settings.import_max_rows`` filas."""
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def _slot_keys(start, end) -> Tuple[tuple, tuple]:
+    # Mismo criterio que EventRepository.slot_exists: mismos días y misma hora
+    # de inicio o de fin
+    return ("start", start, end.date()), ("end", end, start.date())
+
+
+class AgendaImportService:
+    """Importación masiva de agendas: eventos y sus sesiones desde CSV/NDJSON"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.event_repository = EventRepository(db)
+        self.session_repository = SessionRepository(db)
+
+    async def import_agenda(
+        self,
+        records: AsyncIterator[Union[Record, RecordError]],
+        dry_run: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> ImportReport:
+        """
+        Importa eventos y sesiones leídos de ``records``.
+
+        Las filas se validan primero todas en memoria: esquema, unicidad de
+        título y franja con una consulta por lote, y conflictos de horario con
+        un barrido ordenado por evento (incluidas sus sesiones existentes).
+        Después se escriben en transacciones de ``batch_size`` filas con
+        INSERT de varias filas. Con ``dry_run`` no se escribe nada.
+
+        Raises:
+            ImportTooLargeError: Si hay más de ``settings.import_max_rows`` filas
+        """
+        batch_size = batch_size or settings.import_batch_size
+        errors: List[ImportRowError] = []
+        events: List[Tuple[int, EventImportRow]] = []
+        sessions: List[Tuple[int, SessionImportRow]] = []
+
+        # Línea de los eventos rechazados, para explicar el error de sus sesiones
+        rejected_refs: Dict[str, int] = {}
+        rows = 0
+        async for record in records:
+            rows += 1
+            if rows > settings.import_max_rows:
+                raise ImportTooLargeError(
+                    f"Import exceeds {settings.import_max_rows} rows"
+                )
+            if isinstance(record, RecordError):
+                errors.append(ImportRowError(line=record.line, error=record.error))
+                continue
+
+            values = dict(record.values)
+            row_type = str(values.pop("type", "")).strip().lower()
+            if row_type not in ("event", "session"):
+                errors.append(
+                    ImportRowError(
+                        line=record.line, error="type must be 'event' or 'session'"
+                    )
+                )
+                continue
+            try:
+                if row_type == "event":
+                    events.append((record.line, EventImportRow.model_validate(values)))
+                else:
+                    sessions.append(
+                        (record.line, SessionImportRow.model_validate(values))
+                    )
+            except ValidationError as e:
+                errors.append(
+                    ImportRowError(
+                        line=record.line, type=row_type, error=_validation_message(e)
+                    )
+                )
+                ref = values.get("ref") or values.get("title")
+                if row_type == "event" and ref:
+                    rejected_refs[str(ref)] = record.line
+
+        valid_events = await self._validate_events(events, rejected_refs, errors)
+        valid_sessions = await self._validate_sessions(
+            sessions, valid_events, rejected_refs, errors
+        )
+
+        event_ids: Dict[str, int] = {}
+        events_imported = len(valid_events)
+        sessions_imported = len(valid_sessions)
+        if not dry_run:
+            event_ids = await self._write_events(valid_events, batch_size, errors)
+            sessions_imported = await self._write_sessions(
+                valid_sessions, event_ids, batch_size, errors
+            )
+            events_imported = len(event_ids)
+
+        errors.sort(key=lambda error: error.line)
+        return ImportReport(
+            dry_run=dry_run,
+            rows=rows,
+            events_imported=events_imported,
+            sessions_imported=sessions_imported,
+            event_ids=event_ids,
+            errors=errors,
+        )
+
+    async def _validate_events(
+        self,
+        events: List[Tuple[int, EventImportRow]],
+        rejected_refs: Dict[str, int],
+        errors: List[ImportRowError],
+    ) -> Dict[str, Tuple[int, EventImportRow]]:
+        """Valid events by ref; adds the line of each rejected ref to ``rejected_refs``."""
+        checked = []
+        for line, event in events:
+            try:
+                validate_event_data(event)
+                checked.append((line, event))
+            except ValueError as e:
+                errors.append(ImportRowError(line=line, type="event", error=str(e)))
+                rejected_refs[event.ref or event.title] = line
+
+        # Una consulta para todos los títulos y otra para todas las franjas
+        taken_titles = await self.event_repository.get_existing_titles(
+            [event.title for _, event in checked]
+        )
+        taken_slots = set()
+        for start, end in await self.event_repository.get_events_sharing_times(
+            [event.start_date for _, event in checked],
+            [event.end_date for _, event in checked],
+        ):
+            taken_slots.update(_slot_keys(start, end))
+
+        valid: Dict[str, Tuple[int, EventImportRow]] = {}
+        for line, event in checked:
+            ref = event.ref or event.title
+            slot = _slot_keys(event.start_date, event.end_date)
+            if event.title in taken_titles:
+                error = "Event with this title already exists"
+            elif taken_slots.intersection(slot):
+                error = "Event with the same date and time already exists"
+            elif ref in valid or ref in rejected_refs:
+                error = f"Duplicate event ref '{ref}'"
+            else:
+                valid[ref] = (line, event)
+                taken_titles.add(event.title)
+                taken_slots.update(slot)
+                continue
+            errors.append(ImportRowError(line=line, type="event", error=error))
+            rejected_refs.setdefault(ref, line)
+        return valid
+
+    async def _validate_sessions(
+        self,
+        sessions: List[Tuple[int, SessionImportRow]],
+        valid_events: Dict[str, Tuple[int, EventImportRow]],
+        rejected_refs: Dict[str, int],
+        errors: List[ImportRowError],
+    ) -> List[Tuple[int, SessionImportRow, Tuple[str, object]]]:
+        """Valid sessions with the key of their event: ("ref", ref) or ("id", id)."""
+        existing_events = await self.session_repository.get_events_by_ids(
+            [s.event_id for _, s in sessions if s.event_id and not s.event_ref]
+        )
+        speakers = await self.session_repository.get_existing_speaker_ids(
+            [s.speaker_id for _, s in sessions if s.speaker_id]
+        )
+
+        checked = []
+        for line, session in sessions:
+            try:
+                if session.event_ref and session.event_id:
+                    raise ValueError("Use either event_ref or event_id, not both")
+                if session.event_ref:
+                    if session.event_ref in rejected_refs:
+                        raise ValueError(
+                            f"Event '{session.event_ref}' (line "
+                            f"{rejected_refs[session.event_ref]}) was rejected"
+                        )
+                    if session.event_ref not in valid_events:
+                        raise ValueError(
+                            f"Event '{session.event_ref}' is not in the import"
+                        )
+                    event = valid_events[session.event_ref][1]
+                    key = ("ref", session.event_ref)
+                elif session.event_id:
+                    event = existing_events.get(session.event_id)
+                    if event is None:
+                        raise ValueError(
+                            f"Event with id {session.event_id} does not exist"
+                        )
+                    key = ("id", session.event_id)
+                else:
+                    raise ValueError("event_ref or event_id is required")
+
+                if session.speaker_id and session.speaker_id not in speakers:
+                    raise ValueError(
+                        f"Speaker with id {session.speaker_id} does not exist"
+                    )
+                validate_session_schedule(session, event.start_date, event.end_date)
+                checked.append((line, session, key))
+            except ValueError as e:
+                errors.append(ImportRowError(line=line, type="session", error=str(e)))
+
+        # Barrido por evento contra sus sesiones activas, cargadas de una vez
+        existing_slots = await self.session_repository.get_active_slots_by_events(
+            list({key[1] for _, _, key in checked if key[0] == "id"})
+        )
+        by_event: Dict[tuple, list] = {}
+        for index, (_, session, key) in enumerate(checked):
+            by_event.setdefault(key, []).append(
+                (index, session.start_time, session.end_time)
+            )
+        conflicts = set()
+        for key, candidates in by_event.items():
+            conflicts |= find_schedule_conflicts(
+                existing_slots.get(key[1], []) if key[0] == "id" else [],
+                candidates,
+                timedelta(minutes=SESSION_BUFFER_MINUTES),
+            )
+
+        valid = []
+        for index, (line, session, key) in enumerate(checked):
+            if index in conflicts:
+                errors.append(
+                    ImportRowError(
+                        line=line,
+                        type="session",
+                        error="Schedule conflict with another session (including "
+                        f"{SESSION_BUFFER_MINUTES}-minute buffer)",
+                    )
+                )
+            else:
+                valid.append((line, session, key))
+        return valid
+
+    async def _write_events(
+        self,
+        valid_events: Dict[str, Tuple[int, EventImportRow]],
+        batch_size: int,
+        errors: List[ImportRowError],
+    ) -> Dict[str, int]:
+        """Insert the events in batched transactions; returns {ref: id}."""
+        event_ids: Dict[str, int] = {}
+        items = list(valid_events.items())
+        for offset in range(0, len(items), batch_size):
+            batch = items[offset : offset + batch_size]
+            try:
+                ids = await self.event_repository.create_events(
+                    [event.model_dump(include=EVENT_COLUMNS) for _, (_, event) in batch]
+                )
+                await self.db.commit()
+            except IntegrityError as e:
+                await self.db.rollback()
+                errors.extend(
+                    ImportRowError(
+                        line=line, type="event", error=f"Batch failed: {e.orig}"
+                    )
+                    for _, (line, _) in batch
+                )
+                continue
+            event_ids.update((ref, ids[event.title]) for ref, (_, event) in batch)
+
+        if event_ids:
+            await response_cache.invalidate(EVENT_LISTS_TAG, UPCOMING_EVENTS_TAG)
+        return event_ids
+
+    async def _write_sessions(
+        self,
+        valid_sessions: List[Tuple[int, SessionImportRow, Tuple[str, object]]],
+        event_ids: Dict[str, int],
+        batch_size: int,
+        errors: List[ImportRowError],
+    ) -> int:
+        """Insert the sessions in batched transactions; returns how many."""
+        rows = []
+        for line, session, (kind, value) in valid_sessions:
+            event_id = value if kind == "id" else event_ids.get(value)
+            if event_id is None:
+                errors.append(
+                    ImportRowError(
+                        line=line,
+                        type="session",
+                        error=f"Event '{value}' was not created",
+                    )
+                )
+                continue
+            row = session.model_dump(include=SESSION_COLUMNS)
+            row["event_id"] = event_id
+            rows.append((line, row))
+
+        created = 0
+        touched = set()
+        for offset in range(0, len(rows), batch_size):
+            batch = rows[offset : offset + batch_size]
+            try:
+                await self.session_repository.create_sessions(
+                    [row for _, row in batch]
+                )
+                await self.db.commit()
+            except IntegrityError as e:
+                # p. ej. la restricción de exclusión ante un alta concurrente
+                await self.db.rollback()
+                errors.extend(
+                    ImportRowError(
+                        line=line, type="session", error=f"Batch failed: {e.orig}"
+                    )
+                    for line, _ in batch
+                )
+                continue
+            created += len(batch)
+            touched.update(row["event_id"] for _, row in batch)
+
+        if touched:
+            await response_cache.invalidate(
+                *(event_sessions_tag(event_id) for event_id in touched)
+            )
+        return created
@@ -9,27 +9,28 @@ from json import loads
 from typing import Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.auth_schemas import LoginRequest
 from app.api.schemas.token_schema import TokenResponse
 from app.api.schemas.user_schemas import UserCreate
 from app.core.config import settings
-from app.core.security import (create_access_token, get_password_hash,
-                               verify_password, verify_token)
+from app.core.security import (create_access_token, verify_and_update_password,
+                               verify_token)
+from app.core.user_cache import build_user, user_cache
 from app.db.models import Role, User
 from app.services.user_service import UserService
 
 
 class AuthService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.user_repo = UserService(db)
 
-    def login(self, login_data: LoginRequest) -> TokenResponse:
+    async def login(self, login_data: LoginRequest) -> TokenResponse:
         """Login user and return access token."""
         # 1. First check if user exists with role loaded
-        user = self.user_repo.get_user_by_username(login_data.username)
+        user = await self.user_repo.get_user_by_username(login_data.username)
 
         if not user:
             raise HTTPException(
@@ -45,20 +46,35 @@ class AuthService:
             )
 
         # 3. Verify password
-        if not verify_password(login_data.password, str(user.password)):
+        valid, new_hash = await verify_and_update_password(
+            login_data.password, str(user.password)
+        )
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
             )
 
+        # Rehash transparente si cambió el coste configurado de bcrypt
+        if new_hash:
+            await self.user_repo.user_repository.update_password(int(user.id), new_hash)
+
         # 2. Acceder al rol a través de la relación (ya cargada con joinedload)
         role_name = user.role.name if user.role else "user"  # type:ignore
 
         access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
         access_token = create_access_token(
-            data={"sub": str(user.id), "username": user.username, "role": role_name},
+            data={
+                "sub": str(user.id),
+                "username": user.username,
+                "role": role_name,
+                "active": bool(user.is_active),
+                "ver": int(user.token_version or 0),  # type:ignore
+            },
             expires_delta=access_token_expires,
         )
+        if settings.auth_stateless:
+            user_cache.set(user)
 
         # 3. Acceder a los atributos directamente
         return TokenResponse(
@@ -72,16 +88,16 @@ class AuthService:
             role=role_name,
         )
 
-    def register(self, register_data: UserCreate) -> TokenResponse:
+    async def register(self, register_data: UserCreate) -> TokenResponse:
         """Register a user."""
-        user = self.user_repo.create_user(register_data)
-        return self.login(
+        user = await self.user_repo.create_user(register_data)
+        return await self.login(
             LoginRequest(
                 username=register_data.username, password=register_data.password
             )
         )
 
-    def get_current_user(self, token: str) -> User:
+    async def get_current_user(self, token: str) -> User:
         """Get current user from token."""
         payload = verify_token(token)
         if payload is None:
@@ -99,7 +115,10 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        user = self.user_repo.user_repository.get_user(int(user_id))
+        if settings.auth_stateless:
+            return await self._get_stateless_user(int(user_id), payload)
+
+        user = await self.user_repo.user_repository.get_user(int(user_id))
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -107,4 +126,45 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        self._check_token_version(payload, int(user.token_version or 0))  # type:ignore
         return user
+
+    async def _get_stateless_user(self, user_id: int, payload: dict) -> User:
+        """
+        Build the current user from the token claims and the in-process cache.
+
+        Role and active flag are taken from the JWT; the ``users`` table is
+        only read when the user is not cached (or the entry expired).
+        """
+        snapshot = user_cache.get(user_id)
+        if snapshot is None:
+            user = await self.user_repo.user_repository.get_user(user_id)
+            if user is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            snapshot = user_cache.set(user)
+
+        self._check_token_version(payload, snapshot["token_version"])
+
+        user = build_user(snapshot, payload.get("role"))
+        if "active" in payload:
+            user.is_active = payload["active"]
+        return user
+
+    @staticmethod
+    def _check_token_version(payload: dict, token_version: int) -> None:
+        """Reject tokens issued before the user's last revocation."""
+        if payload.get("ver", 0) != token_version:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+    async def revoke_tokens(self, user_id: int) -> None:
+        """Revoke every token issued to the user so far."""
+        await self.user_repo.user_repository.increment_token_version(user_id)
+        user_cache.invalidate(user_id)
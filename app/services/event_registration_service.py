@@ -1,37 +1,46 @@
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.event_registration_schemas import (
     EventRegistration,
+    EventRegistrationBatchCreate,
+    EventRegistrationBatchItemResult,
+    EventRegistrationBatchResult,
     EventRegistrationCreate,
     EventRegistrationUpdate,
     EventRegistrationWithEvent,
 )
-from app.api.schemas.pagination_schema import Page
-from app.db.models.event_models import Event
+from app.api.schemas.pagination_schema import CountMode, Page
+from app.core.cache import UPCOMING_EVENTS_TAG, response_cache
 from app.db.models.event_register_models import (
     EventRegistration as EventRegistrationModel,
 )
 from app.db.models.user_model import User
+from app.infrastructure.pagination import InvalidCursorError
 from app.infrastructure.repositories.event_registration_repository import (
     EventRegistrationRepository,
 )
 from app.infrastructure.repositories.event_repository import EventRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+
+# Intentos de update_registration cuando otra petición cambia el mismo registro
+UPDATE_ATTEMPTS = 3
 
 
 class EventRegistrationService:
     """Servicio para gestionar registros de usuarios a eventos"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.event_registration_repository = EventRegistrationRepository(db)
         self.event_repository = EventRepository(db)
+        self.user_repository = UserRepository(db)
         """Inicializa el servicio con la sesión de base de datos"""
         self.db = db
 
-    def register_user_to_event(
+    async def register_user_to_event(
         self, user_id: int, registration_data: EventRegistrationCreate
     ) -> EventRegistration:
         """
@@ -47,80 +56,219 @@ class EventRegistrationService:
         Raises:
             ValueError: Si el evento no existe, no hay capacidad, o el usuario ya está registrado
         """
-        # Verificar que el evento existe y está activo
-        event = self.event_repository.get_event_registrations(
-            registration_data.event_id
+        # Reservar capacidad de forma atómica en el contador del evento.
+        # La misma sentencia comprueba que el evento existe y está activo, por
+        # lo que el camino feliz no necesita lecturas previas.
+        reserved = await self.event_registration_repository.reserve_capacity(
+            registration_data.event_id, registration_data.number_of_participants
         )
 
-        if not event:
-            raise ValueError("El evento no existe o no está activo")
-
-        # Verificar que el usuario no esté ya registrado
-        existing_registration = (
-            self.event_registration_repository.get_user_is_registered(
-                user_id, registration_data.event_id
+        if not reserved:
+            # Camino lento: averiguar por qué no se pudo reservar
+            event = await self.event_repository.get_event_registrations(
+                registration_data.event_id
             )
-        )
 
-        if existing_registration:
-            raise ValueError("Ya estás registrado en este evento")
+            if not event:
+                raise ValueError("El evento no existe o no está activo")
 
-        # Verificar capacidad disponible
-        current_registrations = (
-            self.event_registration_repository.get_capacity_available(
-                registration_data.event_id
+            existing_registration = (
+                await self.event_registration_repository.get_user_is_registered(
+                    user_id, registration_data.event_id
+                )
             )
-        )
 
-        available_capacity = event.capacity - current_registrations
+            if existing_registration:
+                raise ValueError("Ya estás registrado en este evento")
 
-        if available_capacity < registration_data.number_of_participants:
+            available_capacity = event.capacity - event.registered_participants
             raise ValueError(
                 f"No hay suficiente capacidad. Disponible: {available_capacity}, "
                 f"Solicitado: {registration_data.number_of_participants}"
             )
 
-        new_registration = self.event_repository.create_event_registration(
-            EventRegistrationModel(
-                event_id=registration_data.event_id,
-                user_id=user_id,
-                number_of_participants=registration_data.number_of_participants,
+        # El registro y la reserva se confirman en la misma transacción; la
+        # restricción única (event_id, user_id) rechaza registros duplicados
+        try:
+            new_registration = await self.event_repository.create_event_registration(
+                EventRegistrationModel(
+                    event_id=registration_data.event_id,
+                    user_id=user_id,
+                    number_of_participants=registration_data.number_of_participants,
+                )
             )
-        )
+        except IntegrityError:
+            await self.db.rollback()
+            raise ValueError("Ya estás registrado en este evento")
+
+        # Los listados con capacidad dependen del contador del evento
+        await response_cache.invalidate(UPCOMING_EVENTS_TAG)
         return EventRegistration.from_orm(new_registration)
 
-    def get_user_registrations(
-        self, user_id: int, skip: int = 0, page: int = 1, limit: int = 20
+    async def register_users_batch(
+        self, batch: EventRegistrationBatchCreate
+    ) -> EventRegistrationBatchResult:
+        """
+        Registra varios usuarios a eventos en una sola transacción.
+
+        Los eventos afectados se bloquean una vez y la capacidad se reparte en
+        el orden de la petición; los contadores se actualizan con un único
+        UPDATE y los registros con un único INSERT de varias filas. Los
+        elementos rechazados no impiden crear los demás.
+
+        Returns:
+            EventRegistrationBatchResult: Resultado de cada elemento, en orden
+
+        Raises:
+            ValueError: Si un registro concurrente invalida el lote (reintentar)
+        """
+        items = batch.items
+        events = await self.event_registration_repository.lock_events_capacity(
+            item.event_id for item in items
+        )
+        user_ids = await self.user_repository.get_existing_ids(
+            list({item.user_id for item in items})
+        )
+        registered = await self.event_registration_repository.get_registered_pairs(
+            (item.user_id, item.event_id) for item in items
+        )
+
+        # Capacidad libre de cada evento activo, consumida en orden
+        available = {
+            event_id: capacity - registered_participants
+            for event_id, (capacity, registered_participants, is_active) in events.items()
+            if is_active
+        }
+        errors: Dict[int, str] = {}
+        participants: Dict[int, int] = {}
+        accepted = []
+        for index, item in enumerate(items):
+            pair = (item.user_id, item.event_id)
+            if item.event_id not in available:
+                errors[index] = "El evento no existe o no está activo"
+            elif item.user_id not in user_ids:
+                errors[index] = "El usuario no existe"
+            elif pair in registered:
+                errors[index] = "El usuario ya está registrado en este evento"
+            elif item.number_of_participants > available[item.event_id]:
+                errors[index] = (
+                    f"No hay suficiente capacidad. Disponible: "
+                    f"{available[item.event_id]}, "
+                    f"Solicitado: {item.number_of_participants}"
+                )
+            else:
+                available[item.event_id] -= item.number_of_participants
+                participants[item.event_id] = (
+                    participants.get(item.event_id, 0) + item.number_of_participants
+                )
+                registered.add(pair)
+                accepted.append(index)
+
+        registration_ids: Dict[int, int] = {}
+        if accepted:
+            reserved = await self.event_registration_repository.reserve_capacity_batch(
+                participants
+            )
+            if not reserved:
+                # Sólo posible sin bloqueo de filas (SQLite)
+                await self.db.rollback()
+                raise ValueError(
+                    "La capacidad de los eventos cambió durante el registro, "
+                    "inténtalo de nuevo"
+                )
+            try:
+                ids = await self.event_registration_repository.create_registrations(
+                    [
+                        {
+                            "event_id": items[index].event_id,
+                            "user_id": items[index].user_id,
+                            "number_of_participants": items[index].number_of_participants,
+                        }
+                        for index in accepted
+                    ]
+                )
+            except IntegrityError:
+                await self.db.rollback()
+                raise ValueError(
+                    "Algún usuario se registró durante el lote, inténtalo de nuevo"
+                )
+            await self.db.commit()
+            registration_ids = {
+                index: ids[(items[index].user_id, items[index].event_id)]
+                for index in accepted
+            }
+            await response_cache.invalidate(UPCOMING_EVENTS_TAG)
+        else:
+            # Libera los bloqueos
+            await self.db.rollback()
+
+        results = [
+            EventRegistrationBatchItemResult(
+                index=index,
+                user_id=item.user_id,
+                event_id=item.event_id,
+                status="error" if index in errors else "created",
+                registration_id=registration_ids.get(index),
+                error=errors.get(index),
+            )
+            for index, item in enumerate(items)
+        ]
+        return EventRegistrationBatchResult(
+            created=len(accepted), failed=len(errors), results=results
+        )
+
+    async def get_user_registrations(
+        self,
+        user_id: int,
+        skip: int = 0,
+        page: int = 1,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        count_mode: CountMode = CountMode.NONE,
     ) -> Page[EventRegistrationWithEvent]:
         try:
-            registrations = self.event_registration_repository.get_user_registrations(
+            # Con cursor se pagina por id (más recientes primero) en lugar de
+            # OFFSET y el total de registros del usuario sólo se cuenta si se pide
+            if cursor is not None:
+                (
+                    registrations,
+                    next_cursor,
+                ) = await self.event_registration_repository.get_user_registrations_by_cursor(
+                    user_id, cursor=cursor, limit=limit
+                )
+                (
+                    total_registrations,
+                    estimated,
+                ) = await self.event_registration_repository.get_user_registrations_total(
+                    user_id, count_mode
+                )
+                return Page(
+                    items=[
+                        EventRegistrationWithEvent.from_registration(reg)
+                        for reg in registrations
+                    ],
+                    total_items=total_registrations,
+                    page=page,
+                    size=limit,
+                    total_pages=None,
+                    total_is_estimate=estimated,
+                    has_next=next_cursor is not None,
+                    next_cursor=next_cursor,
+                )
+
+            registrations = await self.event_registration_repository.get_user_registrations(
                 user_id, skip=skip, page=page, limit=limit
             )
 
             total_registrations = (
-                self.event_registration_repository.get_count_registrations()
+                await self.event_registration_repository.get_count_registrations()
             )
             total_pages = (total_registrations + limit - 1) // limit
 
-            # Create EventRegistrationWithEvent schemas manually to include event data
-            registration_schemas = []
-            for reg in registrations:
-                registration_data = {
-                    "id": reg.id,
-                    "event_id": reg.event_id,
-                    "user_id": reg.user_id,
-                    "number_of_participants": reg.number_of_participants,
-                    "created_at": reg.created_at,
-                    "updated_at": reg.updated_at,
-                    "title": reg.event.title,
-                    "date": reg.event.start_date,
-                    "location": reg.event.location,
-                    "start_date": reg.event.start_date,
-                    "end_date": reg.event.end_date,
-                }
-                registration_schemas.append(
-                    EventRegistrationWithEvent(**registration_data)
-                )
+            registration_schemas = [
+                EventRegistrationWithEvent.from_registration(reg)
+                for reg in registrations
+            ]
 
             return Page(
                 items=registration_schemas,
@@ -129,10 +277,12 @@ class EventRegistrationService:
                 size=limit,
                 total_pages=total_pages,
             )
+        except InvalidCursorError:
+            raise
         except Exception as e:
             raise ValueError(f"Error al obtener los registros de usuario: {e}")
 
-    def get_event_registrations(
+    async def get_event_registrations(
         self, event_id: int, skip: int = 0, page: int = 1, limit: int = 20
     ) -> Page[EventRegistration]:
         """
@@ -148,13 +298,17 @@ class EventRegistrationService:
             Page[EventRegistration]: Página de registros
         """
         query = (
-            self.db.query(EventRegistrationModel)
-            .filter(EventRegistrationModel.event_id == event_id)
+            select(EventRegistrationModel)
+            .where(EventRegistrationModel.event_id == event_id)
             .order_by(EventRegistrationModel.created_at.desc())
         )
 
-        total = query.count()
-        registrations = query.offset(skip).limit(limit).all()
+        total = (
+            await self.db.execute(select(func.count()).select_from(query.subquery()))
+        ).scalar() or 0
+        registrations = (
+            (await self.db.execute(query.offset(skip).limit(limit))).scalars().all()
+        )
 
         registration_schemas = [
             EventRegistration.from_orm(reg) for reg in registrations
@@ -170,7 +324,7 @@ class EventRegistrationService:
             total_pages=total_pages,
         )
 
-    def update_registration(
+    async def update_registration(
         self, registration_id: int, user_id: int, update_data: EventRegistrationUpdate
     ) -> EventRegistration:
         """
@@ -187,58 +341,72 @@ class EventRegistrationService:
         Raises:
             ValueError: Si el registro no existe o no pertenece al usuario
         """
-        registration = (
-            self.db.query(EventRegistrationModel)
-            .filter(
-                and_(
-                    EventRegistrationModel.id == registration_id,
-                    EventRegistrationModel.user_id == user_id,
+        # Escritura condicionada al valor leído: si otra actualización cambia
+        # el registro entre medias se vuelve a leer y a calcular el delta
+        for _ in range(UPDATE_ATTEMPTS):
+            registration = (
+                await self.db.execute(
+                    select(EventRegistrationModel)
+                    .where(
+                        and_(
+                            EventRegistrationModel.id == registration_id,
+                            EventRegistrationModel.user_id == user_id,
+                        )
+                    )
+                    .execution_options(populate_existing=True)
                 )
-            )
-            .first()
-        )
-
-        if not registration:
-            raise ValueError(
-                "Registro no encontrado o no tienes permisos para modificarlo"
-            )
+            ).scalars().first()
 
-        # Verificar capacidad disponible si se cambia el número de participantes
-        if update_data.number_of_participants != registration.number_of_participants:
-            event = (
-                self.db.query(Event).filter(Event.id == registration.event_id).first()
-            )
-
-            current_registrations = (
-                self.db.query(func.sum(EventRegistrationModel.number_of_participants))
-                .filter(EventRegistrationModel.event_id == registration.event_id)
-                .scalar()
-                or 0
-            )
+            if not registration:
+                raise ValueError(
+                    "Registro no encontrado o no tienes permisos para modificarlo"
+                )
 
-            # Restar el registro actual para calcular la capacidad real disponible
-            available_capacity = event.capacity - (  # type:ignore
-                current_registrations - registration.number_of_participants
+            event_id = registration.event_id
+            current = registration.number_of_participants
+            updated = await self.event_registration_repository.update_participants(
+                registration.id, current, update_data.number_of_participants
             )
-
-            if available_capacity < update_data.number_of_participants:
-                raise ValueError(
-                    f"No hay suficiente capacidad. Disponible: {available_capacity}, "
-                    f"Solicitado: {update_data.number_of_participants}"
+            if not updated:
+                await self.db.rollback()
+                continue
+
+            # Ajustar el contador del evento en la misma transacción
+            delta = update_data.number_of_participants - current
+            if delta > 0:
+                reserved = await self.event_registration_repository.reserve_capacity(
+                    event_id, delta
+                )
+                if not reserved:
+                    await self.db.rollback()
+                    event = await self.event_repository.get_event(event_id)
+                    # Restar el registro actual para calcular la capacidad
+                    # real disponible
+                    available_capacity = event.capacity - (  # type:ignore
+                        event.registered_participants - current  # type:ignore
+                    )
+                    raise ValueError(
+                        "No hay suficiente capacidad. "
+                        f"Disponible: {available_capacity}, "
+                        f"Solicitado: {update_data.number_of_participants}"
+                    )
+            elif delta < 0:
+                await self.event_registration_repository.release_capacity(
+                    event_id, -delta
                 )
 
-        # Actualizar el registro
-        setattr(
-            registration, "number_of_participants", update_data.number_of_participants
-        )
-        setattr(registration, "updated_at", datetime.utcnow())
+            await self.db.commit()
+            await self.db.refresh(registration)
+            await response_cache.invalidate(UPCOMING_EVENTS_TAG)
 
-        self.db.commit()
-        self.db.refresh(registration)
+            return EventRegistration.from_orm(registration)
 
-        return EventRegistration.from_orm(registration)
+        raise ValueError(
+            "El registro se ha modificado a la vez desde otra petición, "
+            "inténtalo de nuevo"
+        )
 
-    def cancel_registration(self, eventId: int, user_id: int) -> bool:
+    async def cancel_registration(self, eventId: int, user_id: int) -> bool:
         """
         Cancela un registro de evento.
 
@@ -252,18 +420,33 @@ class EventRegistrationService:
         Raises:
             ValueError: Si el registro no existe o no pertenece al usuario
         """
-        registration = self.event_registration_repository.get_user_is_registered(user_id, eventId)
+        registration = await self.event_registration_repository.get_user_is_registered(user_id, eventId)
 
         if not registration:
             raise ValueError(
                 "Registro no encontrado o no tienes permisos para cancelarlo"
             )
 
-        self.event_registration_repository.delete_registration(registration.id)
+        # Sólo quien borra la fila libera su capacidad, en la misma transacción:
+        # una cancelación concurrente no borra nada y no vuelve a restar
+        deleted = await self.event_registration_repository.delete_registration(
+            registration.id
+        )
+        if deleted is None:
+            await self.db.rollback()
+            raise ValueError(
+                "Registro no encontrado o no tienes permisos para cancelarlo"
+            )
+        event_id, participants = deleted
+        await self.event_registration_repository.release_capacity(
+            event_id, participants
+        )
+        await self.db.commit()
+        await response_cache.invalidate(UPCOMING_EVENTS_TAG)
 
         return True
 
-    def get_registration_by_id(
+    async def get_registration_by_id(
         self, registration_id: int
     ) -> Optional[EventRegistration]:
         """
@@ -275,14 +458,14 @@ class EventRegistrationService:
         Returns:
             EventRegistration: El registro encontrado o None
         """
-        registration = self.event_registration_repository.get_registration_by_id(registration_id)
+        registration = await self.event_registration_repository.get_registration_by_id(registration_id)
 
         if not registration:
             return None
 
         return EventRegistration.from_orm(registration)
 
-    def get_event_capacity_info(self, event_id: int) -> dict:
+    async def get_event_capacity_info(self, event_id: int) -> dict:
         """
         Obtiene información de capacidad de un evento.
 
@@ -292,12 +475,12 @@ class EventRegistrationService:
         Returns:
             dict: Información de capacidad
         """
-        event = self.event_registration_repository.get_event_by_id(event_id)
+        event = await self.event_repository.get_event(event_id)
 
         if not event:
             raise ValueError("Evento no encontrado")
 
-        total_registrations = self.event_registration_repository.get_event_capacity_info(event_id)
+        total_registrations = event.registered_participants
 
         return {
             "event_id": event_id,
@@ -307,7 +490,7 @@ class EventRegistrationService:
             "is_full": total_registrations >= event.capacity,
         }
 
-    def get_user_registration_for_event(
+    async def get_user_registration_for_event(
         self, user_id: int, event_id: int
     ) -> Optional[EventRegistration]:
         """
@@ -320,7 +503,7 @@ class EventRegistrationService:
         Returns:
             EventRegistration: El registro encontrado o None
         """
-        registration = self.event_registration_repository.get_user_is_registered(user_id, event_id)
+        registration = await self.event_registration_repository.get_user_is_registered(user_id, event_id)
 
         if not registration:
             return None
@@ -2,13 +2,27 @@ import math
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.schemas.event_schemas import Event, EventCreate, EventUpdate
-from app.api.schemas.pagination_schema import Page
+from app.api.schemas.event_schemas import (
+    Event,
+    EventCreate,
+    EventUpdate,
+    EventWithCapacity,
+)
+from app.api.schemas.pagination_schema import CountMode, Page
+from app.core.cache import (
+    EVENT_LISTS_TAG,
+    UPCOMING_EVENTS_TAG,
+    event_sessions_tag,
+    event_tag,
+    response_cache,
+)
+from app.core.conditional import Validator, make_etag
 from app.infrastructure.repositories.event_repository import EventRepository
 from app.services.validators.event_validators import (
     validate_event_data,
+    validate_event_uniqueness,
     validate_event_update_data,
 )
 
@@ -16,16 +30,52 @@ from app.services.validators.event_validators import (
 class EventService:
     """Servicio para gestionar eventos con lógica de negocio"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Inicializa el servicio con la sesión de base de datos"""
         self.db = db
         self.event_repository = EventRepository(db)
 
-    def get_all_events(self, skip: int = 0, page: int = 1, limit: int = 100) -> Page:
-        """Get all events with business logic validation."""
-        events = self.event_repository.get_all_events(skip=skip, limit=limit)
-        eventList = [Event.model_validate(event) for event in events]
-        total_events = self.event_repository.get_events_count()
+    async def get_all_events(
+        self,
+        skip: int = 0,
+        page: int = 1,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        count_mode: CountMode = CountMode.NONE,
+    ) -> Page:
+        """
+        Get all events with business logic validation.
+
+        When ``cursor`` is not None (an empty string starts from the first page)
+        events are paginated by (start_date, id) instead of OFFSET; those pages
+        only count the events when ``count_mode`` asks for it and never have
+        ``total_pages``. ``fields`` (see ``parse_event_fields``) selects a
+        sparse fieldset.
+        """
+        if cursor is not None:
+            events, next_cursor = await self.event_repository.get_all_events_by_cursor(
+                cursor=cursor, limit=limit, fields=fields
+            )
+            total_events, estimated = await self.event_repository.get_events_total(
+                count_mode
+            )
+            return Page(
+                items=self._to_event_items(events, fields),
+                page=page,
+                size=limit,
+                total_items=total_events,
+                total_pages=None,
+                total_is_estimate=estimated,
+                has_next=next_cursor is not None,
+                next_cursor=next_cursor,
+            )
+
+        events = await self.event_repository.get_all_events(
+            skip=skip, limit=limit, fields=fields
+        )
+        eventList = self._to_event_items(events, fields)
+        total_events = await self.event_repository.get_events_count()
         total_pages = math.ceil(total_events / limit) if total_events > 0 else 1
 
         return Page(
@@ -36,44 +86,67 @@ class EventService:
             total_pages=total_pages,
         )
 
-    def get_total_events_count(self) -> int:
+    async def get_total_events_count(self) -> int:
         """Get the total number of events."""
-        return self.event_repository.get_events_count()
+        return await self.event_repository.get_events_count()
 
-    def get_event_by_id(self, event_id: int) -> Optional[Event]:
+    async def get_event_by_id(self, event_id: int) -> Optional[Event]:
         """Get event by ID with business logic validation."""
-        event = self.event_repository.get_event(event_id)
+        event = await self.event_repository.get_event(event_id)
         if event:
             return Event.model_validate(event)
         return None
 
-    def create_new_event(self, event_data: EventCreate) -> Event:
+    async def get_event_validator(self, event_id: int) -> Optional[Validator]:
+        """HTTP validator (ETag, Last-Modified) of an event, or None if missing."""
+        version = await self.event_repository.get_event_version(event_id)
+        if version is None:
+            return None
+        created_at, updated_at = version
+        return Validator(
+            etag=make_etag("event", event_id, created_at, updated_at),
+            last_modified=updated_at or created_at,
+        )
+
+    async def create_new_event(self, event_data: EventCreate) -> Event:
         """Create new event with business logic validation."""
-        events = self.event_repository.get_all_events()
         # Validate event data
-        validate_event_data(event_data, events)
+        validate_event_data(event_data)
+        await validate_event_uniqueness(event_data, self.event_repository)
 
-        event = self.event_repository.create_event(event_data)
+        event = await self.event_repository.create_event(event_data)
+        await response_cache.invalidate(EVENT_LISTS_TAG, UPCOMING_EVENTS_TAG)
         return Event.model_validate(event)
 
-    def update_event(self, event_id: int, event_data: EventUpdate) -> Optional[Event]:
+    async def update_event(self, event_id: int, event_data: EventUpdate) -> Optional[Event]:
         """Update existing event with business logic validation."""
-        current_event = self.event_repository.get_event(event_id)
+        current_event = await self.event_repository.get_event(event_id)
         if not current_event:
             raise ValueError("Event not found")
 
         validate_event_update_data(event_data, current_event)
 
-        updated_event = self.event_repository.update_event(event_id, event_data)
+        updated_event = await self.event_repository.update_event(event_id, event_data)
+        await response_cache.invalidate(
+            EVENT_LISTS_TAG, UPCOMING_EVENTS_TAG, event_tag(event_id)
+        )
         if updated_event:
             return Event.model_validate(updated_event)
         return None
 
-    def delete_event(self, event_id: int) -> bool:
+    async def delete_event(self, event_id: int) -> bool:
         """Delete existing event with business logic validation."""
-        return self.event_repository.delete_event(event_id)
+        deleted = await self.event_repository.delete_event(event_id)
+        if deleted:
+            await response_cache.invalidate(
+                EVENT_LISTS_TAG,
+                UPCOMING_EVENTS_TAG,
+                event_tag(event_id),
+                event_sessions_tag(event_id),
+            )
+        return deleted
 
-    def search_events(
+    async def search_events(
         self,
         title: Optional[str] = None,
         location: Optional[str] = None,
@@ -83,10 +156,13 @@ class EventService:
         page: int = 1,
         skip: int = 0,
         limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        q: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> Page[Event]:
         """Search events by multiple criteria with business logic validation."""
 
-        events = self.event_repository.search_events(
+        result = await self.event_repository.search_events(
             title=title,
             location=location,
             is_active=is_active,
@@ -94,92 +170,62 @@ class EventService:
             date_to=date_to,
             skip=skip,
             limit=limit,
+            count_mode=count_mode,
+            q=q,
+            fields=fields,
         )
-        eventList = [Event.model_validate(event) for event in events]
-        total_events = len(eventList)
-        total_pages = math.ceil(total_events / limit) if total_events > 0 else 1
+        eventList = self._to_event_items(result.rows, fields)
+        return self._to_search_page(eventList, result, page, limit)
+
+    def _to_event_items(self, rows: List[dict], fields: Optional[List[str]]) -> list:
+        """Event schemas, or plain dicts restricted to ``fields`` (sparse fieldset)."""
+        if fields is None:
+            return [Event.model_validate(row) for row in rows]
+        return [{name: row[name] for name in fields} for row in rows]
+
+    def _to_search_page(self, items: list, result, page: int, limit: int) -> Page:
+        """Build a search Page from the items and the counted repository result."""
+        total_pages = None
+        if result.total is not None:
+            total_pages = math.ceil(result.total / limit) if result.total > 0 else 1
 
         return Page(
-            items=eventList,
+            items=items,
             page=page,
             size=limit,
-            total_items=total_events,
+            total_items=result.total,
             total_pages=total_pages,
+            total_is_estimate=result.estimated,
+            has_next=result.has_next,
         )
 
-    def get_all_events_with_capacity(
+    async def get_all_events_with_capacity(
         self, skip: int = 0, page: int = 1, limit: int = 100
     ) -> Page:
         """Get all events with capacity information."""
-        from app.api.schemas.event_schemas import EventWithCapacity
-
-        events = self.event_repository.get_all_events(skip=skip, limit=limit)
-        total_events = self.event_repository.get_events_count()
+        rows = await self.event_repository.get_all_events_with_capacity(
+            skip=skip, limit=limit
+        )
+        total_events = await self.event_repository.get_events_count()
         total_pages = math.ceil(total_events / limit) if total_events > 0 else 1
 
-        # Convert to EventWithCapacity
-        events_with_capacity = []
-        for event in events:
-            # Get registration count for this event
-            from sqlalchemy import func
-
-            from app.db.models.event_register_models import EventRegistration
-
-            registration_count = (
-                self.db.query(func.sum(EventRegistration.number_of_participants))
-                .filter(EventRegistration.event_id == event.id)
-                .scalar()
-                or 0
-            )
-
-            event_dict = Event.model_validate(event).dict()
-            event_dict.update(
-                {
-                    "registered_participants": registration_count,
-                    "available_capacity": event.capacity - registration_count,
-                }
-            )
-            events_with_capacity.append(EventWithCapacity(**event_dict))
-
         return Page(
-            items=events_with_capacity,
+            items=[EventWithCapacity.from_row(*row) for row in rows],
             page=page,
             size=limit,
             total_items=total_events,
             total_pages=total_pages,
         )
 
-    def get_event_by_id_with_capacity(self, event_id: int):
+    async def get_event_by_id_with_capacity(self, event_id: int):
         """Get event by ID with capacity information."""
-        from app.api.schemas.event_schemas import EventWithCapacity
-
-        event = self.event_repository.get_event(event_id)
-        if not event:
+        row = await self.event_repository.get_event_with_capacity(event_id)
+        if not row:
             return None
 
-        # Obtener conteo de registros para este evento
-        from sqlalchemy import func
+        return EventWithCapacity.from_row(*row)
 
-        from app.db.models.event_register_models import EventRegistration
-
-        registration_count = (
-            self.db.query(func.sum(EventRegistration.number_of_participants))
-            .filter(EventRegistration.event_id == event.id)
-            .scalar()
-            or 0
-        )
-
-        event_dict = Event.model_validate(event).dict()
-        event_dict.update(
-            {
-                "registered_participants": registration_count,
-                "available_capacity": event.capacity - registration_count,
-            }
-        )
-
-        return EventWithCapacity(**event_dict)
-
-    def search_events_with_capacity(
+    async def search_events_with_capacity(
         self,
         title: Optional[str] = None,
         location: Optional[str] = None,
@@ -189,11 +235,11 @@ class EventService:
         page: int = 1,
         skip: int = 0,
         limit: int = 100,
+        count_mode: CountMode = CountMode.EXACT,
+        q: Optional[str] = None,
     ) -> Page:
         """Search events by multiple criteria with capacity information."""
-        from app.api.schemas.event_schemas import EventWithCapacity
-
-        events = self.event_repository.search_events(
+        result = await self.event_repository.search_events_with_capacity(
             title=title,
             location=location,
             is_active=is_active,
@@ -201,89 +247,25 @@ class EventService:
             date_to=date_to,
             skip=skip,
             limit=limit,
+            count_mode=count_mode,
+            q=q,
         )
 
-        # Convert to EventWithCapacity
-        events_with_capacity = []
-        for event in events:
-            # Get registration count for this event
-            from sqlalchemy import func
-
-            from app.db.models.event_register_models import EventRegistration
-
-            registration_count = (
-                self.db.query(func.sum(EventRegistration.number_of_participants))
-                .filter(EventRegistration.event_id == event.id)
-                .scalar()
-                or 0
-            )
-
-            event_dict = Event.model_validate(event).dict()
-            event_dict.update(
-                {
-                    "registered_participants": registration_count,
-                    "available_capacity": event.capacity - registration_count,
-                }
-            )
-            events_with_capacity.append(EventWithCapacity(**event_dict))
-
-        # Get total count for pagination
-        total_events = self.event_repository.get_events_count()
-        total_pages = math.ceil(total_events / limit) if total_events > 0 else 1
-
-        return Page(
-            items=events_with_capacity,
-            page=page,
-            size=limit,
-            total_items=total_events,
-            total_pages=total_pages,
-        )
+        items = [EventWithCapacity.from_row(*row) for row in result.rows]
+        return self._to_search_page(items, result, page, limit)
 
-    def get_upcoming_events_with_capacity(
+    async def get_upcoming_events_with_capacity(
         self, skip: int = 0, page: int = 1, limit: int = 100
     ) -> Page:
         """Get upcoming events with capacity information."""
-        from sqlalchemy import and_, func
-
-        from app.api.schemas.event_schemas import EventWithCapacity
-        from app.db.models.event_models import Event
-        from app.db.models.event_register_models import EventRegistration
-
-        now = datetime.utcnow()
-
-        # Consultar eventos próximos
-        query = (
-            self.db.query(Event)
-            .filter(and_(Event.start_date > now, Event.is_active == True))
-            .order_by(Event.start_date.asc())
+        rows = await self.event_repository.get_upcoming_events_with_capacity(
+            skip=skip, limit=limit
         )
-
-        total_events = query.count()
-        events = query.offset(skip).limit(limit).all()
-
-        # Convertir a EventWithCapacity
-        events_with_capacity = []
-        for event in events:
-            registration_count = (
-                self.db.query(func.sum(EventRegistration.number_of_participants))
-                .filter(EventRegistration.event_id == event.id)
-                .scalar()
-                or 0
-            )
-
-            event_dict = Event.model_validate(event).dict()
-            event_dict.update(
-                {
-                    "registered_participants": registration_count,
-                    "available_capacity": event.capacity - registration_count,
-                }
-            )
-            events_with_capacity.append(EventWithCapacity(**event_dict))
-
+        total_events = await self.event_repository.get_upcoming_events_count()
         total_pages = math.ceil(total_events / limit) if total_events > 0 else 1
 
         return Page(
-            items=events_with_capacity,
+            items=[EventWithCapacity.from_row(*row) for row in rows],
             page=page,
             size=limit,
             total_items=total_events,
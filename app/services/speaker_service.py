@@ -2,17 +2,26 @@ import math
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.schemas.speaker_schemas import Speaker
+from app.core.conditional import Validator, make_etag
 from app.infrastructure.repositories.speaker_repository import SpeakerRepository
 
 
 class SpeakerService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
         self.speaker_repository = SpeakerRepository(db)
 
-    def get_all_speakers(self) -> List[Speaker]:
-        speakers = self.speaker_repository.get_all_speakers()
+    async def get_all_speakers(self) -> List[Speaker]:
+        speakers = await self.speaker_repository.get_all_speakers()
         return [Speaker.from_orm(speaker) for speaker in speakers]
+
+    async def get_speakers_validator(self) -> Validator:
+        """HTTP validator (ETag, Last-Modified) of the speakers listing."""
+        count, max_id, last_change = await self.speaker_repository.get_speakers_version()
+        return Validator(
+            etag=make_etag("speakers", count, max_id, last_change),
+            last_modified=last_change,
+        )
@@ -1,21 +1,30 @@
-from app.api.schemas.event_schemas import Event, EventCreate, EventUpdate
+from typing import List, Optional
 
-def validate_event_data(event_data: EventCreate, existing_events):
+from app.api.schemas.event_schemas import (
+    EVENT_LIST_FIELDS,
+    Event,
+    EventCreate,
+    EventUpdate,
+)
+from app.infrastructure.repositories.event_repository import EventRepository
+
+
+def validate_event_data(event_data: EventCreate):
     if event_data.end_date <= event_data.start_date:
         raise ValueError("End date must be after start date")
 
     if event_data.capacity < 0:
         raise ValueError("Capacity must be a positive number")
 
-    for event in existing_events:
-        if event.title == event_data.title:
-            raise ValueError("Event with this title already exists")
 
-        if (event.start_date.date() == event_data.start_date.date() and
-            event.end_date.date() == event_data.end_date.date()):
-            if (event.start_date.time() == event_data.start_date.time() or
-                event.end_date.time() == event_data.end_date.time()):
-                raise ValueError("Event with the same date and time already exists")
+async def validate_event_uniqueness(event_data: EventCreate, event_repository: EventRepository):
+    # Consultas puntuales por índice en lugar de recorrer los eventos existentes
+    if await event_repository.title_exists(event_data.title):
+        raise ValueError("Event with this title already exists")
+
+    if await event_repository.slot_exists(event_data.start_date, event_data.end_date):
+        raise ValueError("Event with the same date and time already exists")
+
 
 def validate_event_update_data(event_data: EventUpdate, current_event: Event):
     if not current_event:
@@ -33,4 +42,19 @@ def validate_event_update_data(event_data: EventUpdate, current_event: Event):
     
     if event_data.location and event_data.location != current_event.location:
         raise ValueError("Location cannot be changed")
-    
\ No newline at end of file
+
+
+def parse_event_fields(fields: Optional[str]) -> Optional[List[str]]:
+    # Conjunto disperso de campos (?fields=title,start_date); None = respuesta completa
+    if fields is None or not fields.strip():
+        return None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(EVENT_LIST_FIELDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}. "
+            f"Allowed: {', '.join(EVENT_LIST_FIELDS)}"
+        )
+    # id siempre se incluye; orden estable del esquema para la clave de caché
+    return [name for name in EVENT_LIST_FIELDS if name in requested or name == "id"]
@@ -0,0 +1,70 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Hashable, List, Sequence, Set, Tuple
+
+
+def validate_session_schedule(session_data, event_start: datetime, event_end: datetime) -> None:
+    """Validaciones de horario de una sesión respecto a su evento"""
+
+    # Validación 1: Verificar que el evento existe
+    if not event_start or not event_end:
+        raise ValueError("Event dates are required")
+
+    # Validación 2: Verificar que el horario está dentro del rango del evento
+    if session_data.start_time < event_start or session_data.end_time > event_end:
+        raise ValueError("Session schedule must be within the event's date range")
+
+    # Validación 3: Verificar que la sesión no empiece antes del evento
+    if session_data.start_time < event_start:
+        raise ValueError("Session cannot start before the event")
+
+    # Validación 4: Verificar que la sesión no termine después del evento
+    if session_data.end_time > event_end:
+        raise ValueError("Session cannot end after the event")
+
+    # Validación 5: Verificar que no hay sesiones en horarios no laborables (opcional)
+    # Solo permitir sesiones entre 8:00 AM y 10:00 PM
+    start_hour = session_data.start_time.hour
+    end_hour = session_data.end_time.hour
+
+    if start_hour < 8 or end_hour > 22:
+        raise ValueError("Sessions can only be scheduled between 8:00 AM and 10:00 PM")
+
+    # Validación 6: Verificar que no hay sesiones que crucen la medianoche
+    if session_data.start_time.date() != session_data.end_time.date():
+        raise ValueError("Sessions cannot span across midnight")
+
+    # Validación 7: Verificar que hay tiempo suficiente entre sesiones (mínimo 15 minutos)
+    # Esta validación se hace en check_schedule_conflicts_with_buffer
+
+
+def find_schedule_conflicts(
+    existing: Sequence[Tuple[datetime, datetime]],
+    candidates: Sequence[Tuple[Hashable, datetime, datetime]],
+    buffer: timedelta,
+) -> Set[Hashable]:
+    """
+    Claves de las sesiones candidatas a menos de ``buffer`` de otra sesión.
+
+    Barrido por hora de inicio en O(n log n): las sesiones existentes siempre
+    se mantienen (máximo de sus finales por prefijo y bisect) y, entre las
+    candidatas, gana la que empieza antes; las aceptadas no se solapan, así
+    que basta con comparar con el final de la última aceptada.
+    """
+    existing = sorted(existing)
+    starts = [start for start, _ in existing]
+    max_ends: List[datetime] = list(accumulate((end for _, end in existing), max))
+
+    conflicts = set()
+    last_end = None
+    for key, start, end in sorted(candidates, key=lambda c: (c[1], c[2])):
+        # Existentes que empiezan antes del fin del margen y terminan después de su inicio
+        index = bisect_left(starts, end + buffer)
+        if index and max_ends[index - 1] > start - buffer:
+            conflicts.add(key)
+        elif last_end is not None and last_end > start - buffer:
+            conflicts.add(key)
+        else:
+            last_end = end
+    return conflicts
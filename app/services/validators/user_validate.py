@@ -3,7 +3,7 @@ from app.db.models import User as UserModel
 from app.infrastructure.repositories.user_repository import UserRepository
 
 
-def validate_user(user: UserCreate, user_repository: UserRepository) -> UserCreate:
+async def validate_user(user: UserCreate, user_repository: UserRepository) -> UserCreate:
     """Validate a user."""
     if not user.username:
         raise ValueError("Username is required")
@@ -22,11 +22,11 @@ def validate_user(user: UserCreate, user_repository: UserRepository) -> UserCrea
     if not user.role_id:
         raise ValueError("Role is required")
     # si el user name ya existe, lanzar un error
-    if user_repository.get_user_by_username(user.username):
+    if await user_repository.get_user_by_username(user.username):
         raise ValueError("Username already exists")
 
     # si el email ya existe, lanzar un error
-    if user_repository.get_user_by_email(user.email):
+    if await user_repository.get_user_by_email(user.email):
         raise ValueError("Email already exists")
 
     return user
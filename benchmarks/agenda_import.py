@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la importación de agendas frente al alta fila a fila.
+
+Crea una base SQLite temporal y da de alta --events eventos con --sessions
+sesiones cada uno de dos formas:
+  loop    EventService.create_new_event y SessionService.create_session por
+          fila (lo que hoy hace un script con POST /events/ y POST /sessions/)
+  import  AgendaImportService.import_agenda sobre el mismo fichero en NDJSON,
+          leído en trozos de 64 KiB como lo entrega request.stream()
+
+Uso:
+  python -m benchmarks.agenda_import [--events 200] [--sessions 8]
+                                     [--batch-size 500]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.schemas.event_schemas import EventCreate
+from app.api.schemas.session_schemas import SessionCreate
+from app.core.cache import response_cache
+from app.db.base import Base
+from app.db.models import Event
+from app.db.models import Session as EventSession
+from app.infrastructure.record_streams import iter_records
+from app.services.agenda_import_service import AgendaImportService
+from app.services.event_service import EventService
+from app.services.session_service import SessionService
+
+CHUNK_SIZE = 64 * 1024
+
+
+def agenda(prefix: str, events: int, sessions: int, offset: int) -> List[dict]:
+    """Rows of one event per day, each with sessions every 90 minutes from 9:00."""
+    # Cada variante en sus propios días: dos eventos no pueden compartir franja
+    first_day = (datetime.now() + timedelta(days=30 + offset)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    rows = []
+    for n in range(events):
+        day = first_day + timedelta(days=n)
+        ref = f"{prefix}-{n}"
+        rows.append(
+            {
+                "type": "event",
+                "ref": ref,
+                "title": f"{prefix.title()} Conference {n}",
+                "location": "Bench Hall",
+                "start_date": (day + timedelta(hours=8)).isoformat(),
+                "end_date": (day + timedelta(hours=22)).isoformat(),
+                "capacity": 500,
+            }
+        )
+        for s in range(sessions):
+            start = day + timedelta(hours=9, minutes=90 * s)
+            rows.append(
+                {
+                    "type": "session",
+                    "event_ref": ref,
+                    "title": f"Talk {s}",
+                    "start_time": start.isoformat(),
+                    "end_time": (start + timedelta(hours=1)).isoformat(),
+                }
+            )
+    return rows
+
+
+async def run_loop(db: AsyncSession, rows: List[dict]) -> None:
+    event_service = EventService(db)
+    session_service = SessionService(db)
+    event_ids = {}
+    for row in rows:
+        row = dict(row)
+        if row.pop("type") == "event":
+            event = await event_service.create_new_event(
+                EventCreate.model_validate(row)
+            )
+            event_ids[row["ref"]] = event.id
+        else:
+            row["event_id"] = event_ids[row.pop("event_ref")]
+            await session_service.create_session(SessionCreate.model_validate(row))
+
+
+async def run_import(db: AsyncSession, rows: List[dict], batch_size: int) -> None:
+    body = "\n".join(json.dumps(row) for row in rows).encode()
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for offset in range(0, len(body), CHUNK_SIZE):
+            yield body[offset : offset + CHUNK_SIZE]
+
+    report = await AgendaImportService(db).import_agenda(
+        iter_records(chunks(), "ndjson"), batch_size=batch_size
+    )
+    assert not report.errors, report.errors[0]
+
+
+async def run(events: int, sessions: int, batch_size: int) -> None:
+    # El benchmark mide la base de datos, no la invalidación de la caché
+    response_cache.enabled = False
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+        variants = {
+            "loop": run_loop,
+            "import": lambda db, rows: run_import(db, rows, batch_size),
+        }
+        print(f"📥 {events} events x {sessions} sessions, batch size {batch_size}")
+        baseline = None
+        for n, (name, fn) in enumerate(variants.items()):
+            rows = agenda(name, events, sessions, n * events)
+            async with sessionmaker() as db:
+                started = time.perf_counter()
+                await fn(db, rows)
+                seconds = time.perf_counter() - started
+                created = await db.scalar(
+                    select(func.count())
+                    .select_from(EventSession)
+                    .join(Event, Event.id == EventSession.event_id)
+                    .where(Event.title.like(f"{name.title()} Conference %"))
+                )
+            assert created == events * sessions
+            baseline = baseline or seconds
+            print(
+                f"   {name:<6} {seconds:8.3f} s {len(rows) / seconds:10.0f} rows/s"
+                f"  x{baseline / seconds:.1f}"
+            )
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agenda import benchmark")
+    parser.add_argument("--events", type=int, default=200, help="Events to create")
+    parser.add_argument(
+        "--sessions", type=int, default=8, help="Sessions per event (max 8)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Rows per import transaction"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.events, min(args.sessions, 8), args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark del registro en lote frente al bucle de registros individuales.
+
+Crea una base SQLite temporal con --users usuarios y --events eventos y
+registra a cada usuario en cada evento de dos formas:
+  loop   EventRegistrationService.register_user_to_event por elemento (lo que
+         hace hoy un socio corporativo con POST /event-registrations/ repetidos)
+  batch  EventRegistrationService.register_users_batch en lotes de --batch-size
+
+Uso:
+  python -m benchmarks.batch_registration [--users 500] [--events 2]
+                                          [--batch-size 1000]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.schemas.event_registration_schemas import (
+    EventRegistrationBatchCreate,
+    EventRegistrationBatchItem,
+    EventRegistrationCreate,
+)
+from app.core.cache import response_cache
+from app.db.base import Base
+from app.db.models import Event, EventRegistration, Role, User
+from app.services.event_registration_service import EventRegistrationService
+
+
+async def seed(db: AsyncSession, users: int, events: int) -> Tuple[List[int], List[int]]:
+    """Create the users and two sets of events (one per variant)."""
+    role = Role(name="user")
+    db.add(role)
+    await db.flush()
+    await db.execute(
+        insert(User),
+        [
+            {
+                "username": f"corp_{n}",
+                "first_name": "Corp",
+                "last_name": str(n),
+                "phone": "+34 600 000 000",
+                "email": f"corp_{n}@bench.local",
+                "password": "not-used",
+                "is_active": True,
+                "role_id": role.id,
+            }
+            for n in range(users)
+        ],
+    )
+    start = datetime(2030, 1, 1, 9)
+    await db.execute(
+        insert(Event),
+        [
+            {
+                "title": f"Corporate Summit {n}",
+                "location": "Bench Hall",
+                "start_date": start,
+                "end_date": start + timedelta(hours=8),
+                "capacity": users * 10,
+                "is_active": True,
+            }
+            for n in range(events * 2)
+        ],
+    )
+    await db.commit()
+    user_ids = list((await db.scalars(select(User.id).order_by(User.id))).all())
+    event_ids = list((await db.scalars(select(Event.id).order_by(Event.id))).all())
+    return user_ids, event_ids
+
+
+async def run_loop(db: AsyncSession, items: List[EventRegistrationBatchItem]) -> None:
+    service = EventRegistrationService(db)
+    for item in items:
+        await service.register_user_to_event(
+            item.user_id,
+            EventRegistrationCreate(
+                event_id=item.event_id,
+                number_of_participants=item.number_of_participants,
+            ),
+        )
+
+
+async def run_batch(
+    db: AsyncSession, items: List[EventRegistrationBatchItem], batch_size: int
+) -> None:
+    service = EventRegistrationService(db)
+    for offset in range(0, len(items), batch_size):
+        result = await service.register_users_batch(
+            EventRegistrationBatchCreate(items=items[offset : offset + batch_size])
+        )
+        assert result.failed == 0, result.results[0]
+
+
+async def run(users: int, events: int, batch_size: int) -> None:
+    # El benchmark mide la base de datos, no la invalidación de la caché
+    response_cache.enabled = False
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[
+                    Role.__table__,
+                    User.__table__,
+                    Event.__table__,
+                    EventRegistration.__table__,
+                ],
+            )
+        sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with sessionmaker() as db:
+            user_ids, event_ids = await seed(db, users, events)
+
+        def items_for(ids: List[int]) -> List[EventRegistrationBatchItem]:
+            return [
+                EventRegistrationBatchItem(user_id=user_id, event_id=event_id)
+                for event_id in ids
+                for user_id in user_ids
+            ]
+
+        variants = {
+            "loop": lambda db, items: run_loop(db, items),
+            "batch": lambda db, items: run_batch(db, items, batch_size),
+        }
+        print(f"📦 {users} users x {events} events, batch size {batch_size}")
+        baseline = None
+        for n, (name, fn) in enumerate(variants.items()):
+            items = items_for(event_ids[n * events : (n + 1) * events])
+            async with sessionmaker() as db:
+                started = time.perf_counter()
+                await fn(db, items)
+                seconds = time.perf_counter() - started
+                registered = await db.scalar(
+                    select(func.count())
+                    .select_from(EventRegistration)
+                    .where(
+                        EventRegistration.event_id.in_({i.event_id for i in items})
+                    )
+                )
+            assert registered == len(items)
+            baseline = baseline or seconds
+            print(
+                f"   {name:<6} {seconds:8.3f} s {len(items) / seconds:10.0f} registrations/s"
+                f"  x{baseline / seconds:.1f}"
+            )
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch registration benchmark")
+    parser.add_argument("--users", type=int, default=500, help="Users to register")
+    parser.add_argument("--events", type=int, default=2, help="Events per variant")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Registrations per batch"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.users, args.events, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
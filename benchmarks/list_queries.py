@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del coste de leer una página de GET /events/.
+
+Crea una base SQLite temporal con --events eventos de descripción larga
+(--description bytes) y compara, por página de --size elementos:
+  entities   select(Event) + Event.model_validate (comportamiento anterior)
+  projected  columnas de la respuesta (EventRepository.get_all_events)
+  sparse     ?fields=title,start_date: sólo id, title y start_date
+
+Para cada variante informa de los bytes de valores leídos de la base de datos,
+la memoria asignada en Python (tracemalloc) y el tiempo por página.
+
+Uso:
+  python -m benchmarks.list_queries [--events 2000] [--size 100]
+                                    [--description 4000] [--rounds 50]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Iterable
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.api.schemas.event_schemas import Event
+from app.db.models import Event as EventModel
+from app.infrastructure.repositories.event_repository import EventRepository
+from app.services.validators.event_validators import parse_event_fields
+
+
+def value_bytes(values: Iterable) -> int:
+    """Approximate size of the fetched values (what crosses the driver)."""
+    return sum(len(str(value)) for value in values if value is not None)
+
+
+async def seed(db: AsyncSession, events: int, description: int) -> None:
+    start = datetime(2030, 1, 1, 9)
+    text = ("Lorem ipsum dolor sit amet. " * (description // 28 + 1))[:description]
+    await db.execute(
+        insert(EventModel),
+        [
+            {
+                "title": f"Python Conference {n}",
+                "description": text,
+                "location": "Centro de Congresos Madrid",
+                "start_date": start + timedelta(hours=n),
+                "end_date": start + timedelta(hours=n + 8),
+                "capacity": 500,
+                "is_active": True,
+            }
+            for n in range(events)
+        ],
+    )
+    await db.commit()
+
+
+async def entities_page(db: AsyncSession, size: int) -> int:
+    result = await db.execute(select(EventModel).limit(size))
+    rows = list(result.scalars().all())
+    items = [Event.model_validate(row) for row in rows]
+    fetched = value_bytes(
+        getattr(row, column.key) for row in rows for column in EventModel.__table__.c
+    )
+    # La sesión conserva las entidades en el identity map: se liberan como antes
+    db.expunge_all()
+    del items
+    return fetched
+
+
+async def projected_page(db: AsyncSession, size: int, fields=None) -> int:
+    rows = await EventRepository(db).get_all_events(limit=size, fields=fields)
+    if fields is None:
+        items = [Event.model_validate(row) for row in rows]
+    else:
+        items = [{name: row[name] for name in fields} for row in rows]
+    del items
+    return value_bytes(value for row in rows for value in row.values())
+
+
+async def measure(fn: Callable[[], Awaitable[int]], rounds: int):
+    """(bytes fetched, peak bytes allocated, mean seconds) per page."""
+    fetched = await fn()
+
+    tracemalloc.start()
+    await fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await fn()
+    return fetched, peak, (time.perf_counter() - started) / rounds
+
+
+async def run(events: int, size: int, description: int, rounds: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}"
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(EventModel.__table__.create)
+        sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with sessionmaker() as db:
+            await seed(db, events, description)
+            sparse = parse_event_fields("title,start_date")
+            variants = {
+                "entities": lambda: entities_page(db, size),
+                "projected": lambda: projected_page(db, size),
+                "sparse": lambda: projected_page(db, size, sparse),
+            }
+
+            print(
+                f"📦 {events} events, {description} B descriptions, "
+                f"pages of {size}, {rounds} rounds"
+            )
+            for name, fn in variants.items():
+                fetched, peak, seconds = await measure(fn, rounds)
+                print(
+                    f"   {name:<10} {fetched / 1024:9.1f} KiB fetched "
+                    f"{peak / 1024:9.1f} KiB allocated {seconds * 1000:8.3f} ms/page"
+                )
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event list query micro-benchmark")
+    parser.add_argument("--events", type=int, default=2000, help="Events to seed")
+    parser.add_argument("--size", type=int, default=100, help="Events per page")
+    parser.add_argument(
+        "--description", type=int, default=4000, help="Description length in bytes"
+    )
+    parser.add_argument("--rounds", type=int, default=50, help="Pages per variant")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.events, args.size, args.description, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
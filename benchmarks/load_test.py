@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Suite de pruebas de carga de la API.
+
+Escenarios:
+  browse    listados, detalle y sesiones de eventos (paginación y cursor)
+  search    búsqueda de eventos por texto, título y ubicación
+  login     logins concurrentes (bcrypt)
+  register  registros a eventos
+  schedule  un organizador creando sesiones en eventos
+
+Uso:
+  python -m benchmarks.load_test seed --scale 10000
+  python -m benchmarks.load_test run [--scenarios browse,search] [--requests 2000]
+                                     [--concurrency 50] [--base-url http://localhost:8080]
+                                     [--json report.json] [--baseline report.json]
+
+`seed` crea un dataset sintético con app/db/seed_data.py (10k/100k/1M usuarios).
+`run` informa throughput y latencias p50/p95/p99 por escenario; con --baseline
+sale con código 1 si algún escenario empeora más de --max-regression por ciento
+su p95 o su throughput. Sin --base-url las peticiones se envían en proceso a la
+aplicación ASGI usando la base de datos configurada en DATABASE_URL.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import SessionLocal
+from app.db.models import Event, User
+from app.db.seed_data import (
+    BENCHMARK_ORGANIZER,
+    BENCHMARK_PASSWORD,
+    SCALED_CITIES,
+    SCALED_TOPICS,
+    create_scaled_seed_data,
+)
+from benchmarks.registration_rush import percentile
+
+API = settings.api_v1_str
+SCENARIOS = ["browse", "search", "login", "register", "schedule"]
+# Máximo de ids cargados para elegir objetivos aleatorios
+SAMPLE_SIZE = 10000
+
+# Una petición: (método, ruta, json, cabeceras)
+Request = Tuple[str, str, Optional[dict], Optional[dict]]
+
+
+class Dataset:
+    """Ids of the synthetic dataset used to build requests."""
+
+    def __init__(self, event_ids: List[int], users: List[Tuple[int, str]], organizer_id: int):
+        self.event_ids = event_ids
+        self.users = users
+        self.organizer_id = organizer_id
+
+    @classmethod
+    def load(cls) -> "Dataset":
+        db = SessionLocal()
+        try:
+            event_ids = list(
+                db.scalars(
+                    select(Event.id)
+                    .where(Event.description == "Synthetic event for load testing")
+                    .order_by(func.random())
+                    .limit(SAMPLE_SIZE)
+                )
+            )
+            users = [
+                (int(user_id), str(username))
+                for user_id, username in db.execute(
+                    select(User.id, User.username)
+                    .where(User.username.like("bench_user_%"))
+                    .order_by(func.random())
+                    .limit(SAMPLE_SIZE)
+                )
+            ]
+            organizer_id = db.scalar(
+                select(User.id).where(User.username == BENCHMARK_ORGANIZER)
+            )
+        finally:
+            db.close()
+        if not event_ids or not users or organizer_id is None:
+            sys.exit("❌ No benchmark data found, run: python -m benchmarks.load_test seed")
+        return cls(event_ids, users, int(organizer_id))
+
+
+def _token(user_id: int, username: str, role: str) -> str:
+    return create_access_token(
+        {"sub": str(user_id), "username": username, "role": role, "active": True, "ver": 0},
+        expires_delta=timedelta(hours=1),
+    )
+
+
+def browse_requests(data: Dataset) -> Callable[[int], Request]:
+    def build(n: int) -> Request:
+        event_id = random.choice(data.event_ids)
+        choice = n % 5
+        if choice == 0:
+            return "GET", f"{API}/events/?page={random.randint(1, 50)}&size=20", None, None
+        if choice == 1:
+            return "GET", f"{API}/events/{event_id}", None, None
+        if choice == 2:
+            return "GET", f"{API}/events/{event_id}/sessions", None, None
+        if choice == 3:
+            return "GET", f"{API}/events/upcoming/with-capacity?size=20", None, None
+        return "GET", f"{API}/events/?page=1&size=20&cursor=", None, None
+
+    return build
+
+
+def search_requests(data: Dataset) -> Callable[[int], Request]:
+    def build(n: int) -> Request:
+        topic = random.choice(SCALED_TOPICS)
+        city = random.choice(SCALED_CITIES)
+        choice = n % 3
+        if choice == 0:
+            return "GET", f"{API}/events/search?q={topic}&size=20", None, None
+        if choice == 1:
+            return "GET", f"{API}/events/search?title={topic}&location={city}", None, None
+        return "GET", f"{API}/events/search?q={topic} {city}&count=none", None, None
+
+    return build
+
+
+def login_requests(data: Dataset) -> Callable[[int], Request]:
+    def build(n: int) -> Request:
+        _, username = data.users[n % len(data.users)]
+        body = {"username": username, "password": BENCHMARK_PASSWORD}
+        return "POST", f"{API}/auth/login", body, None
+
+    return build
+
+
+def register_requests(data: Dataset) -> Callable[[int], Request]:
+    tokens = [_token(user_id, username, "user") for user_id, username in data.users]
+
+    def build(n: int) -> Request:
+        body = {"event_id": random.choice(data.event_ids), "number_of_participants": 1}
+        headers = {"Authorization": f"Bearer {tokens[n % len(tokens)]}"}
+        return "POST", f"{API}/event-registrations/", body, headers
+
+    return build
+
+
+def schedule_requests(data: Dataset) -> Callable[[int], Request]:
+    headers = {
+        "Authorization": f"Bearer {_token(data.organizer_id, BENCHMARK_ORGANIZER, 'organizer')}"
+    }
+    db = SessionLocal()
+    try:
+        starts = dict(
+            db.execute(
+                select(Event.id, Event.start_date).where(Event.id.in_(data.event_ids))
+            ).all()
+        )
+    finally:
+        db.close()
+    # Franjas libres tras las sesiones sembradas (09:00-13:00)
+    free_slots = [timedelta(hours=h) for h in (5, 6.5, 8, 9.5)]
+
+    def build(n: int) -> Request:
+        event_id = data.event_ids[n % len(data.event_ids)]
+        slot = free_slots[(n // len(data.event_ids)) % len(free_slots)]
+        start = starts[event_id] + slot
+        body = {
+            "title": f"Load test session {n}",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(hours=1)).isoformat(),
+            "capacity": 50,
+        }
+        return "POST", f"{API}/events/{event_id}/sessions", body, headers
+
+    return build
+
+
+BUILDERS = {
+    "browse": browse_requests,
+    "search": search_requests,
+    "login": login_requests,
+    "register": register_requests,
+    "schedule": schedule_requests,
+}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    build: Callable[[int], Request],
+    requests: int,
+    concurrency: int,
+    duration: Optional[float],
+) -> dict:
+    """Send requests with `concurrency` workers and summarize the results."""
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    counter = iter(range(sys.maxsize))
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker():
+        for n in counter:
+            if deadline is not None:
+                if time.perf_counter() >= deadline:
+                    return
+            elif n >= requests:
+                return
+            method, path, body, headers = build(n)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body, headers=headers)
+                statuses[str(response.status_code)] += 1
+            except httpx.HTTPError:
+                statuses["error"] += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    errors = statuses["error"] + sum(
+        count for status, count in statuses.items() if status.startswith("5")
+    )
+    return {
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "throughput": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1) if latencies else 0.0,
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1) if latencies else 0.0,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1) if latencies else 0.0,
+        "errors": errors,
+        "statuses": dict(statuses),
+    }
+
+
+async def run(
+    scenarios: List[str],
+    requests: int,
+    concurrency: int,
+    duration: Optional[float],
+    base_url: Optional[str],
+) -> Dict[str, dict]:
+    data = Dataset.load()
+    if base_url:
+        transport = None
+    else:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://benchmark"
+
+    limits = httpx.Limits(max_connections=concurrency)
+    results = {}
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        for name in scenarios:
+            print(f"🚀 {name}...")
+            results[name] = await run_scenario(
+                client, BUILDERS[name](data), requests, concurrency, duration
+            )
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], max_regression: float) -> List[str]:
+    """Scenarios whose p95 or throughput regressed beyond `max_regression` percent."""
+    regressions = []
+    factor = max_regression / 100
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if previous["p95_ms"] and result["p95_ms"] > previous["p95_ms"] * (1 + factor):
+            regressions.append(
+                f"{name}: p95 {previous['p95_ms']} -> {result['p95_ms']} ms"
+            )
+        if result["throughput"] < previous["throughput"] * (1 - factor):
+            regressions.append(
+                f"{name}: throughput {previous['throughput']} -> {result['throughput']} req/s"
+            )
+    return regressions
+
+
+def print_report(results: Dict[str, dict]) -> None:
+    print("\n📊 Results:")
+    print(
+        f"   {'scenario':<10} {'requests':>8} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}  statuses"
+    )
+    for name, r in results.items():
+        statuses = " ".join(f"{k}:{v}" for k, v in sorted(r["statuses"].items()))
+        print(
+            f"   {name:<10} {r['requests']:>8} {r['throughput']:>8} "
+            f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} {r['errors']:>7}  {statuses}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API load-testing suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="Create the synthetic dataset")
+    seed_parser.add_argument(
+        "--scale", type=int, default=10000, help="Number of users (10000, 100000, 1000000)"
+    )
+
+    run_parser = commands.add_parser("run", help="Run the scenarios")
+    run_parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="Comma separated scenarios"
+    )
+    run_parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    run_parser.add_argument(
+        "--duration", type=float, default=None, help="Seconds per scenario (overrides --requests)"
+    )
+    run_parser.add_argument("--concurrency", type=int, default=50, help="Concurrent clients")
+    run_parser.add_argument(
+        "--base-url", default=None, help="Target a running server instead of ASGI"
+    )
+    run_parser.add_argument("--json", default=None, help="Write the results to this file")
+    run_parser.add_argument(
+        "--baseline", default=None, help="Compare against a previous --json report"
+    )
+    run_parser.add_argument(
+        "--max-regression", type=float, default=20.0, help="Allowed regression in percent"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        print(f"🌱 Seeding synthetic dataset with {args.scale} users...")
+        db = SessionLocal()
+        try:
+            started = time.perf_counter()
+            create_scaled_seed_data(db, args.scale)
+            print(f"⏱️  Seeded in {time.perf_counter() - started:.1f}s")
+        finally:
+            db.close()
+        return
+
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = asyncio.run(
+        run(scenarios, args.requests, args.concurrency, args.duration, args.base_url)
+    )
+    print_report(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {"created_at": datetime.utcnow().isoformat(), "results": results}, f, indent=2
+            )
+        print(f"💾 Results written to {args.json}")
+
+    failed = any(r["errors"] for r in results.values())
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"❌ Regression {regression}")
+        failed = failed or bool(regressions)
+
+    if failed:
+        print("❌ Errors or regressions detected")
+        sys.exit(1)
+    print("✅ No errors or regressions")
+
+
+if __name__ == "__main__":
+    main()
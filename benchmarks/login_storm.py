@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark de tormenta de logins.
+
+Mide la latencia de un endpoint no relacionado (GET /health por defecto)
+primero en reposo y después mientras N clientes hacen login a la vez, para
+comprobar que bcrypt no bloquea el event loop.
+
+Uso: python -m benchmarks.login_storm [--logins 50] [--probes 200]
+                                      [--inline] [--base-url http://localhost:8080]
+
+--inline ejecuta bcrypt directamente en el event loop (comportamiento
+anterior) para comparar. Sin --base-url las peticiones se envían en proceso a
+la aplicación ASGI usando la base de datos configurada en DATABASE_URL.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from typing import List, Optional, Tuple
+
+import httpx
+from sqlalchemy import delete, select
+
+from app.core import security
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.db.models import Role, User
+from benchmarks.registration_rush import percentile
+
+LOGIN_PATH = f"{settings.api_v1_str}/auth/login"
+
+
+def seed(logins: int) -> Tuple[str, List[str], List[int]]:
+    """Create `logins` users sharing one password; return it and the usernames."""
+    run_id = uuid.uuid4().hex[:8]
+    password = f"storm-{run_id}"
+    db = SessionLocal()
+    try:
+        role = db.scalar(select(Role).where(Role.name == "user"))
+        if not role:
+            role = Role(name="user")
+            db.add(role)
+            db.flush()
+
+        # Un único hash con el coste configurado: cada login paga bcrypt completo
+        hashed = security.get_password_hash(password)
+        users = [
+            User(
+                username=f"storm_{run_id}_{i}",
+                first_name="Storm",
+                last_name=str(i),
+                phone="+34 600 000 000",
+                email=f"storm_{run_id}_{i}@bench.local",
+                password=hashed,
+                is_active=True,
+                role_id=role.id,
+            )
+            for i in range(logins)
+        ]
+        db.add_all(users)
+        db.commit()
+        return password, [str(u.username) for u in users], [int(u.id) for u in users]
+    finally:
+        db.close()
+
+
+def cleanup(user_ids: List[int]) -> None:
+    """Remove the rows created by the benchmark."""
+    db = SessionLocal()
+    try:
+        db.execute(delete(User).where(User.id.in_(user_ids)))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def probe(
+    client: httpx.AsyncClient, path: str, count: int, until=None
+) -> List[float]:
+    """
+    Issue sequential requests and return their latencies.
+
+    Stops after `count` requests, or when `until` finishes if it is given.
+    """
+    latencies = []
+    while (until is None and len(latencies) < count) or (
+        until is not None and not until.done()
+    ):
+        started = time.perf_counter()
+        # Ceder el event loop dentro de la medición: en proceso (ASGI) /health
+        # no lo cede por sí solo y el tiempo bloqueado por otros no contaría
+        await asyncio.sleep(0)
+        await client.get(path)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def storm(
+    password: str,
+    usernames: List[str],
+    probes: int,
+    probe_path: str,
+    base_url: Optional[str],
+) -> Tuple[List[float], List[float], List[int], float]:
+    """Measure probe latency at rest and during the login storm."""
+    if base_url:
+        transport = None
+    else:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://benchmark"
+
+    limits = httpx.Limits(max_connections=len(usernames) + 1)
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, limits=limits, timeout=300
+    ) as client:
+        idle = await probe(client, probe_path, probes)
+
+        async def login(username: str) -> int:
+            response = await client.post(
+                LOGIN_PATH, json={"username": username, "password": password}
+            )
+            return response.status_code
+
+        started = time.perf_counter()
+        logins = asyncio.gather(*(login(name) for name in usernames))
+        # Medir durante toda la tormenta, hasta que termina el último login
+        busy = await probe(client, probe_path, probes, until=logins)
+        statuses = await logins
+        elapsed = time.perf_counter() - started
+
+    return idle, busy, list(statuses), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Login storm benchmark")
+    parser.add_argument("--logins", type=int, default=50, help="Concurrent logins")
+    parser.add_argument(
+        "--probes", type=int, default=200, help="Probe requests at rest"
+    )
+    parser.add_argument(
+        "--probe-path", default="/health", help="Unrelated endpoint to measure"
+    )
+    parser.add_argument(
+        "--inline",
+        action="store_true",
+        help="Run bcrypt on the event loop (previous behaviour) for comparison",
+    )
+    parser.add_argument(
+        "--base-url", default=None, help="Target a running server instead of ASGI"
+    )
+
+    args = parser.parse_args()
+
+    if args.inline:
+
+        async def run_inline(func, *func_args):
+            return func(*func_args)
+
+        security._run_password_work = run_inline
+
+    print(
+        f"🌱 Seeding {args.logins} users "
+        f"(bcrypt rounds {settings.bcrypt_rounds}, "
+        f"pool {'inline' if args.inline else settings.password_hash_workers})..."
+    )
+    password, usernames, user_ids = seed(args.logins)
+
+    try:
+        print("🚀 Starting login storm...")
+        idle, busy, statuses, elapsed = asyncio.run(
+            storm(password, usernames, args.probes, args.probe_path, args.base_url)
+        )
+    finally:
+        cleanup(user_ids)
+
+    failed = len(statuses) - statuses.count(200)
+
+    print("\n📊 Results:")
+    print(f"   Logins: {len(statuses)} in {elapsed:.2f}s | Failed: {failed}")
+    for label, latencies in (("Idle", idle), ("During storm", busy)):
+        print(
+            f"   {label} {args.probe_path} p50/p95/p99: "
+            f"{percentile(latencies, 50) * 1000:.1f}/"
+            f"{percentile(latencies, 95) * 1000:.1f}/"
+            f"{percentile(latencies, 99) * 1000:.1f} ms"
+        )
+
+    if failed:
+        print("❌ Some logins failed")
+        sys.exit(1)
+    print("✅ Done")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Benchmark de apertura de registros ("ticket drop").
+
+Lanza N clientes concurrentes contra POST /event-registrations/ para un mismo
+evento y verifica que no se vende por encima de la capacidad.
+
+Uso: python -m benchmarks.registration_rush [--clients 500] [--capacity 400]
+                                            [--base-url http://localhost:8080]
+
+Sin --base-url las peticiones se envían en proceso a la aplicación ASGI usando
+la base de datos configurada en DATABASE_URL.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import httpx
+from sqlalchemy import delete, func, select
+
+from app.core.config import settings
+from app.core.security import create_access_token, get_password_hash
+from app.db.base import SessionLocal
+from app.db.models import Event, EventRegistration, Role, User
+
+REGISTRATIONS_PATH = f"{settings.api_v1_str}/event-registrations/"
+
+
+def seed(clients: int, capacity: int) -> Tuple[int, List[int]]:
+    """Create one event and `clients` users; return their ids."""
+    run_id = uuid.uuid4().hex[:8]
+    db = SessionLocal()
+    try:
+        role = db.scalar(select(Role).where(Role.name == "user"))
+        if not role:
+            role = Role(name="user")
+            db.add(role)
+            db.flush()
+
+        # Un único hash reutilizado: los usuarios nunca hacen login
+        password = get_password_hash(run_id)
+        users = [
+            User(
+                username=f"rush_{run_id}_{i}",
+                first_name="Rush",
+                last_name=str(i),
+                phone="+34 600 000 000",
+                email=f"rush_{run_id}_{i}@bench.local",
+                password=password,
+                is_active=True,
+                role_id=role.id,
+            )
+            for i in range(clients)
+        ]
+        db.add_all(users)
+
+        start = datetime.utcnow() + timedelta(days=30)
+        event = Event(
+            title=f"Ticket drop {run_id}",
+            description="Registration rush benchmark",
+            location="Benchmark Arena",
+            start_date=start,
+            end_date=start + timedelta(hours=8),
+            capacity=capacity,
+            is_active=True,
+        )
+        db.add(event)
+        db.commit()
+        return int(event.id), [int(user.id) for user in users]
+    finally:
+        db.close()
+
+
+def verify(event_id: int) -> Tuple[int, int, int]:
+    """Return (capacity, counter, real registered sum) for the event."""
+    db = SessionLocal()
+    try:
+        event = db.get(Event, event_id)
+        real_sum = db.scalar(
+            select(
+                func.coalesce(func.sum(EventRegistration.number_of_participants), 0)
+            ).where(EventRegistration.event_id == event_id)
+        )
+        return int(event.capacity), int(event.registered_participants), int(real_sum)
+    finally:
+        db.close()
+
+
+def cleanup(event_id: int, user_ids: List[int]) -> None:
+    """Remove the rows created by the benchmark."""
+    db = SessionLocal()
+    try:
+        db.execute(
+            delete(EventRegistration).where(EventRegistration.event_id == event_id)
+        )
+        db.execute(delete(Event).where(Event.id == event_id))
+        db.execute(delete(User).where(User.id.in_(user_ids)))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def rush(
+    event_id: int, user_ids: List[int], participants: int, base_url: Optional[str]
+) -> Tuple[List[float], List[int], float]:
+    """Fire one registration per user at the same time."""
+    tokens = [
+        create_access_token({"sub": str(user_id), "role": "user"})
+        for user_id in user_ids
+    ]
+
+    if base_url:
+        transport = None
+    else:
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://benchmark"
+
+    limits = httpx.Limits(max_connections=len(user_ids))
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        start_gate = asyncio.Event()
+
+        async def register(token: str) -> Tuple[float, int]:
+            await start_gate.wait()
+            started = time.perf_counter()
+            response = await client.post(
+                REGISTRATIONS_PATH,
+                json={"event_id": event_id, "number_of_participants": participants},
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            return time.perf_counter() - started, response.status_code
+
+        tasks = [asyncio.create_task(register(token)) for token in tokens]
+        await asyncio.sleep(0)
+        started = time.perf_counter()
+        start_gate.set()
+        results = await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    return [r[0] for r in results], [r[1] for r in results], elapsed
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Registration rush benchmark")
+    parser.add_argument("--clients", type=int, default=500, help="Concurrent clients")
+    parser.add_argument(
+        "--capacity", type=int, default=400, help="Capacity of the event"
+    )
+    parser.add_argument(
+        "--participants", type=int, default=1, help="Participants per registration"
+    )
+    parser.add_argument(
+        "--base-url", default=None, help="Target a running server instead of ASGI"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the benchmark rows afterwards"
+    )
+
+    args = parser.parse_args()
+
+    print(
+        f"🌱 Seeding {args.clients} users and one event "
+        f"(capacity {args.capacity})..."
+    )
+    event_id, user_ids = seed(args.clients, args.capacity)
+
+    try:
+        print("🚀 Opening registrations...")
+        latencies, statuses, elapsed = asyncio.run(
+            rush(event_id, user_ids, args.participants, args.base_url)
+        )
+        capacity, counter, real_sum = verify(event_id)
+    finally:
+        if not args.keep:
+            cleanup(event_id, user_ids)
+
+    accepted = statuses.count(200)
+    rejected = statuses.count(400)
+    errors = len(statuses) - accepted - rejected
+    oversold = max(0, real_sum - capacity)
+
+    print("\n📊 Results:")
+    print(f"   Requests: {len(statuses)} in {elapsed:.2f}s")
+    print(f"   Throughput: {len(statuses) / elapsed:.1f} req/s")
+    print(f"   Registrations/sec: {accepted / elapsed:.1f}")
+    print(
+        f"   Accepted: {accepted} | Rejected (full/duplicate): {rejected} | "
+        f"Errors: {errors}"
+    )
+    print(
+        f"   Latency p50/p95/p99: {percentile(latencies, 50) * 1000:.0f}/"
+        f"{percentile(latencies, 95) * 1000:.0f}/"
+        f"{percentile(latencies, 99) * 1000:.0f} ms"
+    )
+    print(f"   Capacity: {capacity} | Counter: {counter} | Registered: {real_sum}")
+    print(
+        f"   Oversold: {oversold} | "
+        f"Mean latency: {statistics.mean(latencies) * 1000:.0f} ms"
+    )
+
+    if oversold or counter != real_sum or errors:
+        print("❌ Capacity invariant violated or requests failed")
+        sys.exit(1)
+    print("✅ Zero oversell")
+
+
+if __name__ == "__main__":
+    main()
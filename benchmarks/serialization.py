@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark del coste de serializar una página de eventos.
+
+Compara, para un Page[EventWithCapacity] de --items elementos construido desde
+filas ORM (sin base de datos):
+  legacy     Event.model_validate -> model_dump -> EventWithCapacity(**dict),
+             revalidación contra response_model y json de la stdlib
+  orjson     la misma construcción y revalidación, renderizado con ORJSONResponse
+  fast_path  EventWithCapacity.from_row y model_response (sin revalidar)
+
+Uso:
+  python -m benchmarks.serialization [--items 100] [--rounds 500]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api.schemas.event_schemas import Event, EventWithCapacity
+from app.api.schemas.pagination_schema import Page
+from app.core.responses import DefaultJSONResponse, model_response
+from app.db.models import Event as EventModel
+
+RESPONSE_FIELD = create_model_field(
+    name="response", type_=Page[EventWithCapacity], mode="serialization"
+)
+
+
+def build_rows(items: int) -> List[tuple]:
+    """(event, registered_participants) rows as returned by the repository."""
+    start = datetime(2030, 1, 1, 9)
+    rows = []
+    for n in range(items):
+        event = EventModel(
+            id=n + 1,
+            title=f"Python Conference {n}",
+            description="Synthetic event for the serialization benchmark",
+            location="Centro de Congresos Madrid",
+            start_date=start + timedelta(days=n),
+            end_date=start + timedelta(days=n, hours=8),
+            capacity=500,
+            registered_participants=n,
+            is_active=True,
+            created_at=start,
+            updated_at=None,
+        )
+        rows.append((event, n))
+    return rows
+
+
+def legacy_item(event, registered: int) -> EventWithCapacity:
+    event_dict = Event.model_validate(event).model_dump()
+    event_dict.update(
+        {
+            "registered_participants": registered,
+            "available_capacity": event.capacity - registered,
+        }
+    )
+    return EventWithCapacity(**event_dict)
+
+
+def page(items: list) -> Page:
+    return Page(items=items, page=1, size=len(items), total_items=1000, total_pages=10)
+
+
+async def render_validated(rows: List[tuple], response_class) -> bytes:
+    """What FastAPI does with a returned model: dump, re-validate, encode, render."""
+    content = page([legacy_item(*row) for row in rows])
+    serialized = await serialize_response(field=RESPONSE_FIELD, response_content=content)
+    return response_class(serialized).body
+
+
+async def render_fast(rows: List[tuple]) -> bytes:
+    return model_response(page([EventWithCapacity.from_row(*row) for row in rows])).body
+
+
+async def measure(fn: Callable[[], Awaitable[bytes]], rounds: int) -> float:
+    """Mean seconds per call."""
+    await fn()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await fn()
+    return (time.perf_counter() - started) / rounds
+
+
+async def run(items: int, rounds: int) -> None:
+    rows = build_rows(items)
+    variants = {
+        "legacy": lambda: render_validated(rows, JSONResponse),
+        "orjson": lambda: render_validated(rows, DefaultJSONResponse),
+        "fast_path": lambda: render_fast(rows),
+    }
+
+    print(f"📦 Page of {items} EventWithCapacity, {rounds} rounds")
+    print(f"   default response class: {DefaultJSONResponse.__name__}")
+    baseline = None
+    for name, fn in variants.items():
+        seconds = await measure(fn, rounds)
+        baseline = baseline or seconds
+        print(
+            f"   {name:<10} {seconds * 1000:8.3f} ms/page "
+            f"{seconds * 1e6 / items:8.2f} µs/item  x{baseline / seconds:.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page serialization micro-benchmark")
+    parser.add_argument("--items", type=int, default=100, help="Items per page")
+    parser.add_argument("--rounds", type=int, default=500, help="Pages per variant")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.items, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
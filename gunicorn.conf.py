@@ -0,0 +1,25 @@
+"""
+Configuración de gunicorn para producción (workers de uvicorn).
+
+Uso: gunicorn -c gunicorn.conf.py
+
+Todos los valores salen de Settings (variables de entorno o .env): WEB_CONCURRENCY,
+SERVER_KEEPALIVE, SERVER_BACKLOG, SERVER_MAX_REQUESTS(_JITTER), SERVER_LOOP...
+"""
+
+from app.core.config import settings
+from app.core.server import worker_count
+
+wsgi_app = "app.main:app"
+bind = f"{settings.server_host}:{settings.server_port}"
+workers = worker_count()
+worker_class = "app.core.workers.ConfiguredUvicornWorker"
+
+backlog = settings.server_backlog
+keepalive = settings.server_keepalive
+timeout = settings.server_timeout
+graceful_timeout = settings.server_graceful_timeout
+
+# Reciclar workers de forma escalonada evita que se reinicien todos a la vez
+max_requests = settings.server_max_requests
+max_requests_jitter = settings.server_max_requests_jitter
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Script para verificar el contador registered_participants de los eventos.
+Uso: python reconcile_capacity.py [--fix]
+"""
+
+import argparse
+import sys
+
+from app.db.base import SessionLocal
+from app.db.capacity_reconciliation import (
+    find_capacity_mismatches,
+    fix_capacity_mismatches,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Verify events.registered_participants against registrations"
+    )
+    parser.add_argument(
+        "--fix", action="store_true", help="Reset drifted counters to the real sum"
+    )
+
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print("🔍 Verifying registered participants counters...")
+        mismatches = find_capacity_mismatches(db)
+
+        if not mismatches:
+            print("✅ All counters match their registrations!")
+            return
+
+        print(f"\n⚠️  Mismatched events ({len(mismatches)}):")
+        for mismatch in mismatches:
+            print(
+                f"  - {mismatch['title']} (ID: {mismatch['event_id']}) - "
+                f"Counter: {mismatch['counter']}, Actual: {mismatch['actual']}"
+            )
+
+        if not args.fix:
+            sys.exit(1)
+
+        fixed = fix_capacity_mismatches(db)
+        print(f"\n✅ Fixed {fixed} counters!")
+
+    except Exception as e:
+        print(f"❌ Error during reconciliation: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,23 @@
 #!/usr/bin/env python3
 """
 Script para insertar datos semilla en la base de datos.
-Uso: python seed_database.py [--clear] [--create]
+Uso: python seed_database.py [--clear] [--create] [--scale N [--batch-size M]]
+
+--scale N genera un dataset sintético de N usuarios (eventos, sesiones y
+registros proporcionales) para pruebas de carga, con COPY en PostgreSQL.
 """
 
 import argparse
 import sys
-
-from sqlalchemy.orm import Session
+import time
 
 from app.db.base import SessionLocal
-from app.db.seed_data import clear_seed_data, create_seed_data
+from app.db.seed_data import (
+    clear_seed_data,
+    create_scaled_seed_data,
+    create_seed_data,
+    scaled_counts,
+)
 
 
 def main():
@@ -20,11 +27,23 @@ def main():
     parser.add_argument(
         "--reset", action="store_true", help="Clear and recreate seed data"
     )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=None,
+        help="Create a synthetic load-test dataset with this many users",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10000,
+        help="Rows per COPY/INSERT batch in --scale mode",
+    )
 
     args = parser.parse_args()
 
     # If no arguments provided, default to create
-    if not any([args.clear, args.create, args.reset]):
+    if not any([args.clear, args.create, args.reset, args.scale]):
         args.create = True
 
     db = SessionLocal()
@@ -34,7 +53,15 @@ def main():
             clear_seed_data(db)
             print("✅ Seed data cleared successfully!")
 
-        if args.create or args.reset:
+        if args.scale:
+            counts = ", ".join(
+                f"{n} {table}" for table, n in scaled_counts(args.scale).items()
+            )
+            print(f"🌱 Creating scaled seed data ({counts})...")
+            started = time.perf_counter()
+            create_scaled_seed_data(db, args.scale, batch_size=args.batch_size)
+            print(f"⏱️  Scaled seed data created in {time.perf_counter() - started:.1f}s")
+        elif args.create or args.reset:
             print("🌱 Creating new seed data...")
             create_seed_data(db)
             print("✅ Seed data created successfully!")
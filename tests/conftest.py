@@ -4,27 +4,64 @@ Pytest configuration and fixtures.
 This module contains common fixtures and configuration for all tests.
 """
 
+import asyncio
+import os
+import tempfile
+from contextlib import contextmanager
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
+from app.core.cache import response_cache
 from app.core.security import get_password_hash
-from app.db.base import Base, get_db
+from app.core.sql_profiler import profile_queries
+from app.core.user_cache import user_cache
+from app.db.base import Base, get_async_db, get_async_database_url, get_async_read_db
 from app.db.models import Role, User
 from app.main import app
 
-# Create in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Create file-based SQLite database for testing, shared by the sync fixtures
+# and the async (aiosqlite) sessions used by the API
+TEST_DB_FILE = os.path.join(tempfile.gettempdir(), f"be_events_test_{os.getpid()}.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{TEST_DB_FILE}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Fail the test when a block exceeds a SQL query budget.
+
+    Usage: ``with query_budget(max_queries=2): client.get(...)``. Running the
+    same statement more than ``max_repeats`` times (an N+1) also fails.
+    """
+
+    @contextmanager
+    def check(max_queries: int, max_repeats: int = 1):
+        with profile_queries(capture_all=True) as profile:
+            yield profile
+        problems = profile.violations(max_queries, max_repeats)
+        if problems:
+            pytest.fail("SQL budget exceeded: " + "; ".join(problems))
+
+    return check
+
 
 @pytest.fixture(scope="session")
 def db_engine():
@@ -32,33 +69,39 @@ def db_engine():
     Base.metadata.create_all(bind=engine)
     yield engine
     Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+    if os.path.exists(TEST_DB_FILE):
+        os.remove(TEST_DB_FILE)
 
 
 @pytest.fixture
 def db_session(db_engine):
     """Create database session for testing."""
-    connection = db_engine.connect()
-    transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal()
 
     yield session
 
     session.close()
-    transaction.rollback()
-    connection.close()
+    # Limpiar todas las tablas para aislar cada test
+    with db_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
 
 
 @pytest.fixture
 def client(db_session):
-    """Create test client with database session."""
-
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
+    """Create test client with async database sessions."""
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    # Sin réplica en los tests: las lecturas usan la misma base de datos
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    # Cada test empieza con la caché de respuestas vacía
+    asyncio.run(response_cache.clear())
+    user_cache.clear()
     yield TestClient(app)
     app.dependency_overrides.clear()
 
@@ -0,0 +1,310 @@
+"""
+Agenda import tests.
+
+This module contains tests for the streaming bulk import of events and
+sessions, its parsers and the schedule conflict sweep.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.models import Event
+from app.db.models import Session as EventSession
+from app.infrastructure.record_streams import Record, RecordError, iter_records
+from app.services.validators.session_validators import find_schedule_conflicts
+
+IMPORT_URL = "/api/v1/events/import"
+DAY = (datetime.now() + timedelta(days=40)).replace(
+    hour=0, minute=0, second=0, microsecond=0
+)
+
+
+def _at(hour: float) -> str:
+    return (DAY + timedelta(hours=hour)).isoformat()
+
+
+def _parse(data: bytes, format: str, chunk_size: int) -> list:
+    async def chunks():
+        for offset in range(0, len(data), chunk_size):
+            yield data[offset : offset + chunk_size]
+
+    async def collect():
+        return [record async for record in iter_records(chunks(), format)]
+
+    return asyncio.run(collect())
+
+
+def _ndjson(rows: list) -> bytes:
+    return "\n".join(json.dumps(row) for row in rows).encode()
+
+
+def _event_row(title: str, **overrides) -> dict:
+    row = {
+        "type": "event",
+        "title": title,
+        "location": "Sevilla",
+        "start_date": _at(8),
+        "end_date": _at(20),
+        "capacity": 100,
+    }
+    row.update(overrides)
+    return row
+
+
+def _session_row(title: str, start: float, end: float, **overrides) -> dict:
+    row = {"type": "session", "title": title, "start_time": _at(start), "end_time": _at(end)}
+    row.update(overrides)
+    return row
+
+
+class TestRecordStreams:
+    """Test the incremental CSV and NDJSON readers."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_csv_records(self, chunk_size):
+        data = (
+            '﻿type,title,description\r\n'
+            'event,"Agenda, 2031","two\r\nlines with ""quotes"""\r\n'
+            "session,Keynote,\r\n"
+            '"open,value\n'
+        ).encode()
+
+        assert _parse(data, "csv", chunk_size) == [
+            Record(2, {"type": "event", "title": "Agenda, 2031", "description": 'two\r\nlines with "quotes"'}),
+            Record(4, {"type": "session", "title": "Keynote"}),
+            RecordError(5, "Unterminated quoted value"),
+        ]
+
+    @pytest.mark.parametrize("chunk_size", [1, 4096])
+    def test_csv_stray_quote_is_literal(self, chunk_size):
+        data = (
+            "type,title,description\n"
+            'event,TV Expo,12" screens\n'
+            "event,Radio Expo,\n"
+            'event,"Bad"quote,\n'
+            "session,Keynote,\n"
+        ).encode()
+
+        assert _parse(data, "csv", chunk_size) == [
+            Record(2, {"type": "event", "title": "TV Expo", "description": '12" screens'}),
+            Record(3, {"type": "event", "title": "Radio Expo"}),
+            RecordError(4, "Invalid CSV: ',' expected after '\"'"),
+            Record(5, {"type": "session", "title": "Keynote"}),
+        ]
+
+    def test_ndjson_records(self):
+        data = b'{"type": "event"}\n\nnot json\n[1]\n{"type": "session"}'
+
+        records = _parse(data, "ndjson", 3)
+
+        assert records[0] == Record(1, {"type": "event"})
+        assert isinstance(records[1], RecordError) and records[1].line == 3
+        assert records[2] == RecordError(4, "Each line must be a JSON object")
+        assert records[3] == Record(5, {"type": "session"})
+
+
+class TestScheduleSweep:
+    """Test the sorted sweep used to detect schedule conflicts."""
+
+    buffer = timedelta(minutes=15)
+
+    def test_existing_sessions_win(self):
+        existing = [(DAY.replace(hour=10), DAY.replace(hour=11))]
+        candidates = [
+            ("early", DAY.replace(hour=9), DAY.replace(hour=9, minute=50)),
+            ("ok", DAY.replace(hour=11, minute=15), DAY.replace(hour=12)),
+            ("late", DAY.replace(hour=8), DAY.replace(hour=9)),
+        ]
+        assert find_schedule_conflicts(existing, candidates, self.buffer) == {"early"}
+
+    def test_earliest_candidate_wins(self):
+        candidates = [
+            ("b", DAY.replace(hour=10), DAY.replace(hour=11)),
+            ("a", DAY.replace(hour=9), DAY.replace(hour=10)),
+            ("c", DAY.replace(hour=10, minute=10), DAY.replace(hour=11)),
+            ("d", DAY.replace(hour=10, minute=15), DAY.replace(hour=12)),
+        ]
+        assert find_schedule_conflicts([], candidates, self.buffer) == {"b", "c"}
+
+
+class TestAgendaImport:
+    """Test POST /events/import."""
+
+    def _import(self, client, headers, body, content_type="application/x-ndjson", **params):
+        return client.post(
+            IMPORT_URL,
+            content=body,
+            params=params,
+            headers={**headers, "Content-Type": content_type},
+        )
+
+    def test_import_agenda(
+        self, client: TestClient, organizer_headers: dict, test_db: Session
+    ):
+        from app.db.models import Speaker
+
+        speaker = Speaker(
+            name="Grace", email="grace@example.com", phone="1", bio="-", company="Navy"
+        )
+        existing = Event(
+            title="Existing Conf",
+            location="Cádiz",
+            start_date=DAY + timedelta(days=1, hours=8),
+            end_date=DAY + timedelta(days=1, hours=20),
+            capacity=10,
+            is_active=True,
+        )
+        test_db.add_all([speaker, existing])
+        test_db.commit()
+        test_db.add(
+            EventSession(
+                title="Existing talk",
+                event_id=existing.id,
+                start_time=DAY + timedelta(days=1, hours=10),
+                end_time=DAY + timedelta(days=1, hours=11),
+                is_active=True,
+            )
+        )
+        test_db.commit()
+        next_day = lambda hour: (DAY + timedelta(days=1, hours=hour)).isoformat()
+
+        rows = [
+            _event_row("PyData Sevilla", ref="pydata"),
+            _session_row("Opening", 9, 10, event_ref="pydata", speaker_id=speaker.id),
+            _session_row("Clash", 10, 11, event_ref="pydata"),
+            _session_row("Talks", 10.5, 11.5, event_ref="pydata"),
+            _session_row("Existing event", 11.5, 12.5, event_id=existing.id),
+            {"type": "session", "title": "Too close", "start_time": next_day(9), "end_time": next_day(10), "event_id": existing.id},
+            _event_row("Existing Conf"),
+            _session_row("Orphan", 9, 10, event_ref="nope"),
+            _session_row("Ghost speaker", 14, 15, event_ref="pydata", speaker_id=999),
+            {"type": "workshop"},
+        ]
+        rows[4]["start_time"], rows[4]["end_time"] = next_day(11.5), next_day(12.5)
+
+        response = self._import(client, organizer_headers, _ndjson(rows))
+
+        assert response.status_code == 200
+        report = response.json()
+        assert report["dry_run"] is False
+        assert report["rows"] == 10
+        assert report["events_imported"] == 1
+        assert report["sessions_imported"] == 3
+        errors = {error["line"]: error["error"] for error in report["errors"]}
+        assert sorted(errors) == [3, 6, 7, 8, 9, 10]
+        assert "Schedule conflict" in errors[3]
+        assert "Schedule conflict" in errors[6]
+        assert errors[7] == "Event with this title already exists"
+        assert "not in the import" in errors[8]
+        assert "Speaker with id 999" in errors[9]
+
+        event_id = report["event_ids"]["pydata"]
+        titles = [
+            s.title
+            for s in test_db.query(EventSession)
+            .filter_by(event_id=event_id)
+            .order_by(EventSession.start_time)
+        ]
+        assert titles == ["Opening", "Talks"]
+        assert (
+            test_db.query(EventSession).filter_by(event_id=existing.id).count() == 2
+        )
+        assert client.get(f"/api/v1/events/{event_id}/sessions").json()["total_items"] == 2
+
+    def test_csv_dry_run_writes_nothing(
+        self, client: TestClient, organizer_headers: dict, test_db: Session
+    ):
+        body = (
+            "type,title,location,start_date,end_date,capacity,event_ref,start_time,end_time\n"
+            f"event,CSV Conf,Huelva,{_at(8)},{_at(20)},50,,,\n"
+            f"session,Morning,,,,,CSV Conf,{_at(9)},{_at(10)}\n"
+            f"event,Broken,Huelva,{_at(20)},{_at(8)},50,,,\n"
+            f"session,Afternoon,,,,,Broken,{_at(15)},{_at(16)}\n"
+        ).encode()
+
+        report = self._import(
+            client, organizer_headers, body, "text/csv; charset=utf-8", dry_run="true"
+        ).json()
+
+        assert report["dry_run"] is True
+        assert (report["events_imported"], report["sessions_imported"]) == (1, 1)
+        assert [error["line"] for error in report["errors"]] == [4, 5]
+        assert report["errors"][0]["error"] == "End date must be after start date"
+        assert "line 4" in report["errors"][1]["error"]
+        assert report["event_ids"] == {}
+        assert test_db.query(Event).filter_by(title="CSV Conf").count() == 0
+
+    def test_csv_stray_quote_keeps_following_rows(
+        self, client: TestClient, organizer_headers: dict
+    ):
+        body = (
+            "type,title,description,location,start_date,end_date,capacity\n"
+            f'event,TV Expo,12" screens,Jaén,{_at(8)},{_at(20)},50\n'
+            f"event,Radio Expo,,Jaén,{_at(8 + 24)},{_at(20 + 24)},50\n"
+            f"event,Podcast Expo,,Jaén,{_at(8 + 48)},{_at(20 + 48)},50\n"
+        ).encode()
+
+        report = self._import(
+            client, organizer_headers, body, "text/csv", dry_run="true"
+        ).json()
+
+        assert report["rows"] == 3
+        assert report["events_imported"] == 3
+        assert report["errors"] == []
+
+    def test_timezone_aware_rows(
+        self, client: TestClient, organizer_headers: dict, test_db: Session
+    ):
+        rows = [
+            _event_row("Aware Conf", start_date=_at(8) + "Z"),
+            _session_row("Aware", 9, 10, event_ref="Aware Conf"),
+            _session_row("Zulu", 11, 12, event_ref="Aware Conf"),
+            _session_row("Naive", 13, 14, event_ref="Aware Conf"),
+        ]
+        rows[1]["start_time"] += "+00:00"
+        rows[2]["end_time"] += "Z"
+
+        response = self._import(client, organizer_headers, _ndjson(rows))
+
+        assert response.status_code == 200
+        report = response.json()
+        assert report["errors"] == []
+        assert (report["events_imported"], report["sessions_imported"]) == (1, 3)
+        event = test_db.query(Event).filter_by(title="Aware Conf").one()
+        assert event.start_date.tzinfo is None
+
+    def test_batched_writes(
+        self, client: TestClient, organizer_headers: dict, test_db: Session
+    ):
+        rows = [
+            _event_row(f"Batch Conf {n}", start_date=_at(8 + n * 24), end_date=_at(20 + n * 24))
+            for n in range(5)
+        ]
+        report = self._import(
+            client, organizer_headers, _ndjson(rows), batch_size=2
+        ).json()
+
+        assert report["events_imported"] == 5
+        assert report["errors"] == []
+        assert test_db.query(Event).filter(Event.title.like("Batch Conf %")).count() == 5
+
+    def test_limits_and_access(
+        self, client: TestClient, organizer_headers: dict, auth_headers: dict, monkeypatch
+    ):
+        from app.core.config import settings
+
+        body = _ndjson([_event_row("Denied")])
+        assert self._import(client, auth_headers, body).status_code == 403
+        assert (
+            self._import(client, organizer_headers, body, "application/json").status_code
+            == 415
+        )
+
+        monkeypatch.setattr(settings, "import_max_rows", 1)
+        body = _ndjson([_event_row("One"), _event_row("Two")])
+        assert self._import(client, organizer_headers, body).status_code == 413
@@ -0,0 +1,134 @@
+"""
+Response cache tests.
+
+This module contains tests for the cache of public event endpoints.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import InMemoryCacheBackend, build_cache_key
+from app.db.models import Event
+
+
+@pytest.fixture
+def upcoming_event(test_db: Session) -> Event:
+    """Create an upcoming active event."""
+    start = datetime.now() + timedelta(days=20)
+    event = Event(
+        title="Python Meetup",
+        description="Cached event",
+        location="Madrid",
+        start_date=start,
+        end_date=start + timedelta(hours=3),
+        capacity=50,
+        is_active=True,
+    )
+    test_db.add(event)
+    test_db.commit()
+    test_db.refresh(event)
+    return event
+
+
+class TestCacheKeys:
+    """Test normalization of cache keys."""
+
+    def test_equivalent_params_share_key(self):
+        first = build_cache_key("events:search", {"title": "  Python ", "page": 1})
+        second = build_cache_key(
+            "events:search", {"page": 1, "title": "python", "location": None}
+        )
+        assert first == second
+
+    def test_different_params_differ(self):
+        assert build_cache_key("events:list", {"page": 1}) != build_cache_key(
+            "events:list", {"page": 2}
+        )
+
+
+class TestInMemoryBackend:
+    """Test the in-process fallback backend."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_tags(self):
+        backend = InMemoryCacheBackend(max_entries=2)
+        await backend.set("a", "1", 60, ["t1"])
+        await backend.set("b", "2", 60, ["t2"])
+        await backend.get("a")
+        await backend.set("c", "3", 60, ["t1"])
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") == "1"
+
+        await backend.invalidate(["t1"])
+        assert await backend.get("a") is None
+        assert await backend.get("c") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses(self):
+        backend = InMemoryCacheBackend()
+        await backend.set("a", "1", 0, [])
+        assert await backend.get("a") is None
+
+
+class TestEventEndpointsCache:
+    """Test caching and invalidation of event read endpoints."""
+
+    def test_event_list_is_cached(self, client: TestClient, upcoming_event):
+        first = client.get("/api/v1/events/")
+        second = client.get("/api/v1/events/")
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert first.json() == second.json()
+
+    def test_search_keys_are_normalized(self, client: TestClient, upcoming_event):
+        first = client.get("/api/v1/events/search?title=Python")
+        second = client.get("/api/v1/events/search?title=%20python%20")
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json()["items"][0]["title"] == "Python Meetup"
+        assert first.json() == second.json()
+
+    def test_event_detail_not_found_is_not_cached(self, client: TestClient):
+        assert client.get("/api/v1/events/424242").status_code == 404
+        assert client.get("/api/v1/events/424242").status_code == 404
+
+    def test_create_event_invalidates_lists(
+        self, client: TestClient, organizer_headers: dict, upcoming_event
+    ):
+        client.get("/api/v1/events/")
+        response = client.post(
+            "/api/v1/events/",
+            json={
+                "title": "Brand New Event",
+                "description": "Fresh",
+                "start_date": "2030-06-15T09:00:00",
+                "end_date": "2030-06-15T17:00:00",
+                "location": "Sevilla",
+                "capacity": 10,
+                "is_active": True,
+            },
+            headers=organizer_headers,
+        )
+        assert response.status_code == 200
+
+        refreshed = client.get("/api/v1/events/")
+        assert refreshed.headers["X-Cache"] == "MISS"
+        titles = [item["title"] for item in refreshed.json()["items"]]
+        assert "Brand New Event" in titles
+
+    def test_registration_invalidates_upcoming(
+        self, client: TestClient, auth_headers: dict, upcoming_event
+    ):
+        client.get("/api/v1/events/upcoming/with-capacity")
+        client.post(
+            "/api/v1/event-registrations/",
+            json={"event_id": upcoming_event.id, "number_of_participants": 2},
+            headers=auth_headers,
+        )
+
+        refreshed = client.get("/api/v1/events/upcoming/with-capacity")
+        assert refreshed.headers["X-Cache"] == "MISS"
+        assert refreshed.json()["items"][0]["registered_participants"] == 2
@@ -0,0 +1,213 @@
+"""
+Conditional request tests.
+
+This module contains tests for the ETag / Last-Modified handling of the
+event, session and speaker read endpoints.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette.requests import Request
+
+from app.core.conditional import Validator, is_not_modified, make_etag
+from app.db.models import Event, Speaker
+from app.db.models import Session as EventSession
+
+
+def _request(**headers) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def event(test_db: Session) -> Event:
+    start = datetime(2031, 6, 1, 9, 0)
+    event = Event(
+        title="Conditional Conf",
+        description="ETag",
+        location="Valencia",
+        start_date=start,
+        end_date=start + timedelta(hours=8),
+        capacity=100,
+        is_active=True,
+    )
+    test_db.add(event)
+    test_db.commit()
+    test_db.refresh(event)
+    return event
+
+
+class TestValidators:
+    """Test the matching of conditional headers."""
+
+    validator = Validator(
+        etag=make_etag("event", 1), last_modified=datetime(2031, 1, 1, 10, 0, 0, 500)
+    )
+
+    def test_etags_are_strong_and_stable(self):
+        assert make_etag("event", 1) == make_etag("event", 1)
+        assert make_etag("event", 1) != make_etag("event", 2)
+        assert make_etag("event", 1).startswith('"')
+
+    def test_if_none_match(self):
+        etag = self.validator.etag
+        assert is_not_modified(_request(if_none_match=etag), self.validator)
+        assert is_not_modified(_request(if_none_match=f'"x", W/{etag}'), self.validator)
+        assert is_not_modified(_request(if_none_match="*"), self.validator)
+        assert not is_not_modified(_request(if_none_match='"x"'), self.validator)
+
+    def test_if_modified_since(self):
+        assert is_not_modified(
+            _request(if_modified_since="Wed, 01 Jan 2031 10:00:00 GMT"), self.validator
+        )
+        assert not is_not_modified(
+            _request(if_modified_since="Wed, 01 Jan 2031 09:59:59 GMT"), self.validator
+        )
+        assert not is_not_modified(_request(if_modified_since="soon"), self.validator)
+
+    def test_if_none_match_takes_precedence(self):
+        request = _request(
+            if_none_match='"x"', if_modified_since="Wed, 01 Jan 2031 10:00:00 GMT"
+        )
+        assert not is_not_modified(request, self.validator)
+
+
+class TestEventDetail:
+    """Test conditional requests on GET /events/{event_id}."""
+
+    def test_not_modified(self, client: TestClient, event: Event, query_budget):
+        response = client.get(f"/api/v1/events/{event.id}")
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "public, no-cache"
+        assert response.headers["Last-Modified"].endswith("GMT")
+
+        # Sólo la consulta del validador
+        with query_budget(max_queries=1):
+            cached = client.get(
+                f"/api/v1/events/{event.id}", headers={"If-None-Match": etag}
+            )
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+        by_date = client.get(
+            f"/api/v1/events/{event.id}",
+            headers={"If-Modified-Since": response.headers["Last-Modified"]},
+        )
+        assert by_date.status_code == 304
+
+    def test_update_changes_etag(
+        self, client: TestClient, test_db: Session, event: Event
+    ):
+        etag = client.get(f"/api/v1/events/{event.id}").headers["ETag"]
+        event.updated_at = datetime.now(timezone.utc) + timedelta(minutes=1)
+        test_db.commit()
+
+        response = client.get(
+            f"/api/v1/events/{event.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_registration_keeps_etag(
+        self, client: TestClient, auth_headers: dict, event: Event
+    ):
+        response = client.get(f"/api/v1/events/{event.id}")
+        etag = response.headers["ETag"]
+        registration = client.post(
+            "/api/v1/event-registrations/",
+            json={"event_id": event.id, "number_of_participants": 1},
+            headers=auth_headers,
+        )
+        assert registration.status_code == 200
+        cancel = client.delete(
+            f"/api/v1/event-registrations/{registration.json()['id']}",
+            headers=auth_headers,
+        )
+        assert cancel.status_code == 200
+
+        # El contador de inscritos no forma parte del detalle ni de su versión
+        cached = client.get(
+            f"/api/v1/events/{event.id}", headers={"If-None-Match": etag}
+        )
+        assert cached.status_code == 304
+        detail = client.get(f"/api/v1/events/{event.id}")
+        assert detail.headers["ETag"] == etag
+        assert detail.headers["Last-Modified"] == response.headers["Last-Modified"]
+        assert detail.headers["X-Cache"] == "HIT"
+
+    def test_missing_event(self, client: TestClient):
+        response = client.get("/api/v1/events/999999", headers={"If-None-Match": "*"})
+        assert response.status_code == 404
+
+
+class TestListings:
+    """Test conditional requests on the sessions and speakers listings."""
+
+    def test_event_sessions(self, client: TestClient, test_db: Session, event: Event):
+        url = f"/api/v1/events/{event.id}/sessions"
+        etag = client.get(url).headers["ETag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+        # Cada página tiene su propia representación
+        assert client.get(f"{url}?size=5", headers={"If-None-Match": etag}).status_code == 200
+
+        test_db.add(
+            EventSession(
+                title="Keynote",
+                event_id=event.id,
+                start_time=event.start_date,
+                end_time=event.start_date + timedelta(hours=1),
+                is_active=True,
+            )
+        )
+        test_db.commit()
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total_items"] == 1
+
+        last_modified = response.headers["Last-Modified"]
+        assert client.get(
+            url, headers={"If-Modified-Since": last_modified}
+        ).status_code == 304
+
+    def test_speakers(self, client: TestClient, test_db: Session):
+        response = client.get("/api/v1/speakers/")
+        etag = response.headers["ETag"]
+        assert response.headers["Cache-Control"] == "public, no-cache"
+        assert "Last-Modified" not in response.headers
+        assert client.get(
+            "/api/v1/speakers/", headers={"If-None-Match": etag}
+        ).status_code == 304
+
+        speaker = Speaker(
+            name="Ada",
+            email="ada@example.com",
+            phone="+34 600 000 001",
+            bio="Speaker",
+            company="Analytical",
+        )
+        test_db.add(speaker)
+        test_db.commit()
+        changed = client.get("/api/v1/speakers/", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert client.get(
+            "/api/v1/speakers/",
+            headers={"If-Modified-Since": changed.headers["Last-Modified"]},
+        ).status_code == 304
+
+        test_db.delete(speaker)
+        test_db.commit()
+        assert client.get(
+            "/api/v1/speakers/", headers={"If-None-Match": changed.headers["ETag"]}
+        ).status_code == 200
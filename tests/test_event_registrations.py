@@ -0,0 +1,441 @@
+"""
+Event registration tests.
+
+This module contains tests for registration capacity handling.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.schemas.event_registration_schemas import EventRegistrationUpdate
+from app.db.capacity_reconciliation import (
+    find_capacity_mismatches,
+    fix_capacity_mismatches,
+)
+from app.db.models import Event, EventRegistration, User
+from app.services.event_registration_service import EventRegistrationService
+from tests.conftest import TestingAsyncSessionLocal
+
+
+@pytest.fixture
+def small_event(test_db: Session) -> Event:
+    """Create an upcoming event with room for five participants."""
+    start = datetime.now() + timedelta(days=15)
+    event = Event(
+        title="Small Workshop",
+        description="Limited capacity workshop",
+        location="Room 1",
+        start_date=start,
+        end_date=start + timedelta(hours=4),
+        capacity=5,
+        is_active=True,
+    )
+    test_db.add(event)
+    test_db.commit()
+    test_db.refresh(event)
+    return event
+
+
+def _registered_participants(test_db: Session, event: Event) -> int:
+    test_db.expire_all()
+    return test_db.get(Event, event.id).registered_participants
+
+
+class TestRegistrationCapacityCounter:
+    """Test the denormalized registered participants counter."""
+
+    def test_register_increments_counter(
+        self, client: TestClient, auth_headers: dict, test_db: Session, small_event
+    ):
+        response = client.post(
+            "/api/v1/event-registrations/",
+            json={"event_id": small_event.id, "number_of_participants": 3},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert _registered_participants(test_db, small_event) == 3
+
+    def test_register_over_capacity_is_rejected(
+        self, client: TestClient, auth_headers: dict, test_db: Session, small_event
+    ):
+        small_event.registered_participants = 4
+        test_db.commit()
+
+        response = client.post(
+            "/api/v1/event-registrations/",
+            json={"event_id": small_event.id, "number_of_participants": 2},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert "Disponible: 1" in response.json()["detail"]
+        assert _registered_participants(test_db, small_event) == 4
+        assert test_db.query(EventRegistration).count() == 0
+
+    def test_cancel_releases_counter(
+        self, client: TestClient, auth_headers: dict, test_db: Session, small_event
+    ):
+        client.post(
+            "/api/v1/event-registrations/",
+            json={"event_id": small_event.id, "number_of_participants": 2},
+            headers=auth_headers,
+        )
+        response = client.delete(
+            f"/api/v1/event-registrations/{small_event.id}", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert _registered_participants(test_db, small_event) == 0
+
+    @pytest.mark.asyncio
+    async def test_update_adjusts_counter(
+        self, test_db: Session, small_event: Event, sample_user: User
+    ):
+        registration = EventRegistration(
+            event_id=small_event.id, user_id=sample_user.id, number_of_participants=2
+        )
+        small_event.registered_participants = 2
+        test_db.add(registration)
+        test_db.commit()
+
+        async with TestingAsyncSessionLocal() as session:
+            service = EventRegistrationService(session)
+            await service.update_registration(
+                registration.id,
+                sample_user.id,
+                EventRegistrationUpdate(number_of_participants=5),
+            )
+            assert _registered_participants(test_db, small_event) == 5
+
+            with pytest.raises(ValueError, match="Disponible: 5"):
+                await service.update_registration(
+                    registration.id,
+                    sample_user.id,
+                    EventRegistrationUpdate(number_of_participants=6),
+                )
+
+            await service.update_registration(
+                registration.id,
+                sample_user.id,
+                EventRegistrationUpdate(number_of_participants=1),
+            )
+        assert _registered_participants(test_db, small_event) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cancel_releases_once(
+        self, test_db: Session, small_event: Event, sample_user: User
+    ):
+        registration = EventRegistration(
+            event_id=small_event.id, user_id=sample_user.id, number_of_participants=2
+        )
+        small_event.registered_participants = 3
+        test_db.add(registration)
+        test_db.commit()
+
+        async with TestingAsyncSessionLocal() as first:
+            async with TestingAsyncSessionLocal() as second:
+                late = EventRegistrationService(first)
+                # La cancelación tardía leyó el registro antes de que se borrara
+                stale = await late.event_registration_repository.get_user_is_registered(
+                    sample_user.id, small_event.id
+                )
+                late.event_registration_repository.get_user_is_registered = (
+                    lambda *args: _resolved(stale)
+                )
+
+                await EventRegistrationService(second).cancel_registration(
+                    small_event.id, sample_user.id
+                )
+                with pytest.raises(ValueError, match="Registro no encontrado"):
+                    await late.cancel_registration(small_event.id, sample_user.id)
+
+        assert _registered_participants(test_db, small_event) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_update_uses_current_value(
+        self, test_db: Session, small_event: Event, sample_user: User
+    ):
+        registration = EventRegistration(
+            event_id=small_event.id, user_id=sample_user.id, number_of_participants=2
+        )
+        small_event.registered_participants = 2
+        test_db.add(registration)
+        test_db.commit()
+
+        async with TestingAsyncSessionLocal() as first:
+            async with TestingAsyncSessionLocal() as second:
+                service = EventRegistrationService(first)
+                repository = service.event_registration_repository
+                write = repository.update_participants
+                calls = []
+
+                async def racing_write(registration_id, current, participants):
+                    # Otra petición cambia 2 -> 4 justo antes de la primera escritura
+                    if not calls:
+                        await EventRegistrationService(second).update_registration(
+                            registration_id,
+                            sample_user.id,
+                            EventRegistrationUpdate(number_of_participants=4),
+                        )
+                    calls.append(current)
+                    return await write(registration_id, current, participants)
+
+                repository.update_participants = racing_write
+                result = await service.update_registration(
+                    registration.id,
+                    sample_user.id,
+                    EventRegistrationUpdate(number_of_participants=3),
+                )
+
+        # El primer intento con el valor leído (2) falla y se repite con 4
+        assert calls == [2, 4]
+        assert result.number_of_participants == 3
+        assert _registered_participants(test_db, small_event) == 3
+
+
+async def _resolved(value):
+    return value
+
+
+class TestCapacityReconciliation:
+    """Test verification of counters against the real registrations."""
+
+    def test_detects_and_fixes_drift(
+        self, test_db: Session, small_event: Event, sample_user: User
+    ):
+        test_db.add(
+            EventRegistration(
+                event_id=small_event.id,
+                user_id=sample_user.id,
+                number_of_participants=3,
+            )
+        )
+        test_db.commit()
+
+        mismatches = find_capacity_mismatches(test_db)
+        assert mismatches == [
+            {
+                "event_id": small_event.id,
+                "title": "Small Workshop",
+                "counter": 0,
+                "actual": 3,
+            }
+        ]
+
+        assert fix_capacity_mismatches(test_db) == 1
+        assert find_capacity_mismatches(test_db) == []
+        assert _registered_participants(test_db, small_event) == 3
+
+
+class TestRegistrationRush:
+    """Test registrations under concurrency."""
+
+    def test_duplicate_registration_is_rejected(
+        self, client: TestClient, auth_headers: dict, test_db: Session, small_event
+    ):
+        payload = {"event_id": small_event.id, "number_of_participants": 1}
+        first = client.post(
+            "/api/v1/event-registrations/", json=payload, headers=auth_headers
+        )
+        second = client.post(
+            "/api/v1/event-registrations/", json=payload, headers=auth_headers
+        )
+        assert first.status_code == 200
+        assert second.status_code == 400
+        assert second.json()["detail"] == "Ya estás registrado en este evento"
+        assert _registered_participants(test_db, small_event) == 1
+
+    def test_inactive_event_is_rejected(
+        self, client: TestClient, auth_headers: dict, test_db: Session, small_event
+    ):
+        small_event.is_active = False
+        test_db.commit()
+
+        response = client.post(
+            "/api/v1/event-registrations/",
+            json={"event_id": small_event.id, "number_of_participants": 1},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "El evento no existe o no está activo"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_registrations_never_oversell(
+        self, test_db: Session, small_event: Event, sample_role
+    ):
+        import asyncio
+
+        from app.api.schemas.event_registration_schemas import (
+            EventRegistrationCreate,
+        )
+
+        users = [
+            User(
+                username=f"rush{i}",
+                email=f"rush{i}@example.com",
+                password="hashed_password",
+                first_name="Rush",
+                last_name="User",
+                phone="+34 600 000 000",
+                role_id=sample_role.id,
+                is_active=True,
+            )
+            for i in range(15)
+        ]
+        test_db.add_all(users)
+        test_db.commit()
+
+        async def register(user_id: int) -> bool:
+            async with TestingAsyncSessionLocal() as session:
+                try:
+                    await EventRegistrationService(session).register_user_to_event(
+                        user_id,
+                        EventRegistrationCreate(
+                            event_id=small_event.id, number_of_participants=1
+                        ),
+                    )
+                    return True
+                except ValueError:
+                    return False
+
+        results = await asyncio.gather(*(register(user.id) for user in users))
+
+        assert sum(results) == small_event.capacity
+        assert _registered_participants(test_db, small_event) == small_event.capacity
+        assert test_db.query(EventRegistration).count() == small_event.capacity
+
+
+class TestBatchRegistration:
+    """Test the bulk registration endpoint."""
+
+    @pytest.fixture
+    def users(self, test_db: Session, sample_role) -> list:
+        users = [
+            User(
+                username=f"batch_{i}",
+                first_name="Batch",
+                last_name=str(i),
+                phone="+34 600 000 000",
+                email=f"batch_{i}@example.com",
+                password="not-used",
+                is_active=True,
+                role_id=sample_role.id,
+            )
+            for i in range(4)
+        ]
+        test_db.add_all(users)
+        test_db.commit()
+        return users
+
+    def _post(self, client, headers, items):
+        return client.post(
+            "/api/v1/event-registrations/batch",
+            json={"items": items},
+            headers=headers,
+        )
+
+    def test_per_item_results(
+        self,
+        client: TestClient,
+        organizer_headers: dict,
+        test_db: Session,
+        small_event,
+        users,
+        query_budget,
+    ):
+        test_db.add(
+            EventRegistration(
+                event_id=small_event.id, user_id=users[3].id, number_of_participants=1
+            )
+        )
+        small_event.registered_participants = 1
+        test_db.commit()
+
+        items = [
+            {"user_id": users[0].id, "event_id": small_event.id, "number_of_participants": 2},
+            {"user_id": users[1].id, "event_id": small_event.id, "number_of_participants": 2},
+            # Sin capacidad: sólo queda 0 tras los dos anteriores
+            {"user_id": users[2].id, "event_id": small_event.id},
+            # Ya registrado, duplicado en el lote, usuario y evento inexistentes
+            {"user_id": users[3].id, "event_id": small_event.id},
+            {"user_id": users[0].id, "event_id": small_event.id},
+            {"user_id": 999999, "event_id": small_event.id},
+            {"user_id": users[2].id, "event_id": 999999},
+        ]
+        # Autenticación, bloqueo, usuarios, registros previos, UPDATE e INSERT:
+        # ninguna sentencia se repite por elemento
+        with query_budget(max_queries=8):
+            response = self._post(client, organizer_headers, items)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["created"], data["failed"]) == (2, 5)
+        assert [r["status"] for r in data["results"]] == ["created"] * 2 + ["error"] * 5
+        assert [r["index"] for r in data["results"]] == list(range(7))
+        assert data["results"][0]["registration_id"] is not None
+        assert "capacidad" in data["results"][2]["error"]
+        assert "ya está registrado" in data["results"][3]["error"]
+        assert "ya está registrado" in data["results"][4]["error"]
+        assert data["results"][5]["error"] == "El usuario no existe"
+        assert "no existe" in data["results"][6]["error"]
+
+        assert _registered_participants(test_db, small_event) == 5
+        created = test_db.query(EventRegistration).filter_by(event_id=small_event.id)
+        assert created.count() == 3
+
+    def test_many_events_in_one_batch(
+        self, client: TestClient, organizer_headers: dict, test_db: Session, users
+    ):
+        start = datetime.now() + timedelta(days=30)
+        events = [
+            Event(
+                title=f"Batch Event {i}",
+                location="Bilbao",
+                start_date=start,
+                end_date=start + timedelta(hours=2),
+                capacity=10,
+                is_active=True,
+            )
+            for i in range(3)
+        ]
+        test_db.add_all(events)
+        test_db.commit()
+
+        items = [
+            {"user_id": user.id, "event_id": event.id, "number_of_participants": 2}
+            for event in events
+            for user in users
+        ]
+        data = self._post(client, organizer_headers, items).json()
+
+        assert data["created"] == 12
+        test_db.expire_all()
+        assert [test_db.get(Event, e.id).registered_participants for e in events] == [8] * 3
+
+    def test_nothing_created(
+        self, client: TestClient, organizer_headers: dict, small_event, users
+    ):
+        data = self._post(
+            client,
+            organizer_headers,
+            [{"user_id": users[0].id, "event_id": small_event.id, "number_of_participants": 6}],
+        ).json()
+        assert (data["created"], data["failed"]) == (0, 1)
+
+    def test_requires_organizer(
+        self, client: TestClient, auth_headers: dict, small_event, users
+    ):
+        response = self._post(
+            client,
+            auth_headers,
+            [{"user_id": users[0].id, "event_id": small_event.id}],
+        )
+        assert response.status_code == 403
+
+    def test_batch_size_is_limited(self, client: TestClient, organizer_headers: dict):
+        from app.api.schemas.event_registration_schemas import MAX_BATCH_REGISTRATIONS
+
+        items = [{"user_id": 1, "event_id": 1}] * (MAX_BATCH_REGISTRATIONS + 1)
+        assert self._post(client, organizer_headers, items).status_code == 422
+        assert self._post(client, organizer_headers, []).status_code == 422
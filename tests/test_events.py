@@ -132,3 +132,384 @@ class TestEvents:
         assert "items" in data
         assert "page" in data
         assert "total_items" in data
+
+
+class TestEventUniqueness:
+    """Test the duplicate title and time slot checks on event creation."""
+
+    @pytest.fixture
+    def many_events(self, test_db: Session):
+        """More events than the first page the old check used to scan."""
+        from datetime import datetime, timedelta
+
+        base = datetime(2031, 3, 1, 9, 0)
+        test_db.add_all(
+            Event(
+                title=f"Existing Event {i}",
+                location="Existing Venue",
+                start_date=base + timedelta(days=i),
+                end_date=base + timedelta(days=i, hours=8),
+                capacity=10,
+                is_active=True,
+            )
+            for i in range(150)
+        )
+        test_db.commit()
+
+    def _create(self, client, headers, **overrides):
+        payload = {
+            "title": "Brand New Event",
+            "description": "Uniqueness test",
+            "start_date": "2031-03-01T09:00:00",
+            "end_date": "2031-03-01T17:00:00",
+            "location": "New Venue",
+            "capacity": 10,
+            "is_active": True,
+        }
+        payload.update(overrides)
+        return client.post("/api/v1/events", json=payload, headers=headers)
+
+    def test_duplicate_title_beyond_first_page(
+        self, client: TestClient, organizer_headers: dict, many_events
+    ):
+        response = self._create(
+            client,
+            organizer_headers,
+            title="Existing Event 140",
+            start_date="2033-01-01T09:00:00",
+            end_date="2033-01-01T17:00:00",
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Event with this title already exists"
+
+    def test_same_slot_beyond_first_page(
+        self, client: TestClient, organizer_headers: dict, many_events
+    ):
+        # Existing Event 140 runs 2031-07-19 09:00-17:00; same start time
+        response = self._create(
+            client,
+            organizer_headers,
+            start_date="2031-07-19T09:00:00",
+            end_date="2031-07-19T12:00:00",
+        )
+        assert response.status_code == 400
+        assert (
+            response.json()["detail"]
+            == "Event with the same date and time already exists"
+        )
+
+    def test_same_day_different_times_is_allowed(
+        self, client: TestClient, organizer_headers: dict, many_events
+    ):
+        response = self._create(
+            client,
+            organizer_headers,
+            start_date="2031-07-19T10:00:00",
+            end_date="2031-07-19T12:00:00",
+        )
+        assert response.status_code == 200
+
+
+@pytest.fixture
+def events_with_registrations(test_db: Session, sample_user: User):
+    """Create upcoming events with registrations for capacity tests."""
+    from datetime import datetime, timedelta
+
+    from app.db.models import EventRegistration
+
+    other_user = User(
+        username="capacityuser",
+        email="capacity@example.com",
+        password="hashed_password",
+        first_name="Capacity",
+        last_name="User",
+        phone="+34 600 000 003",
+        role_id=sample_user.role_id,
+        is_active=True,
+    )
+    test_db.add(other_user)
+    test_db.commit()
+
+    start = datetime.now() + timedelta(days=7)
+    events = []
+    for i, participants in enumerate([[3, 2], [5], []]):
+        event = Event(
+            title=f"Capacity Event {i}",
+            description="Capacity test",
+            start_date=start + timedelta(days=i),
+            end_date=start + timedelta(days=i, hours=8),
+            location="Capacity Venue",
+            capacity=20,
+            registered_participants=sum(participants),
+            is_active=True,
+        )
+        test_db.add(event)
+        test_db.commit()
+        for user, count in zip([sample_user, other_user], participants):
+            test_db.add(
+                EventRegistration(
+                    event_id=event.id,
+                    user_id=user.id,
+                    number_of_participants=count,
+                )
+            )
+        test_db.commit()
+        events.append(event)
+    return events
+
+
+class TestEventsWithCapacity:
+    """Test capacity aggregation on event listings."""
+
+    def test_all_events_with_capacity(
+        self, client: TestClient, events_with_registrations, query_budget
+    ):
+        """Registered participants come from a single aggregated query."""
+        # Una consulta para la página y otra para el total
+        with query_budget(max_queries=2):
+            response = client.get("/api/v1/events/with-capacity")
+        assert response.status_code == 200
+        items = {item["title"]: item for item in response.json()["items"]}
+        assert items["Capacity Event 0"]["registered_participants"] == 5
+        assert items["Capacity Event 0"]["available_capacity"] == 15
+        assert items["Capacity Event 1"]["registered_participants"] == 5
+        assert items["Capacity Event 2"]["registered_participants"] == 0
+        assert items["Capacity Event 2"]["available_capacity"] == 20
+
+    def test_upcoming_events_with_capacity(
+        self, client: TestClient, events_with_registrations, query_budget
+    ):
+        """Upcoming listing returns capacity information ordered by date."""
+        with query_budget(max_queries=2):
+            response = client.get("/api/v1/events/upcoming/with-capacity")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_items"] == 3
+        assert [item["registered_participants"] for item in data["items"]] == [
+            5,
+            5,
+            0,
+        ]
+
+
+@pytest.fixture
+def searchable_events(test_db: Session):
+    """Create five events matching 'Summit' and two that do not."""
+    from datetime import datetime, timedelta
+
+    start = datetime(2031, 3, 1, 9, 0)
+    titles = [f"Data Summit {i}" for i in range(5)] + ["Other A", "Other B"]
+    events = [
+        Event(
+            title=title,
+            description="Search totals",
+            location="Zaragoza",
+            start_date=start + timedelta(days=i),
+            end_date=start + timedelta(days=i, hours=6),
+            capacity=30,
+            is_active=True,
+        )
+        for i, title in enumerate(titles)
+    ]
+    test_db.add_all(events)
+    test_db.commit()
+    return events
+
+
+class TestSearchTotals:
+    """Test the totals returned by the event search."""
+
+    def test_exact_total_in_single_query(
+        self, client: TestClient, searchable_events, query_budget
+    ):
+        """The filtered total comes from COUNT(*) OVER () in the page query."""
+        with query_budget(max_queries=1):
+            response = client.get("/api/v1/events/search?title=summit&size=2")
+        data = response.json()
+        assert len(data["items"]) == 2
+        assert data["total_items"] == 5
+        assert data["total_pages"] == 3
+        assert data["has_next"] is True
+        assert data["total_is_estimate"] is False
+
+    def test_last_page_has_no_next(self, client: TestClient, searchable_events):
+        data = client.get("/api/v1/events/search?title=summit&size=2&page=3").json()
+        assert len(data["items"]) == 1
+        assert data["total_items"] == 5
+        assert data["has_next"] is False
+
+    def test_out_of_range_page_keeps_total(
+        self, client: TestClient, searchable_events
+    ):
+        data = client.get("/api/v1/events/search?title=summit&size=2&page=9").json()
+        assert data["items"] == []
+        assert data["total_items"] == 5
+
+    def test_count_none_skips_total(
+        self, client: TestClient, searchable_events, query_budget
+    ):
+        with query_budget(max_queries=1) as profile:
+            response = client.get(
+                "/api/v1/events/search?title=summit&size=2&count=none"
+            )
+        data = response.json()
+        assert data["total_items"] is None
+        assert data["total_pages"] is None
+        assert data["has_next"] is True
+        assert not [s for s in profile.statements if "count(" in s.lower()]
+
+    def test_estimated_falls_back_to_exact_without_planner_stats(
+        self, client: TestClient, searchable_events
+    ):
+        """SQLite has no planner estimates, so the exact total is returned."""
+        data = client.get(
+            "/api/v1/events/search?title=summit&size=2&count=estimated"
+        ).json()
+        assert data["total_items"] == 5
+        assert data["total_is_estimate"] is False
+
+    def test_invalid_count_mode(self, client: TestClient):
+        response = client.get("/api/v1/events/search?count=sometimes")
+        assert response.status_code == 422
+
+
+class TestTextSearch:
+    """Test the free-text event search (FTS5 in SQLite)."""
+
+    @pytest.fixture
+    def text_events(self, test_db: Session):
+        from datetime import datetime, timedelta
+
+        start = datetime(2031, 5, 1, 9, 0)
+        rows = [
+            ("Python Conference", "Barcelona"),
+            ("Conference on Databases", "Python Hall, Madrid"),
+            ("Rust Workshop", "Barcelona"),
+        ]
+        events = [
+            Event(
+                title=title,
+                description="Text search",
+                location=location,
+                start_date=start + timedelta(days=i),
+                end_date=start + timedelta(days=i, hours=5),
+                capacity=40,
+                is_active=True,
+            )
+            for i, (title, location) in enumerate(rows)
+        ]
+        test_db.add_all(events)
+        test_db.commit()
+        return events
+
+    def test_matches_title_and_location_by_relevance(
+        self, client: TestClient, text_events
+    ):
+        data = client.get("/api/v1/events/search?q=python").json()
+        titles = [item["title"] for item in data["items"]]
+        # Coincidencia en el título antes que en la ubicación
+        assert titles == ["Python Conference", "Conference on Databases"]
+        assert data["total_items"] == 2
+
+    def test_every_word_must_match_as_prefix(self, client: TestClient, text_events):
+        data = client.get("/api/v1/events/search?q=barc%20work").json()
+        assert [item["title"] for item in data["items"]] == ["Rust Workshop"]
+
+    def test_search_syntax_is_ignored(self, client: TestClient, text_events):
+        response = client.get('/api/v1/events/search?q="python" (*')
+        assert response.status_code == 200
+        assert response.json()["total_items"] >= 1
+
+    def test_updates_are_indexed(
+        self, client: TestClient, test_db: Session, text_events
+    ):
+        text_events[2].title = "Go Workshop"
+        test_db.commit()
+
+        data = client.get("/api/v1/events/search?q=rust").json()
+        assert data["items"] == []
+        data = client.get("/api/v1/events/search?q=go").json()
+        assert [item["title"] for item in data["items"]] == ["Go Workshop"]
+
+
+class TestSparseFieldsets:
+    """Test the column-projected event listings (?fields=)."""
+
+    def test_parse_event_fields(self):
+        from app.services.validators.event_validators import parse_event_fields
+
+        assert parse_event_fields(None) is None
+        assert parse_event_fields(" ") is None
+        # Orden del esquema, sin duplicados y siempre con id
+        assert parse_event_fields("start_date, title,title") == [
+            "id",
+            "title",
+            "start_date",
+        ]
+        with pytest.raises(ValueError, match="Unknown fields: password"):
+            parse_event_fields("title,password")
+
+    def test_list_returns_only_requested_fields(
+        self, client: TestClient, searchable_events, query_budget
+    ):
+        with query_budget(max_queries=2) as profile:
+            response = client.get("/api/v1/events/?fields=title&size=3")
+        data = response.json()
+        assert response.status_code == 200
+        assert [set(item) for item in data["items"]] == [{"id", "title"}] * 3
+        assert data["total_items"] == 7
+        # Sólo se consultan las columnas pedidas
+        page_query = next(s for s in profile.statements if "limit" in s.lower())
+        assert "description" not in page_query.lower()
+
+    def test_full_list_does_not_load_unlisted_columns(
+        self, client: TestClient, searchable_events, query_budget
+    ):
+        with query_budget(max_queries=2) as profile:
+            response = client.get("/api/v1/events/")
+        item = response.json()["items"][0]
+        assert item["description"] == "Search totals"
+        assert "registered_participants" not in item
+        page_query = next(s for s in profile.statements if "limit" in s.lower())
+        assert "registered_participants" not in page_query.lower()
+
+    def test_cursor_page_with_fields(self, client: TestClient, searchable_events):
+        first = client.get("/api/v1/events/?cursor=&size=4&fields=title").json()
+        assert [set(item) for item in first["items"]] == [{"id", "title"}] * 4
+
+        second = client.get(
+            f"/api/v1/events/?cursor={first['next_cursor']}&size=4&fields=title"
+        ).json()
+        titles = [item["title"] for item in first["items"] + second["items"]]
+        assert len(set(titles)) == 7
+
+    def test_search_with_fields(self, client: TestClient, searchable_events):
+        data = client.get(
+            "/api/v1/events/search?title=summit&fields=location,title"
+        ).json()
+        assert data["total_items"] == 5
+        assert data["items"][0] == {
+            "id": data["items"][0]["id"],
+            "title": data["items"][0]["title"],
+            "location": "Zaragoza",
+        }
+
+    def test_unknown_field(self, client: TestClient):
+        response = client.get("/api/v1/events/?fields=title,password")
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
+        response = client.get("/api/v1/events/search?fields=secret")
+        assert response.status_code == 400
+
+    def test_sparse_items_are_documented(self, client: TestClient, searchable_events):
+        from app.api.schemas.event_schemas import EventSparse
+        from app.api.schemas.pagination_schema import Page
+
+        data = client.get("/api/v1/events/?fields=title&size=2").json()
+        Page[EventSparse].model_validate(data)
+
+        openapi = client.get("/api/v1/openapi.json").json()
+        assert openapi["components"]["schemas"]["EventSparse"]["required"] == ["id"]
+        listing = openapi["paths"]["/api/v1/events/"]["get"]["responses"]["200"]
+        schema = listing["content"]["application/json"]["schema"]
+        assert {"$ref": "#/components/schemas/Page_EventSparse_"} in schema["anyOf"]
@@ -0,0 +1,89 @@
+"""
+Metrics tests.
+
+This module contains tests for the Prometheus metrics endpoint.
+"""
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    EXCEPTIONS,
+    HTTP_LATENCY,
+    HTTP_REQUESTS,
+    Counter,
+    Histogram,
+)
+
+
+class TestMetricTypes:
+    """Test the text exposition of the metric types."""
+
+    def test_counter_render(self):
+        counter = Counter("demo_total", "Demo counter.", ("route",))
+        counter.inc("/a")
+        counter.inc("/a", amount=2)
+        assert counter.render() == [
+            "# HELP demo_total Demo counter.",
+            "# TYPE demo_total counter",
+            'demo_total{route="/a"} 3',
+        ]
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1))
+        for value in (0.05, 0.5, 5):
+            histogram.observe("/a", value=value)
+        lines = histogram.render()
+        assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'demo_seconds_bucket{route="/a",le="1.0"} 2' in lines
+        assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'demo_seconds_count{route="/a"} 3' in lines
+        assert 'demo_seconds_sum{route="/a"} 5.55' in lines
+
+
+class TestMetricsEndpoint:
+    """Test the request metrics collected by the middleware."""
+
+    def test_requests_are_labelled_by_route_template(self, client: TestClient):
+        route = "/api/v1/events/{event_id}"
+        before = HTTP_REQUESTS.value("GET", route, "404")
+
+        client.get("/api/v1/events/12345")
+        client.get("/api/v1/events/67890")
+
+        assert HTTP_REQUESTS.value("GET", route, "404") == before + 2
+        assert HTTP_LATENCY.count("GET", route) >= 2
+
+    def test_db_queries_counted_per_request(self, client: TestClient):
+        route = "/api/v1/events/{event_id}"
+        count_before = DB_QUERIES_PER_REQUEST.count("GET", route)
+        sum_before = DB_QUERIES_PER_REQUEST.sum("GET", route)
+
+        client.get("/api/v1/events/12345")
+
+        assert DB_QUERIES_PER_REQUEST.count("GET", route) == count_before + 1
+        assert DB_QUERIES_PER_REQUEST.sum("GET", route) == sum_before + 1
+
+    def test_unknown_paths_are_grouped(self, client: TestClient):
+        before = HTTP_REQUESTS.value("GET", "unmatched", "404")
+        client.get("/does-not-exist/1")
+        client.get("/does-not-exist/2")
+        assert HTTP_REQUESTS.value("GET", "unmatched", "404") == before + 2
+
+    def test_exceptions_counted_by_handler(self, client: TestClient):
+        before = EXCEPTIONS.value("custom", "NotFoundException")
+        client.get("/api/v1/events/12345")
+        assert EXCEPTIONS.value("custom", "NotFoundException") == before + 1
+
+    def test_metrics_exposition(self, client: TestClient):
+        client.get("/health")
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert "# TYPE http_request_duration_seconds histogram" in body
+        assert 'http_requests_total{method="GET",route="/health",status="200"}' in body
+        assert 'http_requests_in_progress{method="GET"} 0' in body
+        assert 'db_pool_checked_out{engine="api"}' in body
+        # El propio scrape no se instrumenta
+        assert 'route="/metrics"' not in body
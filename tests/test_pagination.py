@@ -0,0 +1,180 @@
+"""
+Cursor pagination tests.
+
+This module contains tests for the opt-in keyset pagination of list endpoints.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.models import Event, EventRegistration, User
+from app.db.models import Event as EventModel
+from app.infrastructure.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+@pytest.fixture
+def many_events(test_db: Session):
+    """Create events, several of them sharing the same start date."""
+    base = datetime(2031, 1, 1, 10, 0)
+    events = [
+        Event(
+            title=f"Paged Event {i}",
+            description="Cursor pagination",
+            location="Valencia",
+            start_date=base + timedelta(days=i // 2),
+            end_date=base + timedelta(days=i // 2, hours=4),
+            capacity=10,
+            is_active=True,
+        )
+        for i in range(7)
+    ]
+    test_db.add_all(events)
+    test_db.commit()
+    return events
+
+
+def walk(client: TestClient, url: str, size: int, headers: dict = None) -> list:
+    """Follow next_cursor until the last page; return every page."""
+    pages = []
+    cursor = ""
+    while cursor is not None:
+        response = client.get(
+            url, params={"size": size, "cursor": cursor}, headers=headers
+        )
+        assert response.status_code == 200, response.json()
+        pages.append(response.json())
+        cursor = pages[-1]["next_cursor"]
+    return pages
+
+
+class TestCursorEncoding:
+    """Test cursor encoding and decoding."""
+
+    def test_roundtrip_keeps_types(self):
+        start = datetime(2031, 1, 1, 10, 30)
+        cursor = encode_cursor([start, 42])
+        assert decode_cursor(cursor, (EventModel.start_date, EventModel.id)) == [
+            start,
+            42,
+        ]
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor([1, 2, 3])])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, (EventModel.start_date, EventModel.id))
+
+
+class TestCursorPagination:
+    """Test cursor pagination of list endpoints."""
+
+    def test_events_walk_all_pages_in_order(self, client: TestClient, many_events):
+        pages = walk(client, "/api/v1/events/", 3)
+
+        assert [len(page["items"]) for page in pages] == [3, 3, 1]
+        items = [item for page in pages for item in page["items"]]
+        keys = [(item["start_date"], item["id"]) for item in items]
+        assert keys == sorted(keys)
+        assert len({item["id"] for item in items}) == len(many_events)
+
+    def test_cursor_mode_seeks_by_key(
+        self, client: TestClient, many_events, query_budget
+    ):
+        first = client.get("/api/v1/events/", params={"size": 3, "cursor": ""}).json()
+        with query_budget(max_queries=1) as profile:
+            client.get(
+                "/api/v1/events/", params={"size": 3, "cursor": first["next_cursor"]}
+            )
+        # La página siguiente se busca por clave, no saltando filas
+        assert [s for s in profile.statements if "(events.start_date, events.id) >" in s]
+
+    def test_cursor_pages_skip_the_count(
+        self, client: TestClient, many_events, query_budget
+    ):
+        first = client.get("/api/v1/events/", params={"size": 3, "cursor": ""}).json()
+        assert first["total_items"] is None
+        assert first["total_pages"] is None
+        assert first["has_next"] is True
+
+        # Sólo la consulta de la página: sin COUNT(*) sobre toda la tabla
+        with query_budget(max_queries=1) as profile:
+            client.get(
+                "/api/v1/events/", params={"size": 3, "cursor": first["next_cursor"]}
+            )
+        assert not [s for s in profile.statements if "count(" in s.lower()]
+
+    def test_cursor_count_is_opt_in(
+        self, client: TestClient, admin_headers: dict, many_events
+    ):
+        page = client.get(
+            "/api/v1/events/", params={"size": 3, "cursor": "", "count": "exact"}
+        ).json()
+        assert page["total_items"] == 7
+        assert page["total_pages"] is None
+
+        estimated = client.get(
+            "/api/v1/events/", params={"size": 3, "cursor": "", "count": "estimated"}
+        ).json()
+        # SQLite no tiene estimaciones del planificador: se cuenta exacto
+        assert (estimated["total_items"], estimated["total_is_estimate"]) == (7, False)
+
+        users = client.get(
+            "/api/v1/users/",
+            params={"cursor": "", "count": "exact"},
+            headers=admin_headers,
+        ).json()
+        assert users["total_items"] == 1
+
+    def test_offset_mode_has_no_cursor(self, client: TestClient, many_events):
+        response = client.get("/api/v1/events/?size=3")
+        assert response.status_code == 200
+        assert response.json()["next_cursor"] is None
+
+    def test_invalid_cursor_is_rejected(self, client: TestClient):
+        response = client.get("/api/v1/events/", params={"cursor": "garbage"})
+        assert response.status_code == 400
+
+    def test_users_cursor(
+        self, client: TestClient, admin_headers: dict, sample_user: User
+    ):
+        pages = walk(client, "/api/v1/users/", 1, headers=admin_headers)
+        ids = [item["id"] for page in pages for item in page["items"]]
+        assert ids == sorted(ids)
+        assert len(ids) == 2
+
+    def test_user_registrations_cursor(
+        self,
+        client: TestClient,
+        test_db: Session,
+        auth_headers: dict,
+        sample_user: User,
+        many_events,
+    ):
+        test_db.add_all(
+            [
+                EventRegistration(
+                    event_id=event.id,
+                    user_id=sample_user.id,
+                    number_of_participants=1,
+                )
+                for event in many_events[:5]
+            ]
+        )
+        test_db.commit()
+
+        pages = walk(
+            client,
+            "/api/v1/event-registrations/user_registrations",
+            2,
+            headers=auth_headers,
+        )
+        ids = [item["id"] for page in pages for item in page["items"]]
+        # Los más recientes primero
+        assert ids == sorted(ids, reverse=True)
+        assert len(ids) == 5
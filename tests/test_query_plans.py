@@ -0,0 +1,200 @@
+"""
+Query plan regression tests.
+
+This module seeds the test database, runs the repository queries that filter
+by foreign keys or sort keys, and checks with ``EXPLAIN QUERY PLAN`` that none
+of them falls back to a full table scan on the large tables.
+"""
+
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, text
+
+from app.db.base import Base
+from app.core.sql_profiler import profile_queries
+from app.db.models import Event, EventRegistration, Role, Session, Speaker, User
+from app.infrastructure.pagination import encode_cursor
+from app.infrastructure.repositories.event_registration_repository import (
+    EventRegistrationRepository,
+)
+from app.infrastructure.repositories.event_repository import EventRepository
+from app.infrastructure.repositories.session_repository import SessionRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+from tests.conftest import TestingAsyncSessionLocal, engine
+
+LARGE_TABLES = {"events", "sessions", "event_registrations", "users"}
+EVENTS = 400
+USERS = 300
+SESSIONS_PER_EVENT = 3
+REGISTRATIONS_PER_USER = 4
+BASE_DATE = datetime(2032, 1, 1, 9, 0)
+
+
+@pytest.fixture(scope="module")
+def seeded_db(db_engine):
+    """Seed the large tables once for the module and collect statistics."""
+    with db_engine.begin() as connection:
+        connection.execute(insert(Role), [{"id": 1, "name": "user"}])
+        connection.execute(
+            insert(Speaker),
+            [{"id": 1, "name": "Speaker", "email": "speaker@example.com"}],
+        )
+        connection.execute(
+            insert(User),
+            [
+                {
+                    "id": i,
+                    "username": f"plan_user_{i}",
+                    "first_name": "Plan",
+                    "last_name": str(i),
+                    "phone": "+34 600 000 000",
+                    "email": f"plan_user_{i}@example.com",
+                    "password": "x",
+                    "is_active": True,
+                    "role_id": 1,
+                }
+                for i in range(1, USERS + 1)
+            ],
+        )
+        connection.execute(
+            insert(Event),
+            [
+                {
+                    "id": i,
+                    "title": f"Plan Event {i}",
+                    "location": "Plan City",
+                    "start_date": BASE_DATE + timedelta(hours=i),
+                    "end_date": BASE_DATE + timedelta(hours=i + 8),
+                    "capacity": 1000,
+                    "registered_participants": 0,
+                    # Una minoría de eventos inactivos, como en producción
+                    "is_active": i % 10 != 0,
+                }
+                for i in range(1, EVENTS + 1)
+            ],
+        )
+        connection.execute(
+            insert(Session),
+            [
+                {
+                    "title": f"Plan Session {event_id}-{n}",
+                    "start_time": BASE_DATE + timedelta(hours=event_id, minutes=n * 60),
+                    "end_time": BASE_DATE
+                    + timedelta(hours=event_id, minutes=n * 60 + 45),
+                    "event_id": event_id,
+                    "speaker_id": 1,
+                    "is_active": True,
+                }
+                for event_id in range(1, EVENTS + 1)
+                for n in range(SESSIONS_PER_EVENT)
+            ],
+        )
+        connection.execute(
+            insert(EventRegistration),
+            [
+                {
+                    "event_id": (user_id * 7 + n * 13) % EVENTS + 1,
+                    "user_id": user_id,
+                    "number_of_participants": 1,
+                }
+                for user_id in range(1, USERS + 1)
+                for n in range(REGISTRATIONS_PER_USER)
+            ],
+        )
+        connection.execute(text("ANALYZE"))
+
+    yield
+
+    with db_engine.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+async def capture_statements(call):
+    """Run ``call(db)`` and return the (statement, parameters) it executed."""
+    with profile_queries(capture_all=True, keep_parameters=True) as profile:
+        async with TestingAsyncSessionLocal() as db:
+            await call(db)
+            await db.rollback()
+    return profile.executed
+
+
+def full_scans(statement: str, parameters) -> list:
+    """Return the plan lines that scan a large table without an index."""
+    with engine.connect() as connection:
+        plan = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).all()
+    scans = []
+    for row in plan:
+        detail = row[-1]
+        match = re.match(r"SCAN (\w+)", detail)
+        if match and match.group(1) in LARGE_TABLES and "INDEX" not in detail:
+            scans.append(detail)
+    return scans
+
+
+CASES = {
+    "upcoming_events": lambda db: EventRepository(db).get_upcoming_events_with_capacity(
+        limit=20
+    ),
+    "events_by_cursor": lambda db: EventRepository(db).get_all_events_by_cursor(
+        cursor=encode_cursor([BASE_DATE + timedelta(hours=200), 200]), limit=20
+    ),
+    "event_with_capacity": lambda db: EventRepository(db).get_event_with_capacity(42),
+    "event_title_exists": lambda db: EventRepository(db).title_exists("Plan Event 42"),
+    "event_slot_exists": lambda db: EventRepository(db).slot_exists(
+        BASE_DATE + timedelta(hours=42), BASE_DATE + timedelta(hours=50)
+    ),
+    "user_registrations": lambda db: EventRegistrationRepository(
+        db
+    ).get_user_registrations(user_id=42, limit=20),
+    "user_registrations_by_cursor": lambda db: EventRegistrationRepository(
+        db
+    ).get_user_registrations_by_cursor(user_id=42, cursor="", limit=20),
+    "user_is_registered": lambda db: EventRegistrationRepository(
+        db
+    ).get_user_is_registered(user_id=42, event_id=42),
+    "reserve_capacity": lambda db: EventRegistrationRepository(db).reserve_capacity(
+        42, 1
+    ),
+    "release_capacity": lambda db: EventRegistrationRepository(db).release_capacity(
+        42, 1
+    ),
+    "sessions_by_event": lambda db: SessionRepository(db).get_sessions_by_event(42),
+    "sessions_count_by_event": lambda db: SessionRepository(
+        db
+    ).get_sessions_count_by_event(42),
+    "schedule_conflicts": lambda db: SessionRepository(db).check_schedule_conflicts(
+        42, BASE_DATE + timedelta(hours=42), BASE_DATE + timedelta(hours=43)
+    ),
+    "user_by_id": lambda db: UserRepository(db).get_user(42),
+    "user_by_username": lambda db: UserRepository(db).get_user_by_username(
+        "plan_user_42"
+    ),
+    "user_by_email": lambda db: UserRepository(db).get_user_by_email(
+        "plan_user_42@example.com"
+    ),
+    "users_by_cursor": lambda db: UserRepository(db).get_all_users_by_cursor(
+        cursor=encode_cursor([150]), limit=20
+    ),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("case", sorted(CASES))
+async def test_repository_query_uses_indexes(seeded_db, case):
+    """Repository queries must not scan large tables sequentially."""
+    statements = await capture_statements(CASES[case])
+    queries = [
+        (statement, parameters)
+        for statement, parameters in statements
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE"))
+    ]
+    assert queries, f"{case} executed no queries"
+
+    for statement, parameters in queries:
+        scans = full_scans(statement, parameters)
+        assert not scans, f"{case} scans {scans} in:\n{statement}"
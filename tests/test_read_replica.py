@@ -0,0 +1,131 @@
+"""
+Read replica routing tests.
+
+A second SQLite file stands in for the replica, so reads served from it can
+be told apart from the primary.
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.db import base
+from app.db.base import Base, get_async_database_url, get_async_read_db
+from app.db.models import Event, Speaker
+from app.main import app
+
+REPLICA_DB_FILE = os.path.join(
+    tempfile.gettempdir(), f"be_events_replica_{os.getpid()}.db"
+)
+REPLICA_DATABASE_URL = f"sqlite:///{REPLICA_DB_FILE}"
+
+
+@pytest.fixture
+def replica(client: TestClient):
+    """Route read-only endpoints to a separate replica database."""
+    replica_engine = create_engine(REPLICA_DATABASE_URL)
+    Base.metadata.create_all(bind=replica_engine)
+    replica_async_engine = create_async_engine(
+        get_async_database_url(REPLICA_DATABASE_URL), poolclass=NullPool
+    )
+    ReplicaSessionLocal = async_sessionmaker(
+        bind=replica_async_engine, expire_on_commit=False, class_=AsyncSession
+    )
+
+    async def override_get_async_read_db():
+        async with ReplicaSessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_async_read_db] = override_get_async_read_db
+    replica_session = sessionmaker(bind=replica_engine)()
+    yield replica_session
+
+    replica_session.close()
+    Base.metadata.drop_all(bind=replica_engine)
+    replica_engine.dispose()
+    os.remove(REPLICA_DB_FILE)
+
+
+def _event(title: str, days: int) -> Event:
+    start = datetime(2031, 5, 1, 9, 0) + timedelta(days=days)
+    return Event(
+        title=title,
+        location="Replica Venue",
+        start_date=start,
+        end_date=start + timedelta(hours=8),
+        capacity=10,
+        is_active=True,
+    )
+
+
+class TestReadReplicaRouting:
+    """Read-only endpoints use the replica, writes stay on the primary."""
+
+    def test_listings_and_detail_read_from_replica(
+        self, client: TestClient, test_db: Session, replica: Session
+    ):
+        test_db.add(_event("Primary Event", 0))
+        test_db.commit()
+        replica_event = _event("Replica Event", 1)
+        replica.add(replica_event)
+        replica.add(
+            Speaker(
+                name="Replica Speaker",
+                email="replica@example.com",
+                phone="+34 600 000 009",
+                bio="Replica",
+                company="Replica Corp",
+            )
+        )
+        replica.commit()
+
+        titles = [e["title"] for e in client.get("/api/v1/events/").json()["items"]]
+        assert titles == ["Replica Event"]
+        search = client.get("/api/v1/events/search?title=event").json()
+        assert [e["title"] for e in search["items"]] == ["Replica Event"]
+        detail = client.get(f"/api/v1/events/{replica_event.id}").json()
+        assert detail["title"] == "Replica Event"
+        speakers = client.get("/api/v1/speakers/").json()
+        assert [s["name"] for s in speakers] == ["Replica Speaker"]
+
+    def test_writes_go_to_primary(
+        self,
+        client: TestClient,
+        test_db: Session,
+        replica: Session,
+        organizer_headers: dict,
+    ):
+        response = client.post(
+            "/api/v1/events",
+            json={
+                "title": "Written Event",
+                "description": "Goes to the primary",
+                "start_date": "2031-06-01T09:00:00",
+                "end_date": "2031-06-01T17:00:00",
+                "location": "Primary Venue",
+                "capacity": 10,
+                "is_active": True,
+            },
+            headers=organizer_headers,
+        )
+        assert response.status_code == 200
+
+        assert test_db.query(Event).filter_by(title="Written Event").count() == 1
+        assert replica.query(Event).count() == 0
+        # El listado se sirve de la réplica, que aún no tiene el evento
+        assert client.get("/api/v1/events/").json()["items"] == []
+
+
+def test_reads_fall_back_to_primary_without_replica():
+    """Without REPLICA_DATABASE_URL reads share the primary session factory."""
+    if base.replica_async_engine is None:
+        assert base.ReadSessionLocal is base.AsyncSessionLocal
+    else:
+        assert base.ReadSessionLocal.kw["bind"] is base.replica_async_engine
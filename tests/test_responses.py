@@ -0,0 +1,110 @@
+"""
+Response serialization tests.
+
+This module contains tests for the fast JSON response path.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.schemas.event_schemas import Event, EventWithCapacity
+from app.api.schemas.pagination_schema import Page
+from app.core.responses import dump_json, model_response
+from app.db.models import Event as EventModel
+
+
+def _event_row(registered: int = 3) -> EventModel:
+    start = datetime(2030, 5, 1, 9)
+    return EventModel(
+        id=7,
+        title="Serialization Event",
+        description=None,
+        location="Madrid",
+        start_date=start,
+        end_date=start + timedelta(hours=8),
+        capacity=50,
+        registered_participants=registered,
+        is_active=True,
+        created_at=start,
+        updated_at=None,
+    )
+
+
+class TestFastSerialization:
+    """Test the single-pass schemas and the model response."""
+
+    def test_event_with_capacity_from_row(self):
+        event = _event_row()
+        expected = EventWithCapacity(
+            **Event.model_validate(event).model_dump(),
+            registered_participants=3,
+            available_capacity=47,
+        )
+        assert EventWithCapacity.from_row(event, 3) == expected
+
+    def test_model_response_matches_model_dump(self):
+        page = Page(
+            items=[EventWithCapacity.from_row(_event_row(), 3)],
+            page=1,
+            size=1,
+            total_items=1,
+            total_pages=1,
+        )
+        response = model_response(page, headers={"X-Test": "1"})
+
+        assert response.media_type == "application/json"
+        assert response.headers["x-test"] == "1"
+        body = json.loads(response.body)
+        assert body == json.loads(page.model_dump_json())
+        # Los campos de la subclase se serializan aunque Page no esté parametrizado
+        assert body["items"][0]["available_capacity"] == 47
+
+    def test_dump_json_plain_data(self):
+        assert json.loads(dump_json({"when": datetime(2030, 1, 1)})) == {
+            "when": "2030-01-01T00:00:00"
+        }
+
+
+class TestListEndpoints:
+    """Test that the list endpoints keep their response schema."""
+
+    def test_events_with_capacity(self, client: TestClient, test_db: Session):
+        event = _event_row(registered=5)
+        event.id = None
+        test_db.add(event)
+        test_db.commit()
+
+        response = client.get("/api/v1/events/with-capacity")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        item = response.json()["items"][0]
+        assert item["registered_participants"] == 5
+        assert item["available_capacity"] == 45
+        assert set(item) == set(EventWithCapacity.model_fields)
+
+    def test_user_registrations(
+        self, client: TestClient, test_db: Session, sample_user, auth_headers
+    ):
+        event = _event_row(registered=0)
+        event.id = None
+        test_db.add(event)
+        test_db.commit()
+        client.post(
+            "/api/v1/event-registrations/",
+            json={"event_id": event.id, "number_of_participants": 2},
+            headers=auth_headers,
+        )
+
+        response = client.get(
+            "/api/v1/event-registrations/user_registrations", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        item = response.json()["items"][0]
+        assert item["title"] == "Serialization Event"
+        assert item["number_of_participants"] == 2
+        assert item["date"] == item["start_date"]
@@ -0,0 +1,83 @@
+"""
+Seed data tests.
+
+This module contains tests for the batched and scaled seeding functions.
+"""
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.security import verify_password
+from app.db.models import Event, EventRegistration, Speaker, User
+from app.db.models import Session as EventSession
+from app.db.seed_data import (
+    BENCHMARK_ORGANIZER,
+    BENCHMARK_PASSWORD,
+    create_scaled_seed_data,
+    create_seed_data,
+    scaled_counts,
+)
+
+
+def _count(db: Session, model) -> int:
+    return db.scalar(select(func.count()).select_from(model))
+
+
+class TestSeedData:
+    """Test the regular development seed."""
+
+    def test_create_seed_data(self, test_db: Session):
+        create_seed_data(test_db)
+
+        assert _count(test_db, User) == 9
+        assert _count(test_db, EventSession) == 11
+        registered = test_db.scalar(select(func.sum(Event.registered_participants)))
+        participants = test_db.scalar(
+            select(func.sum(EventRegistration.number_of_participants))
+        )
+        assert registered == participants
+
+
+class TestScaledSeedData:
+    """Test the synthetic load-test dataset."""
+
+    def test_counts_and_ids(self, test_db: Session, sample_user: User):
+        ids = create_scaled_seed_data(test_db, 500, batch_size=200)
+        counts = scaled_counts(500)
+
+        assert len(ids["users"]) == counts["users"]
+        assert _count(test_db, User) == counts["users"] + 2
+        assert _count(test_db, Speaker) == counts["speakers"]
+        assert _count(test_db, Event) == counts["events"]
+        assert _count(test_db, EventSession) == counts["sessions"]
+        assert _count(test_db, EventRegistration) == counts["registrations"]
+        # Los ids reservados continúan tras los existentes
+        assert min(ids["users"]) > sample_user.id
+
+    def test_counters_match_registrations(self, test_db: Session):
+        ids = create_scaled_seed_data(test_db, 450, batch_size=100)
+
+        totals = dict(
+            test_db.execute(
+                select(EventRegistration.event_id, func.count()).group_by(
+                    EventRegistration.event_id
+                )
+            ).all()
+        )
+        events = test_db.execute(
+            select(Event.id, Event.registered_participants, Event.capacity)
+        ).all()
+        assert len(events) == len(ids["events"])
+        for event_id, registered, capacity in events:
+            assert registered == totals[event_id]
+            assert capacity > registered
+
+    def test_password_hashed_once(self, test_db: Session):
+        create_scaled_seed_data(test_db, 50)
+
+        hashes = set(test_db.scalars(select(User.password)))
+        assert len(hashes) == 1
+        assert verify_password(BENCHMARK_PASSWORD, hashes.pop())
+        assert test_db.scalar(
+            select(User.id).where(User.username == BENCHMARK_ORGANIZER)
+        )
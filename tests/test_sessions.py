@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 
 import pytest
@@ -8,6 +9,8 @@ from app.core.security import get_password_hash
 from app.db.models import Event, Role
 from app.db.models import Session as SessionModel
 from app.db.models import Speaker, User
+from app.infrastructure.repositories.session_repository import SessionRepository
+from tests.conftest import TestingAsyncSessionLocal
 
 
 @pytest.fixture
@@ -452,3 +455,57 @@ class TestEventSessionEndpoints:
         data = response.json()
         assert data["title"] == "Event Session"
         assert data["event_id"] == sample_event.id
+
+
+class TestScheduleConflictBuffer:
+    """Test the SQL conflict check, including the 15-minute buffer."""
+
+    @staticmethod
+    def _conflicts(start_time, end_time, **kwargs):
+        async def run():
+            async with TestingAsyncSessionLocal() as db:
+                conflicts = await SessionRepository(db).check_schedule_conflicts(
+                    kwargs.pop("event_id"), start_time, end_time, **kwargs
+                )
+                return [c.title for c in conflicts]
+
+        return asyncio.run(run())
+
+    def test_buffer_boundaries(
+        self, db_session: Session, sample_session: SessionModel
+    ):
+        """Sessions closer than the buffer conflict, exactly 15 minutes apart do not."""
+        event_id = sample_session.event_id
+        end = sample_session.end_time
+
+        assert self._conflicts(
+            end + timedelta(minutes=10), end + timedelta(hours=1), event_id=event_id
+        ) == ["Introduction to Python"]
+        assert (
+            self._conflicts(
+                end + timedelta(minutes=15), end + timedelta(hours=1), event_id=event_id
+            )
+            == []
+        )
+        start = sample_session.start_time
+        assert self._conflicts(
+            start - timedelta(hours=1), start - timedelta(minutes=5), event_id=event_id
+        ) == ["Introduction to Python"]
+
+    def test_excluded_and_inactive_sessions_do_not_conflict(
+        self, db_session: Session, sample_session: SessionModel
+    ):
+        """The session being updated and inactive sessions are ignored."""
+        start, end = sample_session.start_time, sample_session.end_time
+        event_id = sample_session.event_id
+
+        assert (
+            self._conflicts(
+                start, end, event_id=event_id, exclude_session_id=sample_session.id
+            )
+            == []
+        )
+
+        sample_session.is_active = False
+        db_session.commit()
+        assert self._conflicts(start, end, event_id=event_id) == []
@@ -0,0 +1,170 @@
+"""
+SQL profiler tests.
+
+This module contains tests for the SQL profiler, the N+1 detector and the
+query budgets of the listing endpoints.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.sql_profiler import QueryProfile, SQLProfilerMiddleware
+from app.db.models import Event, EventRegistration, Speaker
+from app.db.models import Session as SessionModel
+from app.db.models import User
+from app.main import app
+
+
+@pytest.fixture
+def busy_events(test_db: Session, sample_user: User):
+    """Several events with sessions and registrations, enough to expose N+1s."""
+    speaker = Speaker(
+        name="Budget Speaker",
+        email="budget@example.com",
+        phone="+34 600 000 010",
+        bio="Budget",
+        company="Budget Corp",
+    )
+    test_db.add(speaker)
+    start = datetime.now() + timedelta(days=10)
+    events = []
+    for i in range(6):
+        event = Event(
+            title=f"Budget Event {i}",
+            location="Budget Venue",
+            start_date=start + timedelta(days=i),
+            end_date=start + timedelta(days=i, hours=8),
+            capacity=50,
+            registered_participants=2,
+            is_active=True,
+        )
+        test_db.add(event)
+        test_db.flush()
+        for n in range(3):
+            test_db.add(
+                SessionModel(
+                    title=f"Budget Session {i}-{n}",
+                    start_time=event.start_date + timedelta(hours=n * 2),
+                    end_time=event.start_date + timedelta(hours=n * 2 + 1),
+                    event_id=event.id,
+                    speaker_id=speaker.id,
+                    is_active=True,
+                )
+            )
+        test_db.add(
+            EventRegistration(
+                event_id=event.id, user_id=sample_user.id, number_of_participants=2
+            )
+        )
+        events.append(event)
+    test_db.commit()
+    return events
+
+
+class TestQueryProfile:
+    """Test the budget checks of a profile."""
+
+    def test_repeated_statements_are_flagged(self):
+        profile = QueryProfile()
+        for _ in range(4):
+            profile.record("SELECT * FROM events\n  WHERE id = ?", 0.001)
+        profile.record("SELECT count(*) FROM events", 0.001)
+
+        assert profile.queries == 5
+        assert profile.repeated(4) == [("SELECT * FROM events WHERE id = ?", 4)]
+        problems = profile.violations(max_queries=10, max_repeats=3)
+        assert problems == [
+            "statement repeated 4 times: SELECT * FROM events WHERE id = ?"
+        ]
+
+    def test_within_budget(self):
+        profile = QueryProfile()
+        profile.record("SELECT 1", 0.001)
+        assert profile.violations(max_queries=1, max_repeats=1) == []
+        assert profile.violations(max_queries=0, max_repeats=1) == [
+            "1 queries (budget 0)"
+        ]
+
+    def test_keep_parameters(self):
+        profile = QueryProfile()
+        profile.record("SELECT 1", 0.001, ())
+        assert profile.executed == []
+
+        profile = QueryProfile(keep_parameters=True)
+        profile.record("SELECT * FROM events WHERE id = ?", 0.001, (42,))
+        assert profile.executed == [("SELECT * FROM events WHERE id = ?", (42,))]
+
+
+class TestSQLProfilerMiddleware:
+    """Test the per-request profiling middleware."""
+
+    def test_headers_and_warning(self, client: TestClient, busy_events, caplog):
+        profiled = TestClient(SQLProfilerMiddleware(app, max_queries=0, max_repeats=3))
+
+        with caplog.at_level(logging.WARNING, logger="app.core.sql_profiler"):
+            response = profiled.get(f"/api/v1/events/{busy_events[0].id}")
+
+        assert response.status_code == 200
+        # Validador (ETag) y carga del evento
+        assert response.headers["x-db-queries"] == "2"
+        assert float(response.headers["x-db-time-ms"]) >= 0
+        assert "SQL budget exceeded on GET /api/v1/events/" in caplog.text
+
+    def test_no_warning_within_budget(self, client: TestClient, busy_events, caplog):
+        profiled = TestClient(SQLProfilerMiddleware(app, max_queries=5, max_repeats=3))
+
+        with caplog.at_level(logging.WARNING, logger="app.core.sql_profiler"):
+            profiled.get("/api/v1/events/")
+
+        assert "SQL budget exceeded" not in caplog.text
+
+
+class TestListingQueryBudgets:
+    """Listing endpoints stay within a fixed number of queries (no N+1)."""
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/v1/events/",
+            "/api/v1/events/with-capacity",
+            "/api/v1/events/upcoming/with-capacity",
+            "/api/v1/events/search?title=budget",
+            "/api/v1/sessions/",
+            "/api/v1/speakers/",
+        ],
+    )
+    def test_public_listings(self, client: TestClient, busy_events, query_budget, path):
+        with query_budget(max_queries=2):
+            response = client.get(path)
+        assert response.status_code == 200
+
+    def test_event_sessions(self, client: TestClient, busy_events, query_budget):
+        event_id = busy_events[0].id
+        # Validador (ETag), página y total
+        with query_budget(max_queries=3):
+            response = client.get(f"/api/v1/events/{event_id}/sessions")
+        assert len(response.json()["items"]) == 3
+
+    def test_user_registrations(
+        self, client: TestClient, busy_events, auth_headers, query_budget
+    ):
+        with query_budget(max_queries=4):
+            response = client.get(
+                "/api/v1/event-registrations/user_registrations",
+                headers=auth_headers,
+            )
+        assert len(response.json()["items"]) == 6
+
+    def test_budget_fixture_catches_n_plus_one(
+        self, client: TestClient, busy_events, query_budget
+    ):
+        """Fetching events one by one repeats the same statement."""
+        event_ids = [event.id for event in busy_events]
+        with pytest.raises(pytest.fail.Exception, match="statement repeated"):
+            with query_budget(max_queries=100, max_repeats=3):
+                for event_id in event_ids:
+                    client.get(f"/api/v1/events/{event_id}")